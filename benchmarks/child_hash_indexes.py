@@ -0,0 +1,76 @@
+"""
+microbenchmark of finding the pattern database hash indexes of a search node's children
+
+compares ranking every child's cubies (CubieCube.multiply then IndexCalculator.calculate_hash_index for each pattern
+database) with looking the children up in the move tables from the parent's hash indexes.
+run from the project directory with: python benchmarks/child_hash_indexes.py
+(the move tables of the default pattern databases are built first, which takes about half a minute)
+"""
+import random
+from timeit import Timer
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPES
+from rubiks_cube_state_recognition.cube_state.CubieCube import MOVE_CUBES, CubieCube
+from rubiks_cube_state_recognition.pattern_database_creator.MoveTable import MoveTable
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import TABLE_INDEX_SPACES
+
+SCRAMBLE_LENGTH = 25
+NUMBER_OF_NODES = 100
+MINIMUM_RUN_TIME = 1  # the minimum time (seconds) that each benchmark is run for
+
+
+def ranked_hash_indexes(cubie_cube: CubieCube) -> list:
+    # the hash index in each pattern database's index space, ranked from the cubies
+    hash_indexes = []
+    for index_calculator, positions, _ in TABLE_INDEX_SPACES.values():
+        cubies, orientations = (cubie_cube.cp, cubie_cube.co) if index_calculator.number_of_cubies == 8 \
+            else (cubie_cube.ep, cubie_cube.eo)
+        hash_indexes.append(index_calculator.calculate_hash_index([cubies[position] for position in positions],
+                                                                  [orientations[position] for position in positions]))
+    return hash_indexes
+
+
+def ranked_children(cubie_cube: CubieCube) -> list:
+    # child hash indexes before the move tables (every child is made and its cubies are ranked)
+    return [ranked_hash_indexes(MOVE_CUBES[move].multiply(cubie_cube)) for move in range(len(TURN_TYPES))]
+
+
+def looked_up_children(move_tables: list, hash_indexes: list) -> list:
+    return [[move_table.get_child_hash_index(hash_index, move)
+             for move_table, hash_index in zip(move_tables, hash_indexes)] for move in range(len(TURN_TYPES))]
+
+
+def nodes_per_second(function) -> float:
+    timer = Timer(function)
+    number, run_time = timer.autorange()
+    while run_time < MINIMUM_RUN_TIME:
+        number *= 2
+        run_time = timer.timeit(number)
+    return number * NUMBER_OF_NODES / run_time
+
+
+def main():
+    random.seed(0)
+    cubie_cubes = []
+    for _ in range(NUMBER_OF_NODES):
+        cubie_cube = CubieCube()
+        for _ in range(SCRAMBLE_LENGTH):
+            cubie_cube = cubie_cube.turn(random.randrange(len(TURN_TYPES)))
+        cubie_cubes.append(cubie_cube)
+    move_tables = [MoveTable(index_space) for index_space in TABLE_INDEX_SPACES.values()]
+    nodes = [(cubie_cube, ranked_hash_indexes(cubie_cube)) for cubie_cube in cubie_cubes]
+    assert all(ranked_children(cubie_cube) == looked_up_children(move_tables, hash_indexes)
+               for cubie_cube, hash_indexes in nodes)
+
+    benchmarks = {
+        'ranked from the cubies (before)': lambda: [ranked_children(cubie_cube) for cubie_cube, _ in nodes],
+        'move table lookups (after)': lambda: [looked_up_children(move_tables, hash_indexes)
+                                               for _, hash_indexes in nodes]}
+    baseline = None
+    for benchmark_name, function in benchmarks.items():
+        rate = nodes_per_second(function)
+        baseline = baseline or rate
+        print(f'{benchmark_name:<40}{rate:>12,.0f} nodes/s {rate / baseline:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
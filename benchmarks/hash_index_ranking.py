@@ -0,0 +1,65 @@
+"""
+microbenchmark of hash index ranking (IndexCalculator.calculate_hash_index)
+
+compares the original bit string lehmer code with the integer bitmask one, on uniformly random permutations sampled
+with IndexCalculator.unrank.
+run from the project directory with: python benchmarks/hash_index_ranking.py
+"""
+import random
+from timeit import Timer
+from rubiks_cube_state_recognition.pattern_database_creator.IndexCalculator import COUNT_ONES
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import (
+    CORNER_CUBIES_INDEX_CALCULATOR, EDGE_CUBIES_INDEX_CALCULATOR)
+
+NUMBER_OF_PERMUTATIONS = 1000
+MINIMUM_RUN_TIME = 1  # the minimum time (seconds) that each benchmark is run for
+
+
+def bit_string_hash_index(index_calculator, cubie_positions_permutation, cubie_orientations_permutation):
+    # ranking before the bitmask (the bit string of the cubies seen is rebuilt for every digit)
+    bit_string = '0' * index_calculator.number_of_cubies
+    lehmer_code = []
+    for digit in cubie_positions_permutation:
+        bit_string = bit_string[:digit] + '1' + bit_string[digit + 1:]
+        lehmer_code.append(digit - COUNT_ONES[int(bit_string, 2) >> (index_calculator.number_of_cubies - digit)])
+    hash_index = sum(lehmer_base * lehmer_digit
+                     for lehmer_base, lehmer_digit in zip(index_calculator.lehmer_bases, lehmer_code))
+    hash_index *= index_calculator.number_of_orientations_ranks
+    for base_power, orientation in zip(index_calculator.orientation_base_powers, cubie_orientations_permutation):
+        hash_index += index_calculator.orientation_bases[base_power] * orientation
+    return hash_index
+
+
+def ranks_per_second(function) -> float:
+    timer = Timer(function)
+    number, run_time = timer.autorange()
+    while run_time < MINIMUM_RUN_TIME:
+        number *= 2
+        run_time = timer.timeit(number)
+    return number * NUMBER_OF_PERMUTATIONS / run_time
+
+
+def main():
+    random.seed(0)
+    for name, index_calculator in (('corner cubies', CORNER_CUBIES_INDEX_CALCULATOR),
+                                   ('edge cubies', EDGE_CUBIES_INDEX_CALCULATOR)):
+        permutations = [index_calculator.unrank(random.randrange(index_calculator.number_of_hash_indexes))
+                        for _ in range(NUMBER_OF_PERMUTATIONS)]
+        assert all(bit_string_hash_index(index_calculator, *permutation) == index_calculator.calculate_hash_index(
+            *permutation) for permutation in permutations)
+
+        benchmarks = {
+            'bit string (before)': lambda: [bit_string_hash_index(index_calculator, *permutation)
+                                            for permutation in permutations],
+            'bitmask (after)': lambda: [index_calculator.calculate_hash_index(*permutation)
+                                        for permutation in permutations]}
+        baseline = None
+        print(name)
+        for benchmark_name, function in benchmarks.items():
+            rate = ranks_per_second(function)
+            baseline = baseline or rate
+            print(f'  {benchmark_name:<38}{rate:>12,.0f} ranks/s {rate / baseline:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+import time budget of the program's entry points
+
+imports each module in a new interpreter (with python -X importtime) and checks that it is within its budget and
+that it does not import the camera or GUI libraries it does not use. the budgets leave room for slower machines, and
+most of each one is numpy (about 50 ms), which the solvers' tables are built with.
+run from the project directory with: python benchmarks/import_time.py
+(exits with status 1 if a module is over its budget or imports a library it should not)
+"""
+import subprocess
+import sys
+
+NUMBER_OF_RUNS = 5  # the fastest of these runs is compared with the budget (the others include disk caching)
+
+# element = (module, import time budget (milliseconds), libraries it must not import)
+ENTRY_POINTS = [
+    ('rubiks_cube_state_recognition.cube_state.CubieCube', 25, ('numpy', 'cv2', 'PIL', 'tkinter')),
+    ('rubiks_cube_state_recognition.solution_finder.OptimalSolver', 150, ('cv2', 'PIL', 'tkinter')),
+    ('rubiks_cube_state_recognition.batch_solve', 200, ('cv2', 'PIL', 'tkinter')),
+    ('rubiks_cube_state_recognition.pattern_database_creator.PatternDatabaseCreator', 200, ('cv2', 'PIL', 'tkinter')),
+    ('rubiks_cube_state_recognition.__main__', 250, ('cv2', 'PIL'))]  # (the GUI, which is made with tkinter)
+
+
+def import_time(module: str) -> tuple:
+    # the time (milliseconds) the module took to import, and the top level packages it imported (None if it could not
+    # be imported)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         f"import sys, {module}; print(' '.join(sorted({{name.split('.')[0] for name in sys.modules}})))"],
+        capture_output=True, text=True)
+    if result.returncode != 0:
+        return None, set()
+    # the last line of -X importtime's output is the module (its cumulative time is in microseconds)
+    cumulative_microseconds = int(result.stderr.strip().splitlines()[-1].split('|')[1])
+    return cumulative_microseconds / 1000, set(result.stdout.split())
+
+
+def main():
+    is_within_budget = True
+    for module, budget, forbidden_libraries in ENTRY_POINTS:
+        times, imported_libraries = zip(*(import_time(module) for _ in range(NUMBER_OF_RUNS)))
+        if None in times:
+            is_within_budget = False
+            print(f'{module:<80} could not be imported')
+            continue
+        fastest_time = min(times)
+        imported_forbidden_libraries = sorted(set(forbidden_libraries) & imported_libraries[0])
+        is_ok = fastest_time <= budget and not imported_forbidden_libraries
+        is_within_budget = is_within_budget and is_ok
+        print(f"{module:<80}{fastest_time:>8.1f} ms (budget {budget} ms) {'ok' if is_ok else 'OVER'}"
+              + (f" imports {', '.join(imported_forbidden_libraries)}" if imported_forbidden_libraries else ''))
+    sys.exit(0 if is_within_budget else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+microbenchmark of search node expansion (generating every child of a node)
+
+compares the original deepcopy-based CubeState children generation with the compact immutable cube states and the
+optimal solver's expansion (the face-pruned moves multiplied onto the CubieCube).
+run from the project directory with: python benchmarks/node_expansion.py
+"""
+import random
+from copy import deepcopy
+from timeit import Timer
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPES, VALID_NEXT_MOVES, FaceletCube
+from rubiks_cube_state_recognition.cube_state.CubieCube import MOVE_CUBES, CubieCube
+
+SCRAMBLE_LENGTH = 25
+MINIMUM_RUN_TIME = 1  # the minimum time (seconds) that each benchmark is run for
+
+
+def deepcopy_expansion(cube_state, turn_types):
+    # children generation before the compact cube states (a full CubeState deepcopy for every child)
+    children = []
+    for turn_type in turn_types:
+        cube_state_copy = deepcopy(cube_state)
+        cube_state_copy.turn_face(turn_type)
+        children.append(cube_state_copy)
+    return children
+
+
+def search_expansion(cubie_cube, last_face):
+    # children generation of the optimal solver's depth first search
+    children = []
+    for move in range(len(TURN_TYPES)):
+        face = move // 3
+        if face == last_face or (face // 2 == last_face // 2 and face < last_face):
+            continue
+        children.append(MOVE_CUBES[move].multiply(cubie_cube))
+    return children
+
+
+def expansions_per_second(function) -> float:
+    timer = Timer(function)
+    number, run_time = timer.autorange()
+    while run_time < MINIMUM_RUN_TIME:
+        number *= 2
+        run_time = timer.timeit(number)
+    return number / run_time
+
+
+def main():
+    random.seed(0)
+    scramble = [random.choice(TURN_TYPES) for _ in range(SCRAMBLE_LENGTH)]
+
+    facelet_cube = FaceletCube()
+    for turn_type in scramble:
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    cube_state = facelet_cube.to_cube_state()
+    cubie_cube = CubieCube.from_facelet_cube(facelet_cube)
+    last_face = TURN_TYPES.index(scramble[-1]) // 3
+
+    turn_types = VALID_NEXT_MOVES[scramble[-1]]  # 12-15 children, as in the solver's search
+    moves = [TURN_TYPES.index(turn_type) for turn_type in turn_types]
+    benchmarks = {
+        'CubeState deepcopy (before)': lambda: deepcopy_expansion(cube_state, turn_types),
+        'FaceletCube turn': lambda: [facelet_cube.turn(move) for move in moves],
+        'CubieCube turn': lambda: [cubie_cube.turn(move) for move in moves],
+        'search expansion (after)': lambda: search_expansion(cubie_cube, last_face)}
+
+    baseline = None
+    print(f'{len(turn_types)} children per expansion')
+    for name, function in benchmarks.items():
+        rate = expansions_per_second(function)
+        baseline = baseline or rate
+        print(f'{name:<40}{rate:>12,.0f} expansions/s {rate / baseline:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
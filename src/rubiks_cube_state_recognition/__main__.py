@@ -1,13 +1,12 @@
 import tkinter as tk
 import logging
-from PIL import Image, ImageTk
-import cv2 as cv
 import threading
 from rubiks_cube_state_recognition.cube_state.CubeState import CubeFace
-from rubiks_cube_state_recognition.cube_capture.CubeStateFinder import CubeStateFinder
 from rubiks_cube_state_recognition.solution_finder.ThistlethwaiteSolver import ThistlethwaiteSolver
+from rubiks_cube_state_recognition.solution_finder.KociembaSolver import KociembaSolver
 
-logging.basicConfig(level=logging.INFO, format="|%(asctime)s|%(name)s|%(levelname)s| %(message)s")
+# (importing this module only defines the GUI: main opens the camera, and cv2 and PIL are imported once the camera
+# feed is shown)
 
 # colours that will be used in the program
 COLOURS = {'light_grey': '#c3c3c3',
@@ -27,8 +26,11 @@ COLOURS = {'light_grey': '#c3c3c3',
 # the pages background colour
 PAGES_BACKGROUND = COLOURS['light_grey']
 CONTAINERS_BACKGROUND = COLOURS['grey3']
-cube_state_finder = CubeStateFinder()
-thistlethwaite_solver = ThistlethwaiteSolver()
+SOLUTION_FOUND_DISPLAY_TIME = 3000  # the time (milliseconds) 'Solution Found' is shown before the solution page opens
+SOLVER_CLASSES = {'Thistlethwaite': ThistlethwaiteSolver, 'Kociemba': KociembaSolver}  # the solvers that can be chosen
+cube_state_finder = None  # the CubeStateFinder of the camera (made by main, once the window exists)
+solvers = {}  # the solver of each solver name (made the first time it solves)
+chosen_solver_name = 'Thistlethwaite'
 solution = []
 
 
@@ -378,7 +380,7 @@ class CapturePage(tk.Frame):
                 borderwidth=5,
                 relief='flat')
 
-        self.capture_loop()
+        self.after(0, self.capture_loop)  # (the camera feed starts with the main loop, once main has opened the camera)
 
     def update_cube_state(self):
         cube_state_finder.update_cube_state()
@@ -398,6 +400,10 @@ class CapturePage(tk.Frame):
         self.frame_height = event.height
 
     def capture_loop(self):
+        # (imported here rather than with this module; after the first frame they are already loaded)
+        import cv2 as cv
+        from PIL import Image, ImageTk
+
         self.update_cube_state()
         if cube_state_finder.cube_state.is_valid():
             if not cube_state_finder.cube_state.is_solved() and self.solve_button['background'] == 'red':
@@ -450,10 +456,12 @@ class CapturePage(tk.Frame):
             global solution
             self.solve_button.configure(text='Finding\nSolution', background=COLOURS['grey3'])
             self.solve_button.update_idletasks()
-            solution = thistlethwaite_solver.solve(cube_state_finder.cube_state)
+            if chosen_solver_name not in solvers:
+                solvers[chosen_solver_name] = SOLVER_CLASSES[chosen_solver_name]()
+            solution = solvers[chosen_solver_name].solve(cube_state_finder.cube_state)
             self.solve_button.configure(text='Solution\nFound', background=COLOURS['grey3'])
             self.solve_button.update_idletasks()
-            self.solve_button.after(thistlethwaite_solver.min_group_search_time*100, lambda: self.controller.show_frame(SolutionPage, self.solve_button))
+            self.solve_button.after(SOLUTION_FOUND_DISPLAY_TIME, lambda: self.controller.show_frame(SolutionPage, self.solve_button))
 
 
 class SolutionPage(tk.Frame):
@@ -584,16 +592,15 @@ class SettingsPage(tk.Frame):
                   command=lambda: cube_state_finder.frame_instance.calibrate_filters(cube_state_finder.video_feed)).grid(
             column=0, row=1, sticky='nsew')
 
-        tk.Label(master=self, text='Minimum group search time (seconds):').grid(column=0, row=2, sticky='sew')
-        self.min_group_search_time = tk.Scale(master=self, orient='horizontal', from_=0, to=600)
-        self.min_group_search_time.set(thistlethwaite_solver.min_group_search_time)
-        self.min_group_search_time.grid(column=0, row=3, sticky='nsew')
-
-        tk.Button(master=self, text='Save\nChanges', command=self.save_changes).grid(column=0, row=4, sticky='ns')
+        tk.Label(master=self, text='Solver:', background=self['background']).grid(column=0, row=2, sticky='sew')
+        self.chosen_solver_name = tk.StringVar(master=self, value=chosen_solver_name)
+        tk.OptionMenu(self, self.chosen_solver_name, *SOLVER_CLASSES, command=self.choose_solver).grid(
+            column=0, row=3, sticky='nsew')
 
-    def save_changes(self):
-        thistlethwaite_solver.min_group_search_time = self.min_group_search_time.get()
-        logging.info(f"min group search time set to {self.min_group_search_time.get()}")
+    def choose_solver(self, solver_name):
+        global chosen_solver_name
+        chosen_solver_name = solver_name
+        logging.info(f"{solver_name} solver chosen")
 
 
 class TutorialPage(tk.Frame):
@@ -635,13 +642,9 @@ class TutorialPage(tk.Frame):
         Settings page:
         On top is the button to calibrate the filters in the video feed that allow the Rubik's cube to be detected by the cameras.
         By calibrating the filters, it become much easier to identify Rubik's cube faces in the camera feed.
-        Below it, is the minimum group search time slider.
-        This is the minimum amount of time that needs to be spent in each group of cube states before moving on.
-        The longer that is spent searching in one group, the higher the chance of finding a shorter solution.
-        However, this is risky: it can make the search much longer or shorter and is dependent on the cube state.
-        The minimum time is initially set to 30 second.
-        After 30 seconds, if a new set of cube states has been found, the new group will be searched instead.
-        You can use the slider to change this time. However, you have to press the save changes button below it to make sure that it takes effect.
+        Below it, you can choose the solver used to find solutions.
+        The Thistlethwaite solver is quick but finds longer solutions. The Kociemba solver finds shorter solutions (about 21 moves).
+        Each solver builds its tables the first time it is used, which takes a few seconds, and saves them so later runs load them.
 
         Calibration of filters:
         Read the tutorial for the settings page to find out what the calibration does.
@@ -655,7 +658,13 @@ class TutorialPage(tk.Frame):
 
 
 def main():
+    global cube_state_finder
+    logging.basicConfig(level=logging.INFO, format="|%(asctime)s|%(name)s|%(levelname)s| %(message)s")
+    # (the cube capture modules import cv2, so they are imported here rather than when this module is imported)
+    from rubiks_cube_state_recognition.cube_capture.CubeStateFinder import CubeStateFinder
+
     app = GuiBase()
+    cube_state_finder = CubeStateFinder()  # opens the camera
     app.mainloop()
     cube_state_finder.video_feed.video_capture.release()
 
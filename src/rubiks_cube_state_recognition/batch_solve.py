@@ -0,0 +1,155 @@
+"""
+headless batch solver: solves every cube state in a file with a pool of worker processes
+
+the input file has one facelet string per line (see FaceletCube.from_string). every line gets one JSON line in the
+output, in the same order, written as soon as the line (and every line before it) is solved.
+run with: python -m rubiks_cube_state_recognition.batch_solve states.txt -o solutions.jsonl
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from rubiks_cube_state_recognition.cube_state.CubieCube import CubieCube
+from rubiks_cube_state_recognition.cube_state.FaceletCube import FaceletCube
+from rubiks_cube_state_recognition.solution_finder.ThistlethwaiteSolver import ThistlethwaiteSolver
+from rubiks_cube_state_recognition.solution_finder.KociembaSolver import KociembaSolver
+
+SOLVER_CLASSES = {'thistlethwaite': ThistlethwaiteSolver, 'kociemba': KociembaSolver}  # the solvers that can be chosen
+CHUNK_SIZE = 16  # the number of cube states sent to a worker at a time
+CHUNKS_PER_WORKER = 4  # the number of chunks queued for each worker (limits the input held in memory)
+PROGRESS_INTERVAL = 1000  # the number of cube states between progress logs
+
+_worker_solver = None  # the solver of the worker process (its tables are loaded once, when the worker starts)
+
+
+def _initialise_worker(solver_name: str):
+    global _worker_solver
+    logging.getLogger().setLevel(logging.WARNING)  # the solvers log every phase of every solve
+    _worker_solver = SOLVER_CLASSES[solver_name]()
+    _worker_solver.load_tables()
+
+
+def _solve_chunk(chunk: list) -> list:
+    results = []
+    for line_number, facelet_string in chunk:
+        result = {'line': line_number, 'state': facelet_string}
+        start_time = time.perf_counter()
+        try:
+            cubie_cube = CubieCube.from_facelet_cube(FaceletCube.from_string(facelet_string))
+            if not cubie_cube.is_solvable():
+                raise ValueError('the cube state cannot be reached by turning the faces')
+            solution = _worker_solver.solve(cubie_cube.to_cube_state())
+            result['solution'] = ' '.join(solution)
+            result['moves'] = len(solution)
+        except (KeyError, ValueError) as error:  # KeyError = a cubie with colours that no cubie has
+            result['error'] = str(error) if isinstance(error, ValueError) else 'the cube state has an invalid cubie'
+        except Exception as error:  # a solver error only fails its own cube state, and the other lines are still solved
+            logging.exception(f"line {line_number}: the solver failed")
+            result['error'] = f'the solver failed ({type(error).__name__}: {error})'
+        result['time'] = round(time.perf_counter() - start_time, 6)
+        results.append(result)
+    return results
+
+
+def _read_chunks(file):
+    # groups the non-empty lines of the file into chunks of (line number, facelet string)
+    chunk = []
+    for line_number, line in enumerate(file, start=1):
+        facelet_string = line.strip()
+        if facelet_string:
+            chunk.append((line_number, facelet_string))
+            if len(chunk) == CHUNK_SIZE:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _write_results(results: list, output_file) -> int:
+    # writes the results as JSON lines and returns the number of errors in them
+    for result in results:
+        output_file.write(json.dumps(result) + '\n')
+    output_file.flush()
+    return sum('error' in result for result in results)
+
+
+def solve_file(input_file, output_file, solver_name: str = 'kociemba', workers: int = None) -> dict:
+    """
+    solves every facelet string of the input file, writing a JSON line per cube state to the output file.
+    returns a summary of the run
+    """
+    if workers is None:
+        workers = os.cpu_count()
+    elif workers < 1:
+        raise ValueError(f'the number of workers must be positive, not {workers}')
+
+    # the solver's tables are built (and saved) once before the workers start, so each worker loads them from their
+    # files instead of building them
+    SOLVER_CLASSES[solver_name]().load_tables()
+    max_queued_chunks = workers * CHUNKS_PER_WORKER
+    start_time = time.perf_counter()
+    states_solved = 0
+    errors = 0
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialise_worker, initargs=(solver_name,)) as executor:
+        queued_chunks = deque()  # element = the future results of a chunk (in the input's order)
+        for chunk in _read_chunks(input_file):
+            queued_chunks.append(executor.submit(_solve_chunk, chunk))
+
+            # writes the solved chunks at the front of the queue (waiting for the front one when the queue is full)
+            while queued_chunks and (queued_chunks[0].done() or len(queued_chunks) >= max_queued_chunks):
+                results = queued_chunks.popleft().result()
+                errors += _write_results(results, output_file)
+                states_solved += len(results)
+                if states_solved % PROGRESS_INTERVAL < len(results):
+                    logging.info(f"{states_solved} cube states solved "
+                                 f"({states_solved / (time.perf_counter() - start_time):.1f} per second)")
+
+        while queued_chunks:
+            results = queued_chunks.popleft().result()
+            errors += _write_results(results, output_file)
+            states_solved += len(results)
+
+    elapsed_time = time.perf_counter() - start_time
+    return {'states': states_solved, 'errors': errors, 'workers': workers, 'solver': solver_name,
+            'seconds': round(elapsed_time, 3), 'states_per_second': round(states_solved / elapsed_time, 3)}
+
+
+def _positive_int(value: str) -> int:
+    # the argparse type of the number of workers
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'{value!r} is not a whole number')
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'{value!r} is not positive')
+    return number
+
+
+def main(arguments: list = None):
+    parser = argparse.ArgumentParser(description='solves every cube state (one facelet string per line) in a file')
+    parser.add_argument('input', help="file of facelet strings ('-' for standard input)")
+    parser.add_argument('-o', '--output', default='-', help="JSON lines file of the solutions ('-' for standard output)")
+    parser.add_argument('-s', '--solver', choices=SOLVER_CLASSES, default='kociemba')
+    parser.add_argument('-w', '--workers', type=_positive_int, default=None,
+                        help='the number of worker processes (default: the number of CPUs)')
+    arguments = parser.parse_args(arguments)
+
+    logging.basicConfig(level=logging.INFO, format="|%(asctime)s|%(name)s|%(levelname)s| %(message)s")
+    input_file = sys.stdin if arguments.input == '-' else open(arguments.input)
+    output_file = sys.stdout if arguments.output == '-' else open(arguments.output, 'w')
+    try:
+        summary = solve_file(input_file, output_file, arguments.solver, arguments.workers)
+    finally:
+        for file in (input_file, output_file):
+            if file not in (sys.stdin, sys.stdout):
+                file.close()
+    logging.info(f"finished: {json.dumps(summary)}")
+
+
+if __name__ == '__main__':
+    main()
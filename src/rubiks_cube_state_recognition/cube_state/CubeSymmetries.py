@@ -0,0 +1,75 @@
+from itertools import permutations, product
+from rubiks_cube_state_recognition.cube_state.CubieCube import (CORNER_FACELETS, EDGE_FACELETS, CORNER_ORIENTED_COLOURS,
+                                                                EDGE_ORIENTED_COLOURS, CORNER_COLOURS_TO_CUBIE,
+                                                                EDGE_COLOURS_TO_CUBIE, CubieCube)
+
+# the direction each face points in (x = R/L, y = U/D, z = F/B), in the order of FACE_NAMES (and colour codes)
+FACE_DIRECTIONS = [(0, 1, 0), (-1, 0, 0), (0, 0, 1), (1, 0, 0), (0, 0, -1), (0, -1, 0)]
+
+# the 48 symmetries of the cube (24 rotations, and each rotation followed by a reflection), as signed permutations of
+# the axes: element = (axes, signs) where the symmetry moves the vector v to (signs[i] * v[axes[i]] for each axis i).
+# the identity is the first symmetry
+SYMMETRIES = [(axes, signs) for axes in permutations(range(3)) for signs in product((1, -1), repeat=3)]
+SYMMETRIES.sort(key=lambda symmetry: symmetry != ((0, 1, 2), (1, 1, 1)))
+
+
+def _transform(direction: tuple, symmetry: tuple) -> tuple:
+    axes, signs = symmetry
+    return tuple(sign * direction[axis] for axis, sign in zip(axes, signs))
+
+
+def _calculate_conjugation_tables(cubie_facelets: list, oriented_colours: list, colours_to_cubie: dict) -> tuple:
+    """
+    the tables that conjugate cube states by each symmetry (the cube is moved by the symmetry and recoloured so its
+    centres are solved again). a symmetry moves a cubie's tile pointing in direction d at the position at vector v to
+    the tile pointing in the moved d at the position at the moved v, and gives it the colour of the face the moved d
+    points at. returns the position each position is moved to, the cubie each cubie is recoloured as, and the
+    orientation of the moved cubie (indexed by [symmetry][position][cubie][orientation])
+    """
+    # the faces of each position's tiles (the colour code of a face is its index in FACE_NAMES)
+    position_faces = [[facelet // 9 for facelet in facelets] for facelets in cubie_facelets]
+    position_vectors = [tuple(map(sum, zip(*(FACE_DIRECTIONS[face] for face in faces)))) for faces in position_faces]
+
+    symmetry_positions, symmetry_cubies, symmetry_orientations = [], [], []
+    for symmetry in SYMMETRIES:
+        face_map = [FACE_DIRECTIONS.index(_transform(direction, symmetry)) for direction in FACE_DIRECTIONS]
+        moved_positions = [position_vectors.index(_transform(vector, symmetry)) for vector in position_vectors]
+        moved_cubies = [None] * len(cubie_facelets)
+        moved_orientations = []
+        for position, faces in enumerate(position_faces):
+            moved_faces = position_faces[moved_positions[position]]
+            # element = the tile of the position that is moved to each tile of the moved position
+            tiles = [[face_map[face] for face in faces].index(moved_face) for moved_face in moved_faces]
+            orientations = []
+            for cubie, cubie_oriented_colours in enumerate(oriented_colours):
+                orientations.append([])
+                for colours in cubie_oriented_colours:
+                    moved_cubie, moved_orientation = colours_to_cubie[tuple(face_map[colours[tile]] for tile in tiles)]
+                    moved_cubies[cubie] = moved_cubie  # (the same for every position and orientation)
+                    orientations[cubie].append(moved_orientation)
+            moved_orientations.append(orientations)
+
+        symmetry_positions.append(moved_positions)
+        symmetry_cubies.append(moved_cubies)
+        symmetry_orientations.append(moved_orientations)
+    return symmetry_positions, symmetry_cubies, symmetry_orientations
+
+
+CORNER_SYMMETRY_POSITIONS, CORNER_SYMMETRY_CUBIES, CORNER_SYMMETRY_ORIENTATIONS = _calculate_conjugation_tables(
+    CORNER_FACELETS, CORNER_ORIENTED_COLOURS, CORNER_COLOURS_TO_CUBIE)
+EDGE_SYMMETRY_POSITIONS, EDGE_SYMMETRY_CUBIES, EDGE_SYMMETRY_ORIENTATIONS = _calculate_conjugation_tables(
+    EDGE_FACELETS, EDGE_ORIENTED_COLOURS, EDGE_COLOURS_TO_CUBIE)
+
+
+def conjugate(cubie_cube: CubieCube, symmetry: int) -> CubieCube:
+    # the cube state moved by the symmetry (which is the same number of moves from the solved cube state)
+    cp, co, ep, eo = [None] * 8, [None] * 8, [None] * 12, [None] * 12
+    for position, (cubie, orientation) in enumerate(zip(cubie_cube.cp, cubie_cube.co)):
+        moved_position = CORNER_SYMMETRY_POSITIONS[symmetry][position]
+        cp[moved_position] = CORNER_SYMMETRY_CUBIES[symmetry][cubie]
+        co[moved_position] = CORNER_SYMMETRY_ORIENTATIONS[symmetry][position][cubie][orientation]
+    for position, (cubie, orientation) in enumerate(zip(cubie_cube.ep, cubie_cube.eo)):
+        moved_position = EDGE_SYMMETRY_POSITIONS[symmetry][position]
+        ep[moved_position] = EDGE_SYMMETRY_CUBIES[symmetry][cubie]
+        eo[moved_position] = EDGE_SYMMETRY_ORIENTATIONS[symmetry][position][cubie][orientation]
+    return CubieCube(tuple(cp), tuple(co), tuple(ep), tuple(eo))
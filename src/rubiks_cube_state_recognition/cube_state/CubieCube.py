@@ -0,0 +1,155 @@
+from rubiks_cube_state_recognition.cube_state.CubeState import CubeState
+from rubiks_cube_state_recognition.cube_state.CubiesState import CORNER_COLOURS_KEY_TO_CUBIE, EDGE_COLOURS_KEY_TO_CUBIE
+from rubiks_cube_state_recognition.cube_state.FaceletCube import (FACE_NAMES, TILE_NAMES, SOLVED_FACELETS, TURN_TYPES,
+                                                                  TURN_TYPE_TO_MOVE, FaceletCube)
+
+
+def _facelet_index(face_name: str, tile_name: str) -> int:
+    # the index of the tile in a FaceletCube's facelet array
+    return FACE_NAMES.index(face_name) * 9 + TILE_NAMES.index(tile_name)
+
+
+# the facelet indexes of every corner cubie position (same order and tile order as CornerCubiesState)
+CORNER_FACELETS = [tuple(_facelet_index(*tile) for tile in corner_tiles) for corner_tiles in [
+    (('b_face', 'tr'), ('w_face', 'tr'), ('o_face', 'tl')),  # bow corner cubie position
+    (('b_face', 'br'), ('o_face', 'bl'), ('y_face', 'br')),  # boy corner cubie position
+    (('b_face', 'tl'), ('r_face', 'tr'), ('w_face', 'br')),  # brw corner cubie position
+    (('b_face', 'bl'), ('y_face', 'tr'), ('r_face', 'br')),  # bry corner cubie position
+    (('g_face', 'tl'), ('o_face', 'tr'), ('w_face', 'tl')),  # gow corner cubie position
+    (('g_face', 'bl'), ('y_face', 'bl'), ('o_face', 'br')),  # goy corner cubie position
+    (('g_face', 'tr'), ('w_face', 'bl'), ('r_face', 'tl')),  # grw corner cubie position
+    (('g_face', 'br'), ('r_face', 'bl'), ('y_face', 'tl'))]]  # gry corner cubie position
+
+# the facelet indexes of every edge cubie position (same order and tile order as EdgeCubiesState)
+EDGE_FACELETS = [tuple(_facelet_index(*tile) for tile in edge_tiles) for edge_tiles in [
+    (('b_face', 'mr'), ('o_face', 'ml')),  # bo edge cubie position
+    (('b_face', 'ml'), ('r_face', 'mr')),  # br edge cubie position
+    (('b_face', 'tm'), ('w_face', 'mr')),  # bw edge cubie position
+    (('b_face', 'bm'), ('y_face', 'mr')),  # by edge cubie position
+    (('g_face', 'ml'), ('o_face', 'mr')),  # go edge cubie position
+    (('g_face', 'mr'), ('r_face', 'ml')),  # gr edge cubie position
+    (('g_face', 'tm'), ('w_face', 'ml')),  # gw edge cubie position
+    (('g_face', 'bm'), ('y_face', 'ml')),  # gy edge cubie position
+    (('o_face', 'tm'), ('w_face', 'tm')),  # ow edge cubie position
+    (('o_face', 'bm'), ('y_face', 'bm')),  # oy edge cubie position
+    (('r_face', 'tm'), ('w_face', 'bm')),  # rw edge cubie position
+    (('r_face', 'bm'), ('y_face', 'tm'))]]  # ry edge cubie position
+
+# element = colour codes of the cubie when it is in its own position (read in the position's tile order)
+CORNER_CUBIE_COLOURS = [tuple(SOLVED_FACELETS[facelet] for facelet in facelets) for facelets in CORNER_FACELETS]
+EDGE_CUBIE_COLOURS = [tuple(SOLVED_FACELETS[facelet] for facelet in facelets) for facelets in EDGE_FACELETS]
+
+# element = colour codes read at a corner position, indexed by [cubie][orientation]
+# (an orientation of n rotates the cubie colours n places to the left, as in CORNER_CUBIE_STATE_TO_ORIENTATION_INDEX)
+CORNER_ORIENTED_COLOURS = [[colours[orientation:] + colours[:orientation] for orientation in range(3)]
+                           for colours in CORNER_CUBIE_COLOURS]
+EDGE_ORIENTED_COLOURS = [[colours, colours[::-1]] for colours in EDGE_CUBIE_COLOURS]
+
+# maps the colour codes read at a corner/edge position to the (cubie, orientation) in that position
+CORNER_COLOURS_TO_CUBIE = {colours: (cubie, orientation)
+                           for cubie, oriented_colours in enumerate(CORNER_ORIENTED_COLOURS)
+                           for orientation, colours in enumerate(oriented_colours)}
+EDGE_COLOURS_TO_CUBIE = {colours: (cubie, orientation)
+                         for cubie, oriented_colours in enumerate(EDGE_ORIENTED_COLOURS)
+                         for orientation, colours in enumerate(oriented_colours)}
+
+SOLVED_CORNER_PERMUTATION = tuple(range(8))
+SOLVED_CORNER_ORIENTATION = (0,) * 8
+SOLVED_EDGE_PERMUTATION = tuple(range(12))
+SOLVED_EDGE_ORIENTATION = (0,) * 12
+
+
+def _parity(permutation: tuple) -> int:
+    # 0 if the permutation is made of an even number of swaps, otherwise 1
+    return sum(1 for index, element in enumerate(permutation) for earlier in permutation[:index] if earlier > element) % 2
+
+
+class CubieCube:
+    """
+    cubie-level state of the whole Rubik's cube: which cubie is in each position and its orientation there.
+    cp/ep hold cubie indexes and co/eo hold orientation indexes, using the same numbering as CubiesState
+    """
+    __slots__ = ('cp', 'co', 'ep', 'eo')
+
+    def __init__(self, cp: tuple = SOLVED_CORNER_PERMUTATION, co: tuple = SOLVED_CORNER_ORIENTATION,
+                 ep: tuple = SOLVED_EDGE_PERMUTATION, eo: tuple = SOLVED_EDGE_ORIENTATION):
+        self.cp = cp  # corner cubie in each corner position
+        self.co = co  # orientation (0-2) of the corner cubie in each corner position
+        self.ep = ep  # edge cubie in each edge position
+        self.eo = eo  # orientation (0-1) of the edge cubie in each edge position
+
+    def __eq__(self, other):
+        return (isinstance(other, CubieCube) and self.cp == other.cp and self.co == other.co
+                and self.ep == other.ep and self.eo == other.eo)
+
+    def __hash__(self):
+        return hash((self.cp, self.co, self.ep, self.eo))
+
+    @classmethod
+    def from_facelet_cube(cls, facelet_cube: FaceletCube) -> "CubieCube":
+        # the colour codes of each position's tiles make a small integer key (base 6) of the (cubie, orientation)
+        facelets = facelet_cube.facelets
+        corner_cubies = [CORNER_COLOURS_KEY_TO_CUBIE[(facelets[facelet_1] * 6 + facelets[facelet_2]) * 6
+                                                     + facelets[facelet_3]]
+                         for facelet_1, facelet_2, facelet_3 in CORNER_FACELETS]
+        edge_cubies = [EDGE_COLOURS_KEY_TO_CUBIE[facelets[facelet_1] * 6 + facelets[facelet_2]]
+                       for facelet_1, facelet_2 in EDGE_FACELETS]
+        if None in corner_cubies or None in edge_cubies:  # a position's tiles have colours that no cubie has
+            raise KeyError('a cubie has colours that no cubie has')
+        return cls(tuple(cubie for cubie, _ in corner_cubies), tuple(orientation for _, orientation in corner_cubies),
+                   tuple(cubie for cubie, _ in edge_cubies), tuple(orientation for _, orientation in edge_cubies))
+
+    @classmethod
+    def from_cube_state(cls, cube_state: CubeState) -> "CubieCube":
+        return cls.from_facelet_cube(FaceletCube.from_cube_state(cube_state))
+
+    def to_facelet_cube(self) -> FaceletCube:
+        facelets = bytearray(SOLVED_FACELETS)  # centre tiles never move
+        for corner_facelets, cubie, orientation in zip(CORNER_FACELETS, self.cp, self.co):
+            for facelet, colour in zip(corner_facelets, CORNER_ORIENTED_COLOURS[cubie][orientation]):
+                facelets[facelet] = colour
+        for edge_facelets, cubie, orientation in zip(EDGE_FACELETS, self.ep, self.eo):
+            for facelet, colour in zip(edge_facelets, EDGE_ORIENTED_COLOURS[cubie][orientation]):
+                facelets[facelet] = colour
+        return FaceletCube(bytes(facelets))
+
+    def to_cube_state(self) -> CubeState:
+        return self.to_facelet_cube().to_cube_state()
+
+    def multiply(self, other: "CubieCube") -> "CubieCube":
+        # the cube state reached by applying the permutation of 'other' to this cube state
+        cp, co, ep, eo = self.cp, self.co, self.ep, self.eo
+        return CubieCube(tuple([cp[position] for position in other.cp]),
+                         tuple([(co[position] + orientation) % 3 for position, orientation in zip(other.cp, other.co)]),
+                         tuple([ep[position] for position in other.ep]),
+                         tuple([eo[position] ^ orientation for position, orientation in zip(other.ep, other.eo)]))
+
+    def turn(self, move: int) -> "CubieCube":
+        return self.multiply(MOVE_CUBES[move])
+
+    def turn_face(self, turn_type: str) -> "CubieCube":
+        return self.multiply(MOVE_CUBES[TURN_TYPE_TO_MOVE[turn_type]])
+
+    def is_solved(self):
+        return (self.cp == SOLVED_CORNER_PERMUTATION and self.co == SOLVED_CORNER_ORIENTATION
+                and self.ep == SOLVED_EDGE_PERMUTATION and self.eo == SOLVED_EDGE_ORIENTATION)
+
+    def is_solvable(self):
+        # a cube state made from facelets is only reachable by turning if every cubie appears once, the corner
+        # orientations add up to a multiple of 3, the edge orientations add up to a multiple of 2 and the corner and
+        # edge permutations have the same parity
+        if sorted(self.cp) != list(SOLVED_CORNER_PERMUTATION) or sorted(self.ep) != list(SOLVED_EDGE_PERMUTATION):
+            return False
+        return sum(self.co) % 3 == 0 and sum(self.eo) % 2 == 0 and _parity(self.cp) == _parity(self.ep)
+
+    def get_corner_permutations(self):
+        # same permutations as CornerCubiesState.get_permutations (the last corner cubie is implied by the others)
+        return list(self.cp[:7]), list(self.co[:7])
+
+    def get_edge_permutations(self):
+        # same permutations as EdgeCubiesState.get_permutations (the 7th edge cubie is in both)
+        return list(self.ep[:7]), list(self.eo[:7]), list(self.ep[6:]), list(self.eo[6:])
+
+
+# element = the cubie-level permutation of each move (the solved cube state turned by that move)
+MOVE_CUBES = [CubieCube.from_facelet_cube(FaceletCube().turn(move)) for move in range(len(TURN_TYPES))]
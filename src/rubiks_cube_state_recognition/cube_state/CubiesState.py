@@ -116,6 +116,35 @@ EDGE_CUBIE_STATE_TO_ORIENTATION_INDEX = {  # bo edge cubie orientation indexes
     ('r', 'y'): 0,
     ('y', 'r'): 1}
 
+# the colour code of each colour (the same codes as FaceletCube's facelet array: the index of the face with that
+# centre colour)
+COLOUR_CODES = {'w': 0, 'g': 1, 'r': 2, 'b': 3, 'o': 4, 'y': 5}
+
+
+def _calculate_colours_key(colour_codes) -> int:
+    # the small integer of the colour codes of a cubie's tiles (base 6 digits, the first tile's most significant)
+    colours_key = 0
+    for colour_code in colour_codes:
+        colours_key = colours_key * 6 + colour_code
+    return colours_key
+
+
+def _build_colours_key_table(cubie_state_to_index: dict, cubie_state_to_orientation_index: dict,
+                             number_of_tiles: int) -> list:
+    # element = (cubie index, orientation index) of the cubie whose tiles have the colours key at that index (None if
+    # no cubie has those colours, which the lookups raise as a KeyError), so no cubie names need to be sorted, joined
+    # or looked up
+    colours_key_table = [None] * 6 ** number_of_tiles
+    for cubie_state, orientation_index in cubie_state_to_orientation_index.items():
+        colours_key = _calculate_colours_key(COLOUR_CODES[colour] for colour in cubie_state)
+        colours_key_table[colours_key] = (cubie_state_to_index[tuple(sorted(cubie_state))], orientation_index)
+    return colours_key_table
+
+
+CORNER_COLOURS_KEY_TO_CUBIE = _build_colours_key_table(CORNER_CUBIE_STATE_TO_INDEX,
+                                                       CORNER_CUBIE_STATE_TO_ORIENTATION_INDEX, 3)
+EDGE_COLOURS_KEY_TO_CUBIE = _build_colours_key_table(EDGE_CUBIE_STATE_TO_INDEX, EDGE_CUBIE_STATE_TO_ORIENTATION_INDEX, 2)
+
 
 class __CubiesState:
     def __init__(self, valid_ordered_cubie_names: list):
@@ -176,20 +205,27 @@ class CornerCubiesState(__CubiesState):
                     cube_state.r_face.bl,
                     cube_state.y_face.tl)  # green-red-yellow corner cubie state
 
-    def get_permutations(self):  # corner cubies state as numbers
-        self.sort_cubie_state_names()  # sorts the cubie state names (so it can )
-        cubie_positions_permutation = []  # permutation of the positions of the cubies
-        cubie_orientations_permutation = []  # permutation of the orientations of the cubies
-        for cubie_state, cubie_name in zip(self.ordered_cubie_state_names[:-1],
-                                           self.valid_ordered_cubie_names[:-1]):  # ignores last elements
-            # finds the index of the cubie at the cubie_name position and adds it to the appropriate permutation
-            cubie_positions_permutation.append(CORNER_CUBIE_STATE_TO_INDEX[tuple(cubie_state)])
+    def get_cubies(self):
+        # the cubie index and orientation index in every corner cubie position (in the order of
+        # valid_ordered_cubie_names), from the colours key of each position's tiles
+        cubie_positions_permutation = []
+        cubie_orientations_permutation = []
+        for colour_1, colour_2, colour_3 in (self.bow, self.boy, self.brw, self.bry,
+                                             self.gow, self.goy, self.grw, self.gry):
+            cubie = CORNER_COLOURS_KEY_TO_CUBIE[
+                (COLOUR_CODES[colour_1] * 6 + COLOUR_CODES[colour_2]) * 6 + COLOUR_CODES[colour_3]]
+            if cubie is None:  # no corner cubie has these colours (in this order)
+                raise KeyError((colour_1, colour_2, colour_3))
+            cubie_index, orientation_index = cubie
+            cubie_positions_permutation.append(cubie_index)
+            cubie_orientations_permutation.append(orientation_index)
+        return cubie_positions_permutation, cubie_orientations_permutation
 
-            # finds the orientation index of the cubie at the cubie_name position and adds it to the appropriate permutation
-            cubie_orientations_permutation.append(
-                CORNER_CUBIE_STATE_TO_ORIENTATION_INDEX[self.__getattribute__(cubie_name)])
+    def get_permutations(self):  # corner cubies state as numbers
+        cubie_positions_permutation, cubie_orientations_permutation = self.get_cubies()
 
-        return cubie_positions_permutation, cubie_orientations_permutation  # returns the permutations
+        # ignores the last corner cubie (it is implied by the others)
+        return cubie_positions_permutation[:-1], cubie_orientations_permutation[:-1]  # returns the permutations
 
 
 class EdgeCubiesState(__CubiesState):
@@ -212,48 +248,27 @@ class EdgeCubiesState(__CubiesState):
         self.rw = (cube_state.r_face.tm, cube_state.w_face.bm)  # red-white edge cubie state
         self.ry = (cube_state.r_face.bm, cube_state.y_face.tm)  # red-yellow edge cubie state
 
+    def get_cubies(self):
+        # the cubie index and orientation index in every edge cubie position (in the order of
+        # valid_ordered_cubie_names), from the colours key of each position's tiles
+        cubie_positions_permutation = []
+        cubie_orientations_permutation = []
+        for colour_1, colour_2 in (self.bo, self.br, self.bw, self.by, self.go, self.gr,
+                                   self.gw, self.gy, self.ow, self.oy, self.rw, self.ry):
+            cubie = EDGE_COLOURS_KEY_TO_CUBIE[COLOUR_CODES[colour_1] * 6 + COLOUR_CODES[colour_2]]
+            if cubie is None:  # no edge cubie has these colours (in this order)
+                raise KeyError((colour_1, colour_2))
+            cubie_index, orientation_index = cubie
+            cubie_positions_permutation.append(cubie_index)
+            cubie_orientations_permutation.append(orientation_index)
+        return cubie_positions_permutation, cubie_orientations_permutation
+
     def get_permutations(self):  # edge cubies state as numbers
-        self.sort_cubie_state_names()  # uses the sortCubieStateNames method to find 'ordered_cubie_state_names'
+        cubie_positions_permutation, cubie_orientations_permutation = self.get_cubies()
 
-        # permutation of the positions of the cubies (split in 2 for each of the edge pattern databases)
-        cubie_positions_permutation_1 = []
-        cubie_positions_permutation_2 = []
-
-        # permutation of the orientations of the cubies (split in 2 for each of the edge pattern databases)
-        cubie_orientations_permutation_1 = []
-        cubie_orientations_permutation_2 = []
-
-        # 1st to 6th edge cubies: add to first permutation
-        for cubie_state, cubie_name in zip(self.ordered_cubie_state_names[0:6], self.valid_ordered_cubie_names[0:6]):
-            # finds the index of the cubie at the cubie_name position and adds it to the appropriate permutation
-            cubie_positions_permutation_1.append(EDGE_CUBIE_STATE_TO_INDEX[tuple(cubie_state)])
-
-            # finds the orientation index of the cubie at the cubie_name position and adds it to the appropriate permutation
-            cubie_orientations_permutation_1.append(
-                EDGE_CUBIE_STATE_TO_ORIENTATION_INDEX[self.__getattribute__(cubie_name)])
-
-        # 7th edge cubie: add to both permutations
-        cubie_state = self.ordered_cubie_state_names[6]
-        cubie_name = self.valid_ordered_cubie_names[6]
-
-        # finds the index of the cubie at the cubie_name position and adds it to the appropriate permutations
-        position_index = EDGE_CUBIE_STATE_TO_INDEX[tuple(cubie_state)]
-        cubie_positions_permutation_1.append(position_index)
-        cubie_positions_permutation_2.append(position_index)
-
-        # finds the orientation index of the cubie at the cubie_name position and adds it to the appropriate permutations
-        orientation_index = EDGE_CUBIE_STATE_TO_ORIENTATION_INDEX[self.__getattribute__(cubie_name)]
-        cubie_orientations_permutation_1.append(orientation_index)
-        cubie_orientations_permutation_2.append(orientation_index)
-
-        # 8th to 12th edge cubies: add to second permutation
-        for cubie_state, cubie_name in zip(self.ordered_cubie_state_names[7:], self.valid_ordered_cubie_names[7:]):
-            cubie_positions_permutation_2.append(EDGE_CUBIE_STATE_TO_INDEX[tuple(cubie_state)])
-            cubie_orientations_permutation_2.append(
-                EDGE_CUBIE_STATE_TO_ORIENTATION_INDEX[self.__getattribute__(cubie_name)])
-
-        return (cubie_positions_permutation_1, cubie_orientations_permutation_1, cubie_positions_permutation_2,
-                cubie_orientations_permutation_2)  # returns the permutations
+        # split in 2 for each of the edge pattern databases (the 7th edge cubie is in both)
+        return (cubie_positions_permutation[:7], cubie_orientations_permutation[:7], cubie_positions_permutation[6:],
+                cubie_orientations_permutation[6:])  # returns the permutations
 
     def is_correctly_oriented(self):
         # checks if F/B layers are oriented
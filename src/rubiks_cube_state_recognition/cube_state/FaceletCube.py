@@ -0,0 +1,124 @@
+from operator import itemgetter
+from rubiks_cube_state_recognition.cube_state.CubeState import CubeFace, CubeState
+
+# the cube face attribute names in the order they are stored in the facelet array (U, L, F, R, B, D)
+FACE_NAMES = ['w_face', 'g_face', 'r_face', 'b_face', 'o_face', 'y_face']
+
+# the names of a cube face's tiles in the order they are stored in the facelet array
+TILE_NAMES = ['tl', 'tm', 'tr',
+              'ml', 'c', 'mr',
+              'bl', 'bm', 'br']
+
+# element = colour name of the colour code at that index (the colour of the centre tile of FACE_NAMES[index])
+COLOURS = ['w', 'g', 'r', 'b', 'o', 'y']
+COLOUR_TO_CODE = {colour: code for code, colour in enumerate(COLOURS)}
+
+# the 18 turn types (the index of a turn type is the move number used by the compact cube states)
+TURN_TYPES = ['U', "U'", 'U2', 'D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2']
+TURN_TYPE_TO_MOVE = {turn_type: move for move, turn_type in enumerate(TURN_TYPES)}
+
+# element = the move that undoes the move at that index (a half turn undoes itself)
+INVERSE_MOVES = [TURN_TYPE_TO_MOVE[turn_type[0] if turn_type.endswith("'") else
+                                   turn_type if turn_type.endswith('2') else turn_type + "'"]
+                 for turn_type in TURN_TYPES]
+
+# the possible turning moves that can be made after the turn type specified by the key
+VALID_NEXT_MOVES = {
+    None: ['U', "U'", 'U2', 'D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    'U': ['D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    "U'": ['D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    'U2': ['D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    'D': ['F', "F'", 'F2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    "D'": ['F', "F'", 'F2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    'D2': ['F', "F'", 'F2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    'F': ['U', "U'", 'U2', 'D', "D'", 'D2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    "F'": ['U', "U'", 'U2', 'D', "D'", 'D2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    'F2': ['U', "U'", 'U2', 'D', "D'", 'D2', 'B', "B'", 'B2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    'B': ['U', "U'", 'U2', 'D', "D'", 'D2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    "B'": ['U', "U'", 'U2', 'D', "D'", 'D2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    'B2': ['U', "U'", 'U2', 'D', "D'", 'D2', 'L', "L'", 'L2', 'R', "R'", 'R2'],
+    'L': ['U', "U'", 'U2', 'D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2', 'R', "R'", 'R2'],
+    "L'": ['U', "U'", 'U2', 'D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2', 'R', "R'", 'R2'],
+    'L2': ['U', "U'", 'U2', 'D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2', 'R', "R'", 'R2'],
+    'R': ['U', "U'", 'U2', 'D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2'],
+    "R'": ['U', "U'", 'U2', 'D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2'],
+    'R2': ['U', "U'", 'U2', 'D', "D'", 'D2', 'F', "F'", 'F2', 'B', "B'", 'B2']}
+
+# facelet array of the solved Rubik's cube (every tile has the colour code of its face)
+SOLVED_FACELETS = bytes(face_index for face_index in range(6) for _ in range(9))
+
+
+def _calculate_turn_permutation(turn_type: str) -> tuple:
+    # creates a cube state where every tile is labelled with its own facelet index
+    labelled_cube_state = CubeState()
+    for face_index, face_name in enumerate(FACE_NAMES):
+        cube_face = CubeFace()
+        for tile_index, tile_name in enumerate(TILE_NAMES):
+            cube_face.__setattr__(tile_name, face_index * 9 + tile_index)
+        labelled_cube_state.__setattr__(face_name, cube_face)
+
+    # the turned labels show which facelet index each tile has been moved from
+    labelled_cube_state.turn_face(turn_type)
+
+    # element = the facelet index whose tile is moved to this facelet index by the turn
+    return tuple(labelled_cube_state.__getattribute__(face_name).__getattribute__(tile_name)
+                 for face_name in FACE_NAMES for tile_name in TILE_NAMES)
+
+
+# element = index permutation of the move (new_facelets[i] = facelets[permutation[i]])
+TURN_PERMUTATIONS = [_calculate_turn_permutation(turn_type) for turn_type in TURN_TYPES]
+
+# element = callable that gathers the facelets of a facelet array in the order of the move's permutation
+TURN_GATHERS = [itemgetter(*turn_permutation) for turn_permutation in TURN_PERMUTATIONS]
+
+
+class FaceletCube:
+    """
+    compact, immutable colour state of the whole Rubik's cube: one colour code per facelet (54 bytes)
+    """
+    __slots__ = ('facelets',)
+
+    def __init__(self, facelets: bytes = SOLVED_FACELETS):
+        self.facelets = facelets  # colour code of every facelet (face by face, tile by tile)
+
+    def __eq__(self, other):
+        return isinstance(other, FaceletCube) and self.facelets == other.facelets
+
+    def __hash__(self):
+        return hash(self.facelets)
+
+    @classmethod
+    def from_cube_state(cls, cube_state: CubeState) -> "FaceletCube":
+        return cls(bytes(COLOUR_TO_CODE[cube_state.__getattribute__(face_name).__getattribute__(tile_name)]
+                         for face_name in FACE_NAMES for tile_name in TILE_NAMES))
+
+    @classmethod
+    def from_string(cls, facelet_string: str) -> "FaceletCube":
+        # facelet_string = the colour (w/g/r/b/o/y) of every facelet, in the same order as the facelet array
+        if len(facelet_string) != len(SOLVED_FACELETS) or not set(facelet_string) <= set(COLOURS):
+            raise ValueError(f"'{facelet_string}' is not {len(SOLVED_FACELETS)} facelet colours ({''.join(COLOURS)})")
+        if facelet_string[4::9] != ''.join(COLOURS):  # the centre tiles never move
+            raise ValueError(f"'{facelet_string}' does not have the centre colours in the order {''.join(COLOURS)}")
+        return cls(bytes(COLOUR_TO_CODE[colour] for colour in facelet_string))
+
+    def to_string(self) -> str:
+        return ''.join(COLOURS[colour_code] for colour_code in self.facelets)
+
+    def to_cube_state(self) -> CubeState:
+        cube_state = CubeState()
+        for face_index, face_name in enumerate(FACE_NAMES):
+            cube_face = CubeFace()
+            for tile_index, tile_name in enumerate(TILE_NAMES):
+                cube_face.__setattr__(tile_name, COLOURS[self.facelets[face_index * 9 + tile_index]])
+            cube_state.__setattr__(face_name, cube_face)
+        return cube_state
+
+    def turn(self, move: int) -> "FaceletCube":
+        # applies the move's precomputed permutation to the facelets in a single gather
+        return FaceletCube(bytes(TURN_GATHERS[move](self.facelets)))
+
+    def turn_face(self, turn_type: str) -> "FaceletCube":
+        return self.turn(TURN_TYPE_TO_MOVE[turn_type])
+
+    def is_solved(self):
+        return self.facelets == SOLVED_FACELETS
@@ -1,84 +1,114 @@
-import pickle
-import os
-
-FLIP_BIT = ['1', '0']  # element = opposite bit of index
-SIX_MINUS_INDEX = [6, 5, 4, 3, 2, 1, 0]  # element = 6 - index
+import math
+import numpy as np
 
 # element of COUNT_ONES = the number of 1's in the binary version of the index
-# loads COUNTS_ONES list from pickle file
-directory = 'data'
-try:
-    with open(os.path.join(directory, 'count_ones.pkl'), 'rb') as file:
-        COUNT_ONES = pickle.load(file)  # stores the list in a constant variable
-
-# creates and stores COUNT_ONES list if it does not exist
-except FileNotFoundError:
-    os.makedirs(directory, exist_ok=True)
-    with open(os.path.join(directory, 'count_ones.pkl'), 'wb') as file:
-        COUNT_ONES = []
-
-        # the largest bit string length is 12 (for edge cubies). Base is 2 as the bit string is binary.
-        iterations = 2 ** 12
-
-        # counts and stores the number of ones in the binary equivalent of each number
-        for number in range(iterations):
-            COUNT_ONES.append(bin(number).count('1'))
-
-        pickle.dump(COUNT_ONES, file, pickle.HIGHEST_PROTOCOL)  # writes the list to a pickle file
+# (the largest bitmask length is 12, for edge cubies. it is small enough to count when imported instead of being
+# saved to a file)
+COUNT_ONES = [bin(number).count('1') for number in range(2 ** 12)]
 
 
 class IndexCalculator:
-    def __init__(self, number_of_cubies: int, lehmer_bases: list, orientation_bases: list):
+    def __init__(self, number_of_cubies: int, lehmer_bases: list, orientation_bases: list,
+                 number_of_positions: int = 7):
         self.number_of_cubies = number_of_cubies  # the number of cubies (8 for corners, 12 for edges)
-        self.empty_bit_string = '0' * self.number_of_cubies  # 0 as a 8 bit string
+        self.number_of_positions = number_of_positions  # the (most) positions in the permutations
         self.lehmer_bases = lehmer_bases  # lehmer bases specialised for the current cubies group (corners/edges)
         self.orientation_bases = orientation_bases
-        self.hash_index = None  # the hash index associated with the current permutation
-
-    def __calculate_lehmer_code(self, cubie_positions_permutation: list):
-        bit_string = self.empty_bit_string
-
-        # processes first digit of permutation
-        first_digit = cubie_positions_permutation[0]
-        self.lehmer_code = [first_digit]  # permutation[0] = lehmer_code[0] is always true (no elements less than it)
-        bit_string = bit_string[:first_digit] + '1' + bit_string[first_digit + 1:]  # flips bit[i] where i = 1st digit
-
-        # second to second last digit
-        rest_of_permutation = cubie_positions_permutation[1:]  # the permutation from the 2nd digit
-        for digit in rest_of_permutation:
-            flipped_bit = FLIP_BIT[int(bit_string[digit])]  # the flipped bit at the index where index = digit
 
-            # replaces the un-flipped bit at the index where index = digit
-            bit_string = bit_string[:digit] + flipped_bit + bit_string[digit + 1:]
-
-            # works out the number of elements that are less than digit by counting the number of ones in the
-            # binary shift of the bitstring by the (number of cubies - digit)
-            number_of_elements_less = COUNT_ONES[int(bit_string, 2) >> (self.number_of_cubies - digit)]
-
-            lehmer_digit = digit - number_of_elements_less  # the digit - number of elements less than the digit
-            self.lehmer_code.append(lehmer_digit)  # appends lehmer digit to the lehmer code
-
-    def __add_decimal_lehmer_code(self):
-        # converts lehmer code to decimal and adds it to the hash index
-        for lehmer_base, lehmer_digit in zip(self.lehmer_bases, self.lehmer_code):
-            self.hash_index += int(lehmer_base * lehmer_digit)
-
-    def __add_orientations_rank(self, cubie_orientations_permutation: list):
+        # element = the power of the orientation base of each position (number of positions - 1 - index)
+        self.orientation_base_powers = list(range(number_of_positions - 1, -1, -1))
+        self.number_of_orientations_ranks = orientation_bases[number_of_positions]  # the position rank's multiplier
+        self.number_of_hash_indexes = lehmer_bases[0] * number_of_cubies * self.number_of_orientations_ranks
+
+    def __calculate_position_rank(self, cubie_positions_permutation: list) -> int:
+        # the lehmer code of the permutation converted to decimal. bit i of the bitmask is set once cubie i is in an
+        # earlier position, so the number of earlier cubies less than a cubie is the number of ones below its bit
+        bitmask = 0
+        position_rank = 0
+        for lehmer_base, cubie in zip(self.lehmer_bases, cubie_positions_permutation):
+            lehmer_digit = cubie - COUNT_ONES[bitmask & ((1 << cubie) - 1)]
+            position_rank += lehmer_base * lehmer_digit
+            bitmask |= 1 << cubie
+        return position_rank
+
+    def __calculate_orientations_rank(self, cubie_orientations_permutation: list) -> int:
         # converts permutation to decimal
-        for base_power, permutation_digit in zip(SIX_MINUS_INDEX, cubie_orientations_permutation):
-            self.hash_index += self.orientation_bases[base_power] * permutation_digit
+        orientations_rank = 0
+        for base_power, permutation_digit in zip(self.orientation_base_powers, cubie_orientations_permutation):
+            orientations_rank += self.orientation_bases[base_power] * permutation_digit
+        return orientations_rank
 
     def calculate_hash_index(self, cubie_positions_permutation: list, cubie_orientations_permutation: list) -> int:
-        self.hash_index = 0
-
-        # adds the position rank
-        self.__calculate_lehmer_code(cubie_positions_permutation)  # calculates the lehmer code of the permutation
-        self.__add_decimal_lehmer_code()  # converts the lehmer code to base 10 (the hash_index)
-
-        # multiplication avoids duplicate hash indexes
-        self.hash_index = self.hash_index * self.orientation_bases[7]
-
-        # adds the orientations rank
-        self.__add_orientations_rank(cubie_orientations_permutation)
-
-        return self.hash_index
+        # (no state is kept between calls, so one index calculator can be shared, e.g. by threads)
+        # multiplication of the position rank avoids duplicate hash indexes, then the orientations rank is added
+        return self.__calculate_position_rank(cubie_positions_permutation) * self.number_of_orientations_ranks + \
+            self.__calculate_orientations_rank(cubie_orientations_permutation)
+
+    def unrank(self, hash_index: int, number_of_positions: int = None) -> tuple:
+        # the cubie positions and orientations permutations that have the hash index (the inverse of
+        # calculate_hash_index). e.g. the permutations of a random hash index are a uniformly random cube state of the
+        # hashed positions
+        number_of_positions = number_of_positions or self.number_of_positions
+        number_of_orientations = self.orientation_bases[1]
+        position_rank, orientations_rank = divmod(hash_index, self.number_of_orientations_ranks)
+
+        unused_cubies = list(range(self.number_of_cubies))  # the cubies not in an earlier position, in order
+        cubie_positions_permutation, cubie_orientations_permutation = [], []
+        for position in range(number_of_positions):
+            # the cubie is the (lehmer digit + 1)th cubie not in an earlier position
+            lehmer_digit = position_rank // self.lehmer_bases[position] % (self.number_of_cubies - position)
+            cubie_positions_permutation.append(unused_cubies.pop(lehmer_digit))
+            orientation_base = self.orientation_bases[self.orientation_base_powers[position]]
+            cubie_orientations_permutation.append(orientations_rank // orientation_base % number_of_orientations)
+        return cubie_positions_permutation, cubie_orientations_permutation
+
+    def calculate_hash_indexes(self, cubie_positions_permutations: np.ndarray,
+                               cubie_orientations_permutations: np.ndarray) -> np.ndarray:
+        # the hash index of every row of the (N, number of positions) arrays of cubie positions and orientations
+        # permutations, in one vectorised pass (the same hash indexes as calculate_hash_index)
+        cubies = np.asarray(cubie_positions_permutations, dtype=np.int64)
+        orientations = np.asarray(cubie_orientations_permutations, dtype=np.int64)
+        hash_indexes = np.zeros(len(cubies), dtype=np.int64)
+        for position in range(cubies.shape[1]):
+            # lehmer digit = the cubie - the number of smaller cubies in earlier positions
+            lehmer_digits = cubies[:, position] - np.count_nonzero(cubies[:, :position] < cubies[:, position, None],
+                                                                   axis=1)
+            hash_indexes += lehmer_digits * self.lehmer_bases[position]
+        hash_indexes *= self.number_of_orientations_ranks
+        for position in range(cubies.shape[1]):
+            hash_indexes += orientations[:, position] * self.orientation_bases[self.orientation_base_powers[position]]
+        return hash_indexes
+
+    def calculate_permutations(self, hash_indexes: np.ndarray, number_of_positions: int = None) -> tuple:
+        # the (N, number of positions) arrays of cubie positions and orientations permutations that have the hash
+        # indexes (the inverse of calculate_hash_indexes; fewer positions than the index calculator's can be hashed)
+        number_of_positions = number_of_positions or self.number_of_positions
+        number_of_orientations = self.orientation_bases[1]
+        hash_indexes = np.asarray(hash_indexes, dtype=np.int64)
+        position_ranks, orientations_ranks = np.divmod(hash_indexes, self.number_of_orientations_ranks)
+
+        cubies = np.empty((len(hash_indexes), number_of_positions), dtype=np.int64)
+        orientations = np.empty_like(cubies)
+        unused_cubies = np.ones((len(hash_indexes), self.number_of_cubies), dtype=bool)
+        rows = np.arange(len(hash_indexes))
+        for position in range(number_of_positions):
+            # the cubie is the (lehmer digit + 1)th cubie not in an earlier position
+            lehmer_digits = position_ranks // self.lehmer_bases[position] % (self.number_of_cubies - position)
+            cubies[:, position] = np.argmax(np.cumsum(unused_cubies, axis=1) > lehmer_digits[:, None], axis=1)
+            unused_cubies[rows, cubies[:, position]] = False
+
+            orientation_base = self.orientation_bases[self.orientation_base_powers[position]]
+            orientations[:, position] = orientations_ranks // orientation_base % number_of_orientations
+        return cubies, orientations
+
+
+def create_index_calculator(number_of_cubies: int, number_of_positions: int,
+                            number_of_orientations: int) -> IndexCalculator:
+    # the index calculator of the permutations of any number_of_positions of the cubies
+    return IndexCalculator(
+        number_of_cubies=number_of_cubies,
+        lehmer_bases=[math.perm(number_of_cubies - 1 - index, number_of_positions - 1 - index)
+                      for index in range(number_of_positions)],  # element = (cubies-1-index)P(positions-1-index)
+        orientation_bases=[number_of_orientations ** index
+                           for index in range(number_of_positions + 1)],  # element = orientations**index
+        number_of_positions=number_of_positions)
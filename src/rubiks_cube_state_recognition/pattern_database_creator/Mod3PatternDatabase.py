@@ -0,0 +1,56 @@
+import numpy as np
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import (UNKNOWN_DEPTH,
+                                                                                         PackedPatternDatabase)
+
+MOD_3_SUFFIX = '_mod_3'  # added to the table name of a pattern database stored modulo 3
+UNKNOWN_DEPTH_MOD_3 = 3  # stored depth of a hash index that has not been reached yet (the largest 2 bit number)
+
+
+class Mod3PatternDatabase(PackedPatternDatabase):
+    """
+    the depth of every hash index of a pattern database modulo 3, stored as one 2 bit number per hash index (four hash
+    indexes per byte, the first in the lowest 2 bits). a turn changes a pattern database's depth by at most 1, so the
+    depth of a cube state is the one of its parent's depth - 1, depth and depth + 1 with the stored depth modulo 3.
+    half the size of a nibble packed pattern database, but only the depths of children can be looked up directly
+    """
+    ENTRY_BITS = 2
+
+    def get_depth_mod_3(self, index: int) -> int:
+        return (self.depths[index >> 2] >> ((index & 3) << 1)) & 3
+
+    def get_depth(self, index: int, parent_depth: int) -> int:
+        # the depth of a cube state with the hash index, from the depth of its parent (a cube state one turn away)
+        depth_mod_3 = self.get_depth_mod_3(index)
+        if depth_mod_3 == UNKNOWN_DEPTH_MOD_3:
+            return UNKNOWN_DEPTH
+        return parent_depth - 1 + (depth_mod_3 - parent_depth + 1) % 3
+
+    def set_depth(self, index: int, depth: int):
+        shift = (index & 3) << 1
+        byte_index = index >> 2
+        depth_mod_3 = UNKNOWN_DEPTH_MOD_3 if depth == UNKNOWN_DEPTH else depth % 3
+        self.depths[byte_index] = (self.depths[byte_index] & ~(3 << shift) & 0xFF) | (depth_mod_3 << shift)
+
+    def did_add_record(self, index: int, depth: int) -> bool:
+        # only the first (smallest) depth found for a hash index is kept
+        if self.get_depth_mod_3(index) != UNKNOWN_DEPTH_MOD_3:
+            return False
+        self.set_depth(index, depth)
+        return True
+
+    @classmethod
+    def from_depth_bytes(cls, depth_bytes, size: int) -> "Mod3PatternDatabase":
+        # packs a table of one depth byte per hash index (any byte of UNKNOWN_DEPTH or above is unknown)
+        depth_bytes = np.frombuffer(depth_bytes, dtype=np.uint8, count=size)
+        depths_mod_3 = np.full(cls.get_number_of_bytes(size) * 4, UNKNOWN_DEPTH_MOD_3, dtype=np.uint8)
+        depths_mod_3[:size] = np.where(depth_bytes < UNKNOWN_DEPTH, depth_bytes % 3, UNKNOWN_DEPTH_MOD_3)
+        return cls(size, bytearray((depths_mod_3[0::4] | (depths_mod_3[1::4] << 2) | (depths_mod_3[2::4] << 4)
+                                    | (depths_mod_3[3::4] << 6)).tobytes()))
+
+    def to_depth_bytes(self) -> np.ndarray:
+        # unpacks the depths modulo 3 into one byte per hash index (UNKNOWN_DEPTH_MOD_3 if unknown)
+        depths = np.frombuffer(self.depths, dtype=np.uint8)
+        depth_bytes = np.empty(len(depths) * 4, dtype=np.uint8)
+        for shift in range(4):
+            depth_bytes[shift::4] = (depths >> (shift << 1)) & 3
+        return depth_bytes[:self.size]
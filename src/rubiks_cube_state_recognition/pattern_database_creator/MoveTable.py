@@ -0,0 +1,133 @@
+import logging
+import os
+import sys
+import numpy as np
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import get_index_scheme, get_path
+from rubiks_cube_state_recognition.pattern_database_creator.TableFile import TableFile
+from rubiks_cube_state_recognition.cube_state.CubieCube import MOVE_CUBES
+
+MOVE_TABLE_SUFFIX = '_move_table'  # added to the table name of a pattern database's move table
+NUMBER_OF_MOVES = len(MOVE_CUBES)
+BATCH_SIZE = 1 << 16  # the number of position ranks tabulated together
+
+# element = the cubie each cubie is relabelled as, and the orientation it adds, when the move is made before the cube
+# state's permutation (move x state, as in CubieCube.multiply). the cubies in the hashed positions after a move made
+# this way only depend on the cubies in the hashed positions before it, so the moves can be made on hash indexes. a
+# cube state is the same number of moves from the solved cube state whichever side the moves are made on
+CORNER_MOVE_RELABELS = [(np.array(move_cube.cp), np.array(move_cube.co)) for move_cube in MOVE_CUBES]
+EDGE_MOVE_RELABELS = [(np.array(move_cube.ep), np.array(move_cube.eo)) for move_cube in MOVE_CUBES]
+
+
+class MoveTable:
+    """
+    the hash index reached by each move (made before the cube state's moves, as in PatternDatabaseCreator) from every
+    hash index of a pattern database's index space, so a child's hash index is found with lookups instead of ranking
+    its cubies. a table of every hash index and move would be too large (e.g. 88 million corner hash indexes), so it
+    holds the hash index each move reaches from every position rank with every orientation 0 (the child's position
+    rank and the orientations the move adds to the cubies), and the parent's orientations are added to those one
+    position at a time (modulo the number of orientations) with a table of every pair of orientations ranks
+    """
+    def __init__(self, index_space: tuple, child_hash_indexes=None, table_file: TableFile = None):
+        # (a pattern database's index space, as in TABLE_INDEX_SPACES)
+        self.index_space = index_space
+        self.index_calculator, self.positions, self.number_of_orientations = index_space
+        self.orientations_multiplier = self.index_calculator.number_of_orientations_ranks
+        self.number_of_position_ranks = self.index_calculator.lehmer_bases[0] * self.index_calculator.number_of_cubies
+        entry_bits = self.get_entry_bits(index_space)
+
+        if child_hash_indexes is None:
+            child_hash_indexes = self.__build(np.int32 if entry_bits == 32 else np.int64)
+        # element [position rank * NUMBER_OF_MOVES + move] = the hash index the move reaches from the position rank
+        # with every orientation 0 (a memoryview, so an entry is looked up as an int without numpy's overhead)
+        self.child_hash_indexes = memoryview(child_hash_indexes).cast('B').cast('i' if entry_bits == 32 else 'q')
+        self.table_file = table_file  # the file the move table was loaded from (None if it was built)
+        self.added_orientations_ranks = memoryview(self.__add_orientations_ranks())
+
+    @staticmethod
+    def get_entry_bits(index_space: tuple) -> int:
+        # the number of bits each entry (a hash index) is stored in
+        return 32 if index_space[0].number_of_hash_indexes <= 2 ** 31 else 64
+
+    def __build(self, dtype: type) -> np.ndarray:
+        # unranks the cubies of every position rank, relabels them with every move and ranks the children
+        move_relabels = CORNER_MOVE_RELABELS if self.index_calculator.number_of_cubies == 8 else EDGE_MOVE_RELABELS
+        child_hash_indexes = np.empty((self.number_of_position_ranks, NUMBER_OF_MOVES), dtype=dtype)
+        for start in range(0, self.number_of_position_ranks, BATCH_SIZE):
+            stop = min(start + BATCH_SIZE, self.number_of_position_ranks)
+            # (position ranks that no cubies have, i.e. gaps in the index space, get another position rank's children)
+            cubies, _ = self.index_calculator.calculate_permutations(
+                np.arange(start, stop) * self.orientations_multiplier, len(self.positions))
+            for move, (cubie_relabels, orientation_additions) in enumerate(move_relabels):
+                child_hash_indexes[start:stop, move] = self.index_calculator.calculate_hash_indexes(
+                    cubie_relabels[cubies], orientation_additions[cubies])
+        return child_hash_indexes.reshape(-1)
+
+    def __add_orientations_ranks(self) -> np.ndarray:
+        # element [orientations rank 1 * orientations multiplier + orientations rank 2] = the orientations rank of the
+        # two ranks' orientations added position by position (modulo the number of orientations)
+        orientations_ranks = np.arange(self.orientations_multiplier)
+        added_orientations_ranks = np.zeros((self.orientations_multiplier, self.orientations_multiplier),
+                                            dtype=np.uint16)
+        orientation_base = 1
+        while orientation_base < self.orientations_multiplier:
+            orientations = orientations_ranks // orientation_base % self.number_of_orientations
+            added_orientations_ranks += ((orientations[:, None] + orientations[None, :]) % self.number_of_orientations
+                                         * orientation_base).astype(np.uint16)
+            orientation_base *= self.number_of_orientations
+        return added_orientations_ranks.reshape(-1)
+
+    def get_child_hash_index(self, hash_index: int, move: int) -> int:
+        # the hash index of the cube state reached by making the move before the hash index's cube state's moves
+        position_rank, orientations_rank = divmod(hash_index, self.orientations_multiplier)
+        child_hash_index = self.child_hash_indexes[position_rank * NUMBER_OF_MOVES + move]
+        added_orientations_rank = child_hash_index % self.orientations_multiplier
+        return child_hash_index - added_orientations_rank + self.added_orientations_ranks[
+            added_orientations_rank * self.orientations_multiplier + orientations_rank]
+
+    @classmethod
+    def get_header(cls, index_space: tuple) -> dict:
+        # the header of the TableFile of a move table (its entries are native integers, so the byte order is checked)
+        index_calculator = index_space[0]
+        number_of_position_ranks = index_calculator.lehmer_bases[0] * index_calculator.number_of_cubies
+        return {'kind': 'move_table', **get_index_scheme(index_space), 'entry_bits': cls.get_entry_bits(index_space),
+                'byte_order': sys.byteorder, 'size': number_of_position_ranks * NUMBER_OF_MOVES}
+
+    def save(self, path: str):
+        TableFile(self.get_header(self.index_space), self.child_hash_indexes.cast('B')).save(path)
+
+    @classmethod
+    def load(cls, path: str, index_space: tuple, memory_map: bool = True) -> "MoveTable":
+        # a file of another index space, entry width or byte order is rejected with ValueError
+        table_file = TableFile.open(path, cls.get_header(index_space), memory_map=memory_map)
+        return cls(index_space, table_file.data, table_file if memory_map else None)
+
+    @classmethod
+    def load_or_build(cls, directory: str, table_name: str, index_space: tuple,
+                      memory_map: bool = True) -> "MoveTable":
+        """
+        the move table of the pattern database with the table name, from its file in the directory. if there is no
+        file (or it is stale) the move table is built and saved there, so it is only built once
+        """
+        path = get_path(directory, table_name + MOVE_TABLE_SUFFIX)
+        if os.path.exists(path):
+            try:
+                return cls.load(path, index_space, memory_map)
+            except ValueError as error:
+                logging.warning(f'{error}, so the move table is built again')
+
+        logging.info(f'building {table_name} move table')
+        move_table = cls(index_space)
+        try:
+            move_table.save(path)
+            logging.info(f"{table_name} move table saved to '{path}'")
+        except OSError as error:  # (e.g. a read-only directory) the move table is still used
+            logging.warning(f"{table_name} move table could not be saved to '{path}' ({error})")
+        return move_table
+
+    def close(self):
+        # unmaps a memory mapped move table (the view of the entries is released first, as the map cannot be closed
+        # while it is exported)
+        if self.table_file is not None:
+            self.child_hash_indexes.release()
+            self.table_file.close()
+            self.table_file = None
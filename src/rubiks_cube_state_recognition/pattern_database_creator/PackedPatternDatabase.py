@@ -0,0 +1,146 @@
+import os
+import numpy as np
+from rubiks_cube_state_recognition.pattern_database_creator.IndexCalculator import (IndexCalculator,
+                                                                                    create_index_calculator)
+from rubiks_cube_state_recognition.pattern_database_creator.TableFile import TableFile
+
+UNKNOWN_DEPTH = 15  # depth of a hash index that has not been reached yet (the largest 4 bit number)
+
+# the number of hash indexes of each pattern database
+CORNER_CUBIES_TABLE_SIZE = 40320 * 2187  # 8! corner cubie permutations x 3^7 orientations
+EDGE_CUBIES_TABLE_SIZE = 3991680 * 128  # 12P7 edge cubie permutations x 2^7 orientations
+TABLE_SIZES = {'corner_cubies': CORNER_CUBIES_TABLE_SIZE,
+               'edge_cubies_1': EDGE_CUBIES_TABLE_SIZE,
+               'edge_cubies_2': EDGE_CUBIES_TABLE_SIZE}
+
+CORNER_CUBIES_INDEX_CALCULATOR = IndexCalculator(
+    number_of_cubies=8,
+    lehmer_bases=[5040, 720, 120, 24, 6, 2, 1],  # element = (8-1-index)!
+    orientation_bases=[1, 3, 9, 27, 81, 243, 729, 2187])  # element= 3**index
+EDGE_CUBIES_INDEX_CALCULATOR = IndexCalculator(
+    number_of_cubies=12,
+    lehmer_bases=[332640, 30240, 3024, 336, 42, 6, 1],  # element = (12-1-index)P(7-1-index)
+    orientation_bases=[1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048])  # element = 2**index
+
+# the index calculator, hashed cubie positions (as in CubieCube.get_corner/edge_permutations) and number of cubie
+# orientations of each pattern database
+# (edge_cubies_1 and edge_cubies_2 are overlapping groups of the edge cubie positions, sharing the 7th position)
+TABLE_INDEX_SPACES = {'corner_cubies': (CORNER_CUBIES_INDEX_CALCULATOR, range(0, 7), 3),
+                      'edge_cubies_1': (EDGE_CUBIES_INDEX_CALCULATOR, range(0, 7), 2),
+                      'edge_cubies_2': (EDGE_CUBIES_INDEX_CALCULATOR, range(6, 12), 2)}
+
+# the edge cubie positions (the numbers of the positions in an edge cubies group)
+EDGE_POSITION_NAMES = ['bo', 'br', 'bw', 'by', 'go', 'gr', 'gw', 'gy', 'ow', 'oy', 'rw', 'ry']
+
+DEFAULT_DIRECTORY = 'pattern_databases'  # the directory the pattern database files are saved in
+
+
+def get_path(directory: str, table_name: str) -> str:
+    return os.path.join(directory, f'{table_name}.bin')
+
+
+def get_table_index_spaces(edge_groups: list = None) -> dict:
+    """
+    the index space (as in TABLE_INDEX_SPACES) of the corner cubies pattern database and of a pattern database for
+    each group of edge cubie positions (default: edge_cubies_1 and edge_cubies_2). any groups can be used, e.g. two
+    disjoint groups of 6 positions or groups of 8 and 4 positions. the heuristic is the largest of the depths, as
+    every turn moves cubies of more than one group (so the depths cannot be added)
+    """
+    if edge_groups is None:
+        return dict(TABLE_INDEX_SPACES)
+
+    table_index_spaces = {'corner_cubies': TABLE_INDEX_SPACES['corner_cubies']}
+    for positions in edge_groups:
+        positions = tuple(positions)
+        if not positions or len(set(positions)) != len(positions) or not set(positions) <= set(range(12)):
+            raise ValueError(f'{positions} is not a group of distinct edge cubie positions (0 to 11)')
+        # the table name has each position as a hexadecimal digit
+        table_name = f"edge_cubies_{''.join(f'{position:x}' for position in positions)}"
+        table_index_spaces[table_name] = (create_index_calculator(12, len(positions), 2), positions, 2)
+    return table_index_spaces
+
+
+def get_index_scheme(index_space: tuple, symmetry_reduced: bool = False) -> dict:
+    # the header fields (of its TableFile) that identify which cube states the hash indexes of a pattern database are
+    index_calculator, positions, number_of_orientations = index_space
+    return {'cubies': 'corner' if index_calculator.number_of_cubies == 8 else 'edge', 'positions': list(positions),
+            'orientations': number_of_orientations,
+            'index_scheme': f'lehmer_{index_calculator.number_of_positions}_positions'
+                            + ('_symmetry_reduced' if symmetry_reduced else '')}
+
+
+class PackedPatternDatabase:
+    """
+    the depth of every hash index of a pattern database, stored as one 4 bit number (nibble) per hash index.
+    the even hash index of each byte is in its low nibble and the odd hash index is in its high nibble
+    """
+    ENTRY_BITS = 4  # the number of bits each depth is stored in
+
+    def __init__(self, size: int, depths=None, table_file: TableFile = None):
+        self.size = size  # the number of hash indexes
+        if depths is None:
+            depths = bytearray(b'\xff') * self.get_number_of_bytes(size)  # every hash index starts as unknown
+        self.depths = depths  # bytearray, or a read-only view of a memory mapped pattern database
+        self.table_file = table_file  # the file the pattern database was loaded from (None if it was not)
+
+    @classmethod
+    def get_number_of_bytes(cls, size: int) -> int:
+        # the number of bytes the depths of size hash indexes are stored in
+        return (size * cls.ENTRY_BITS + 7) // 8
+
+    def get_depth(self, index: int) -> int:
+        return (self.depths[index >> 1] >> ((index & 1) << 2)) & 0xF
+
+    def set_depth(self, index: int, depth: int):
+        shift = (index & 1) << 2
+        byte_index = index >> 1
+        self.depths[byte_index] = (self.depths[byte_index] & (0xF0 >> shift)) | (depth << shift)
+
+    def did_add_record(self, index: int, depth: int) -> bool:
+        # only the first (smallest) depth found for a hash index is kept
+        if self.get_depth(index) != UNKNOWN_DEPTH:
+            return False
+        self.set_depth(index, depth)
+        return True
+
+    @classmethod
+    def get_header(cls, size: int, index_scheme: dict) -> dict:
+        # the header of the TableFile of a pattern database (index_scheme is from get_index_scheme)
+        return {'kind': 'pattern_database', **index_scheme, 'entry_bits': cls.ENTRY_BITS, 'size': size}
+
+    def save(self, path: str, index_scheme: dict):
+        TableFile(self.get_header(self.size, index_scheme), self.depths).save(path)
+
+    @classmethod
+    def from_depth_bytes(cls, depth_bytes, size: int) -> "PackedPatternDatabase":
+        # packs a table of one depth byte per hash index (any byte above UNKNOWN_DEPTH is unknown too)
+        depth_bytes = np.minimum(np.frombuffer(depth_bytes, dtype=np.uint8, count=size), UNKNOWN_DEPTH)
+        if size % 2:
+            depth_bytes = np.append(depth_bytes, np.uint8(UNKNOWN_DEPTH))
+        return cls(size, bytearray((depth_bytes[0::2] | (depth_bytes[1::2] << 4)).tobytes()))
+
+    def to_depth_bytes(self) -> np.ndarray:
+        # unpacks the depths into one byte per hash index (the inverse of from_depth_bytes)
+        depths = np.frombuffer(self.depths, dtype=np.uint8)
+        depth_bytes = np.empty(len(depths) * 2, dtype=np.uint8)
+        depth_bytes[0::2] = depths & 0xF
+        depth_bytes[1::2] = depths >> 4
+        return depth_bytes[:self.size]
+
+    @classmethod
+    def load(cls, path: str, size: int, index_scheme: dict) -> "PackedPatternDatabase":
+        # reads the file into memory (a file of another index scheme, size or encoding is rejected)
+        table_file = TableFile.open(path, cls.get_header(size, index_scheme))
+        return cls(size, table_file.data)
+
+    @classmethod
+    def memory_map(cls, path: str, size: int, index_scheme: dict) -> "PackedPatternDatabase":
+        # maps the file read-only instead of reading it: pages are only read from the file when one of their hash
+        # indexes is looked up, and are shared (through the OS page cache) by every process that maps the file
+        table_file = TableFile.open(path, cls.get_header(size, index_scheme), memory_map=True)
+        return cls(size, table_file.data, table_file)
+
+    def close(self):
+        # unmaps a memory mapped pattern database (a bytearray is left to the garbage collector)
+        if self.table_file is not None:
+            self.table_file.close()
@@ -1,145 +1,324 @@
-import sqlite3 as sqlite
-from rubiks_cube_state_recognition.pattern_database_creator.PDNode import PDNode
-from rubiks_cube_state_recognition.pattern_database_creator.IndexCalculator import IndexCalculator
-from rubiks_cube_state_recognition.cube_state.CubeState import CubeFace, CubeState
-from rubiks_cube_state_recognition.cube_state.CubiesState import CornerCubiesState, EdgeCubiesState
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import (
+    DEFAULT_DIRECTORY, EDGE_POSITION_NAMES, UNKNOWN_DEPTH, PackedPatternDatabase, get_index_scheme, get_path,
+    get_table_index_spaces)
+from rubiks_cube_state_recognition.pattern_database_creator.Mod3PatternDatabase import (MOD_3_SUFFIX,
+                                                                                       Mod3PatternDatabase)
+from rubiks_cube_state_recognition.pattern_database_creator.TableFile import TableFile
+from rubiks_cube_state_recognition.pattern_database_creator.MoveTable import CORNER_MOVE_RELABELS, EDGE_MOVE_RELABELS
+from rubiks_cube_state_recognition.pattern_database_creator.SymmetryReduction import (SYMMETRY_REDUCED_SUFFIX,
+                                                                                      SymmetryReduction)
 
+UNKNOWN_DEPTH_BYTE = 0xFF  # depth table value of a hash index that has not been reached yet
+RANGE_SIZE = 1 << 22  # the number of hash indexes a worker scans at a time
+BATCH_SIZE = 1 << 16  # the number of hash indexes unranked (and expanded) together
+PROGRESS_INTERVAL = 10  # the number of seconds between progress logs during a depth
 
-class PatternDatabaseInteractor:
-    def __init__(self):
-        self.connection = sqlite.connect(
-            'pattern_database.db')  # returns connection object that allows interaction with the database
-        self.cursor = self.connection.cursor()  # instance that allows the execution of SQL statements
-        self.current_depth = None  # the current depth in the tree consisting of PD_Node's
+# the state of the process expanding the hash indexes (each worker process, or the main process if there are no workers)
+_shared_memory = None  # the shared memory holding the depth table being generated
+_depth_table = None  # the depth table (one byte per hash index) being generated
+_unclosed_shared_memories = []  # the shared memories still referenced when detached (see _detach_depth_table)
+
+
+def get_checkpoint_path(directory: str, table_name: str) -> str:
+    return os.path.join(directory, f'{table_name}.checkpoint')
+
+
+def _resident_memory() -> int:
+    # the resident memory (bytes) of this process, which includes the shared depth table it scans (None if unknown)
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):  # not Linux
+        return None
+
+
+def _format_memory(number_of_bytes: int) -> str:
+    return 'unknown' if number_of_bytes is None else f'{number_of_bytes / 2 ** 20:.0f} MiB'
+
+
+def _attach_depth_table(shared_memory_name: str) -> np.ndarray:
+    # attaches to the shared memory of the depth table, unless already attached
+    # (the worker processes share the main process's resource tracker, so only the main process unlinks the memory)
+    global _shared_memory, _depth_table
+    if _shared_memory is None or _shared_memory.name != shared_memory_name:
+        _detach_depth_table()
+        _shared_memory = SharedMemory(name=shared_memory_name)
+        _depth_table = np.frombuffer(_shared_memory.buf, dtype=np.uint8)
+    return _depth_table
 
-        # creates the tables for each cubie group
-        # index = hash index
-        # depth = smallest depth to achieve index in tree = the min number of moves needed to solve the cube state with that index
-        self.cursor.execute('''CREATE TABLE if not exists "corner_cubies"(
-                                    "index"	INTEGER NOT NULL,
-                                    "depth"	INTEGER NOT NULL,
-                                    PRIMARY KEY("index"))''')
-        self.cursor.execute('''CREATE TABLE if not exists "edge_cubies_1"(
-                                    "index"	INTEGER NOT NULL,
-                                    "depth"	INTEGER NOT NULL,
-                                    PRIMARY KEY("index"))''')
-        self.cursor.execute('''CREATE TABLE if not exists "edge_cubies_2"(
-                                    "index"	INTEGER NOT NULL,
-                                    "depth"	INTEGER NOT NULL,
-                                    PRIMARY KEY("index"))''')
-        self.commit()
-
-    def __fetch_depth(self, table_name: str, index: int):
-        # returns the search result for the depth in records in a specific table with a specific index
-        sql = f'''SELECT "depth" FROM "{table_name}" WHERE "index" = {index}'''
-        self.cursor.execute(sql)
-        depth = self.cursor.fetchall()
-        return depth  # returns the found depths
-
-    def __insert_record(self, table_name: str, index: int):
-        # inserts the index and depth to the appropriate table
-        sql = f'INSERT INTO {table_name} VALUES ({index}, {self.current_depth})'
-        self.cursor.execute(sql)
-
-    def did_add_record(self, table_name: str, index: int):
-        if self.__fetch_depth(table_name, index):  # if a depth has been fetched
-            return False
-
-        # inserts the record if there is no record with the new index
-        else:
-            self.__insert_record(table_name, index)
-            return True
 
-    def commit(self):
-        # makes database changes visible to all applications using the database (permanently writes)
-        self.connection.commit()
+def _detach_depth_table():
+    global _shared_memory, _depth_table
+    if _shared_memory is not None:
+        _depth_table = None  # the shared memory cannot be closed while its buffer is still referenced
+        try:
+            _shared_memory.close()
+        except BufferError:
+            # the depth table is still referenced: by the frames of an exception being raised, or (in a worker
+            # process) by the main process's frames copied when it was forked. it is kept open until the process exits
+            _unclosed_shared_memories.append(_shared_memory)
+        _shared_memory = None
 
-    def close(self):
-        # closes the connection to the database
-        self.connection.close()
+
+def _children(cubies: np.ndarray, orientations: np.ndarray, index_space: tuple):
+    # yields the hash indexes reached by each move (every move's inverse is also a move, so these are also the hash
+    # indexes one move away from the cubies)
+    index_calculator, _, number_of_orientations = index_space
+    move_relabels = CORNER_MOVE_RELABELS if index_calculator.number_of_cubies == 8 else EDGE_MOVE_RELABELS
+    for cubie_relabels, orientation_additions in move_relabels:
+        child_orientations = (orientation_additions[cubies] + orientations) % number_of_orientations
+        yield index_calculator.calculate_hash_indexes(cubie_relabels[cubies], child_orientations)
+
+
+def _expand_range(shared_memory_name: str, index_space: tuple, start: int, stop: int, depth: int,
+                  is_backward: bool) -> int:
+    """
+    gives depth + 1 to the unknown hash indexes one move from the hash indexes at the depth, scanning one range of the
+    depth table. forwards, the range's hash indexes at the depth are expanded. backwards, the range's unknown hash
+    indexes are checked for a move to the depth (quicker once most hash indexes are known). every process writes the
+    same depth during a depth and never reads it back, so the processes share the depth table without locks.
+    returns the number of hash indexes expanded
+    """
+    depth_table = _attach_depth_table(shared_memory_name)
+    index_calculator, positions, number_of_orientations = index_space
+    scanned_depth = UNKNOWN_DEPTH_BYTE if is_backward else depth
+    hash_indexes = start + np.flatnonzero(depth_table[start:stop] == scanned_depth)
+
+    for batch_start in range(0, len(hash_indexes), BATCH_SIZE):
+        batch_hash_indexes = hash_indexes[batch_start:batch_start + BATCH_SIZE]
+        cubies, orientations = index_calculator.calculate_permutations(batch_hash_indexes, len(positions))
+
+        if is_backward:
+            # hash indexes that no cube state has (gaps in the index space) decode to another hash index's cubies
+            is_valid = index_calculator.calculate_hash_indexes(cubies, orientations) == batch_hash_indexes
+            is_next_depth = np.zeros(len(batch_hash_indexes), dtype=bool)
+            for child_hash_indexes in _children(cubies, orientations, index_space):
+                is_next_depth |= depth_table[child_hash_indexes] == depth
+            depth_table[batch_hash_indexes[is_next_depth & is_valid]] = depth + 1
+        else:
+            for child_hash_indexes in _children(cubies, orientations, index_space):
+                depth_table[child_hash_indexes[depth_table[child_hash_indexes] == UNKNOWN_DEPTH_BYTE]] = depth + 1
+    return len(hash_indexes)
 
 
 class PatternDatabaseCreator:
-    def __init__(self):
-        self.pattern_database = PatternDatabaseInteractor()
-        self.corner_cubies_index_calculator = IndexCalculator(
-            number_of_cubies=8,
-            lehmer_bases=[5040, 720, 120, 24, 6, 2, 1],  # element = (8-1-index)!
-            orientation_bases=[1, 3, 9, 27, 81, 243, 729, 2187])  # element= 3**index
-        self.edge_cubies_index_calculator = IndexCalculator(
-            number_of_cubies=12,
-            lehmer_bases=[332640, 30240, 3024, 336, 42, 6, 1],  # element = (12-1-index)P(7-1-index)
-            orientation_bases=[1, 2, 4, 8, 16, 32, 64,
-                               128, 256, 512, 1024, 2048])  # element = 2**index
-
-        # creates a Cube_State object of the solved Rubik's cube state
-        solved_cube_state = CubeState()
-        for colour in ['w', 'g', 'r', 'b', 'o', 'y']:
-            cube_face = CubeFace()
-            cube_face_tiles_names = ['tl', 'tm', 'tr',
-                                     'ml', 'c', 'mr',
-                                     'bl', 'bm', 'br']
-            for cube_face_tile_name in cube_face_tiles_names:
-                cube_face.__setattr__(cube_face_tile_name, colour)
-            solved_cube_state.__setattr__(colour + '_face', cube_face)
-
-        root_tree_node = PDNode(cube_state=solved_cube_state, last_turn=None)
-
-        # initialises the node processing queues
-        self.node_queues = {0: [root_tree_node]}  # places the root node at depth 0 (as expected for a tree)
-        for depth in range(1, 13):  # creates 13 queues for each tree depth. Every state can be achieved
-            self.node_queues[depth] = []
-
-        # initialises the tree depth variables (for tracking)
-        self.current_depth = 0  # the tree is generated from the root and so the current depth is initialised to 0
-        self.pattern_database.current_depth = self.current_depth  # links the two attributes together
-        self.next_depth = 1  # current depth + 1
-
-    def __process_node(self, node: PDNode):
-        # calculates the hash index for the corner cubies
-        corner_cubies_state = CornerCubiesState(node.cube_state)
-        corner_positions_permutation, corner_orientations_permutation = corner_cubies_state.get_permutations()
-        corners_hash_index = self.corner_cubies_index_calculator.calculate_hash_index(
-            corner_positions_permutation,
-            corner_orientations_permutation)
-
-        # calculates the hash indexes for the edge cubies
-        edge_cubies_state = EdgeCubiesState(node.cube_state)
-        edge_positions_permutation_1, edge_orientations_permutation_1, edge_positions_permutation_2, edge_orientations_permutation_2 = edge_cubies_state.get_permutations()
-        edges_hash_index_1 = self.edge_cubies_index_calculator.calculate_hash_index(
-            edge_positions_permutation_1,
-            edge_orientations_permutation_1)
-        edges_hash_index_2 = self.edge_cubies_index_calculator.calculate_hash_index(
-            edge_positions_permutation_2,
-            edge_orientations_permutation_2)
-
-        # adds children to the processing queue for the next depth if the record is added to the corner_cubies table
-        if self.pattern_database.did_add_record('corner_cubies', corners_hash_index):
-            self.pattern_database.did_add_record('edge_cubies_1', edges_hash_index_1)
-            self.pattern_database.did_add_record('edge_cubies_2', edges_hash_index_2)
-            node.create_children()  # creates children for the current node
-            self.node_queues[self.next_depth].extend(
-                node.children)  # adds the children to the next depth's processing queue
-
-    def generate(self):
-        while self.current_depth <= 12:
-            # processes nodes in the node processing queue at the current depth
-            for node in self.node_queues[self.current_depth]:
-                self.__process_node(node)
-                del (self.node_queues[self.current_depth][
-                    0])  # removes the node at the front of the processed queue to save memory
-
-            # makes database record insertions visible to all applications using the database (permanently writes)
-            self.pattern_database.commit()
-
-            # updates the depth attributes to prepare the processing at the next depth
-            self.current_depth = self.next_depth
-            self.pattern_database.current_depth = self.current_depth
-            self.next_depth += 1
-
-        # closes the connection to the database once all possible cube states have been analysed.
-        self.pattern_database.close()
-
-
-pattern_database_creator = PatternDatabaseCreator()
-pattern_database_creator.generate()
+    """
+    generates each pattern database on its own with a breadth first search over its hash indexes: each depth scans
+    the depth table for the hash indexes at the depth, unranks them, makes every move and ranks the results. only the
+    depth table is kept in memory (no cube states), and its ranges are scanned in parallel
+    """
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, workers: int = None, resume: bool = False,
+                 table_names: list = None, symmetry_reduced: bool = False, edge_groups: list = None,
+                 mod_3: bool = False):
+        self.directory = directory  # the directory the pattern databases (and their checkpoints) are saved in
+        self.workers = workers or os.cpu_count()  # the number of processes that scan the depth tables
+        self.resume = resume  # whether saved pattern databases and checkpoints are carried on from
+        # the index space of each pattern database (with a pattern database for each group of edge cubie positions)
+        self.table_index_spaces = get_table_index_spaces(edge_groups)
+        self.table_names = table_names or list(self.table_index_spaces)  # the pattern databases to generate
+        self.symmetry_reduced = symmetry_reduced  # whether only one depth per symmetry class is saved
+        # the class the pattern databases are saved as (whether each depth is saved modulo 3 in 2 bits)
+        self.pattern_database_class = Mod3PatternDatabase if mod_3 else PackedPatternDatabase
+        self.summary = {}  # maps the table name to the statistics of its generation
+
+    def __scan_depth(self, table_name: str, shared_memory_name: str, depth: int, is_backward: bool,
+                     executor: ProcessPoolExecutor = None):
+        # scans every range of the depth table, logging the progress every PROGRESS_INTERVAL seconds
+        index_space = self.table_index_spaces[table_name]
+        size = index_space[0].number_of_hash_indexes
+        starts = range(0, size, RANGE_SIZE)
+        arguments = ([shared_memory_name] * len(starts), [index_space] * len(starts), starts,
+                     [min(start + RANGE_SIZE, size) for start in starts], [depth] * len(starts),
+                     [is_backward] * len(starts))
+        results = map(_expand_range, *arguments) if executor is None else executor.map(_expand_range, *arguments)
+
+        start_time = last_progress_time = time.perf_counter()
+        hash_indexes_expanded = 0
+        for ranges_scanned, range_hash_indexes_expanded in enumerate(results, start=1):
+            hash_indexes_expanded += range_hash_indexes_expanded
+            if time.perf_counter() - last_progress_time >= PROGRESS_INTERVAL and ranges_scanned < len(starts):
+                last_progress_time = time.perf_counter()
+                elapsed_time = last_progress_time - start_time
+                logging.info(f"{table_name}: depth {depth} {ranges_scanned / len(starts):.0%} scanned "
+                             f"({hash_indexes_expanded / elapsed_time:.0f} hash indexes expanded per second, "
+                             f"ETA {elapsed_time / ranges_scanned * (len(starts) - ranges_scanned):.0f}s, "
+                             f"{_format_memory(_resident_memory())} resident)")
+
+    def __get_checkpoint_header(self, table_name: str, size: int) -> dict:
+        # the header fields (of its TableFile) that a checkpoint must have to be carried on from
+        return {'kind': 'pattern_database_checkpoint', 'table_name': table_name,
+                **get_index_scheme(self.table_index_spaces[table_name]),
+                'entry_bits': PackedPatternDatabase.ENTRY_BITS, 'size': size}
+
+    def __save_checkpoint(self, table_name: str, depth_table: np.ndarray, depth_counts: list):
+        # the depth table holds the frontier too (the hash indexes at the last depth), so the depth counts (in the
+        # header) and the packed depth table are enough to carry on from the last depth searched
+        header = dict(self.__get_checkpoint_header(table_name, len(depth_table)), depth_counts=depth_counts)
+        depths = PackedPatternDatabase.from_depth_bytes(depth_table, len(depth_table)).depths
+        TableFile(header, depths).save(get_checkpoint_path(self.directory, table_name))
+
+    def __load_checkpoint(self, table_name: str, depth_table: np.ndarray):
+        # fills the depth table from the table's checkpoint and returns its depth counts (None if there is no checkpoint)
+        path = get_checkpoint_path(self.directory, table_name)
+        if not os.path.exists(path):
+            return None
+        table_file = TableFile.open(path, self.__get_checkpoint_header(table_name, len(depth_table)))
+        header, depths = table_file.header, table_file.data
+
+        depth_table[:] = PackedPatternDatabase(len(depth_table), depths).to_depth_bytes()
+        depth_table[depth_table == UNKNOWN_DEPTH] = UNKNOWN_DEPTH_BYTE
+        logging.info(f"{table_name}: resuming from depth {len(header['depth_counts']) - 1}")
+        return header['depth_counts']
+
+    def __generate_table(self, table_name: str, executor: ProcessPoolExecutor = None) -> PackedPatternDatabase:
+        size = self.table_index_spaces[table_name][0].number_of_hash_indexes
+        # (the depth table is in shared memory so that every worker process can read and write it)
+        shared_memory = SharedMemory(create=True, size=size)
+        depth_table = _attach_depth_table(shared_memory.name)
+        try:
+            depth_counts = self.__load_checkpoint(table_name, depth_table) if self.resume else None
+            if depth_counts is None:
+                depth_table[:] = UNKNOWN_DEPTH_BYTE
+
+                # the search starts from the solved cube state (every cubie in its own position)
+                index_calculator, positions = self.table_index_spaces[table_name][:2]
+                solved_hash_index = index_calculator.calculate_hash_indexes(np.array([positions]),
+                                                                            np.zeros((1, len(positions))))
+                depth_table[solved_hash_index] = 0
+                depth_counts = [1]
+            unknown_count = size - sum(depth_counts)
+            start_time = time.perf_counter()
+            new_hash_indexes = 0  # the number of hash indexes given a depth by this run (not a checkpoint)
+            peak_resident_memory = _resident_memory()
+
+            # searches the next depth until a depth has no hash indexes
+            while depth_counts[-1]:
+                depth = len(depth_counts) - 1
+                is_backward = depth_counts[-1] > unknown_count
+                depth_start_time = time.perf_counter()
+                self.__scan_depth(table_name, shared_memory.name, depth, is_backward, executor)
+
+                depth_counts.append(int(np.count_nonzero(depth_table == depth + 1)))
+                unknown_count -= depth_counts[-1]
+                new_hash_indexes += depth_counts[-1]
+                depth_time = time.perf_counter() - depth_start_time
+                resident_memory = _resident_memory()
+                if resident_memory is not None:
+                    peak_resident_memory = max(peak_resident_memory, resident_memory)
+                logging.info(f"{table_name}: {depth_counts[-1]} hash indexes at depth {depth + 1} in {depth_time:.1f}s "
+                             f"({depth_counts[-1] / depth_time:.0f} per second, {(size - unknown_count) / size:.2%} "
+                             f"of the table filled, {_format_memory(resident_memory)} resident, "
+                             f"{'backward' if is_backward else 'forward'} scan)")
+                if depth_counts[-1]:
+                    self.__save_checkpoint(table_name, depth_table, depth_counts)
+
+            generation_time = time.perf_counter() - start_time
+            self.summary[table_name] = {
+                'size': size, 'depth_counts': depth_counts[:-1], 'fill_ratio': round((size - unknown_count) / size, 6),
+                'seconds': round(generation_time, 3), 'states_per_second': round(new_hash_indexes / generation_time, 3),
+                'peak_resident_memory': peak_resident_memory, 'workers': self.workers}
+            if self.symmetry_reduced:
+                symmetry_reduction = SymmetryReduction(*self.table_index_spaces[table_name])
+                self.summary[table_name]['symmetry_reduced_size'] = symmetry_reduction.size
+                return symmetry_reduction.reduce_depth_table(depth_table, self.pattern_database_class)
+            return self.pattern_database_class.from_depth_bytes(depth_table, size)
+        finally:
+            depth_table = None  # the shared memory cannot be closed while its buffer is still referenced
+            _detach_depth_table()
+            shared_memory.close()
+            shared_memory.unlink()
+
+    def generate(self) -> dict:
+        # index = hash index
+        # depth = smallest depth to achieve index = the min number of moves needed to solve the cube state with that index
+        # returns the summary of the pattern databases generated
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            for table_name in self.table_names:
+                saved_table_name = table_name + (SYMMETRY_REDUCED_SUFFIX if self.symmetry_reduced else '') \
+                    + (MOD_3_SUFFIX if self.pattern_database_class is Mod3PatternDatabase else '')
+                path = get_path(self.directory, saved_table_name)
+                checkpoint_path = get_checkpoint_path(self.directory, table_name)
+                if self.resume and os.path.exists(path) and not os.path.exists(checkpoint_path):
+                    logging.info(f"{table_name} pattern database already generated")
+                    continue
+
+                pattern_database = self.__generate_table(table_name, executor)
+                pattern_database.save(path, get_index_scheme(self.table_index_spaces[table_name],
+                                                             self.symmetry_reduced))
+                if os.path.exists(checkpoint_path):  # the checkpoint is only removed once the table is saved
+                    os.remove(checkpoint_path)
+                logging.info(f"{table_name} pattern database saved to '{path}'")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return self.summary
+
+
+def _parse_edge_group(edge_group: str) -> list:
+    # the edge cubie positions of a group such as '0-5' or '0,2,4-6'
+    positions = []
+    for part in edge_group.split(','):
+        first, _, last = part.partition('-')
+        positions.extend(range(int(first), int(last or first) + 1))
+    return positions
+
+
+def main(arguments: list = None):
+    parser = argparse.ArgumentParser(description='generates the pattern databases used by the optimal solver')
+    parser.add_argument('tables', nargs='*', metavar='table',
+                        help='the pattern databases to generate (default: all of them)')
+    parser.add_argument('-o', '--output', default=DEFAULT_DIRECTORY,
+                        help='the directory the pattern databases are saved in')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='the number of worker processes (default: the number of CPUs)')
+    parser.add_argument('--resume', action='store_true',
+                        help='carry on from the last depth checkpointed (and skip the pattern databases already saved)')
+    parser.add_argument('--symmetry-reduced', action='store_true',
+                        help='save one depth per symmetry class of cube states (smaller, slower to look up)')
+    parser.add_argument('--mod-3', action='store_true',
+                        help='save each depth modulo 3 in 2 bits (half the size, decoded from the depth of the parent)')
+    parser.add_argument('--edge-group', action='append', dest='edge_groups', metavar='POSITIONS',
+                        help="the edge cubie positions of an edge cubies pattern database, e.g. '0-5' (repeat for "
+                             "each group; default: the overlapping 0-6 and 6-11 groups). the positions are "
+                             f"{', '.join(f'{position}={name}' for position, name in enumerate(EDGE_POSITION_NAMES))}")
+    parser.add_argument('-s', '--summary', default='-',
+                        help="JSON file of the generation statistics ('-' for standard output)")
+    arguments = parser.parse_args(arguments)
+    edge_groups = None
+    if arguments.edge_groups is not None:
+        try:
+            edge_groups = [_parse_edge_group(edge_group) for edge_group in arguments.edge_groups]
+            table_names = list(get_table_index_spaces(edge_groups))
+        except ValueError as error:
+            parser.error(f'invalid edge group ({error})')
+    else:
+        table_names = list(get_table_index_spaces())
+    for table_name in arguments.tables:
+        if table_name not in table_names:
+            parser.error(f"unknown pattern database '{table_name}' (choose from {', '.join(table_names)})")
+
+    logging.basicConfig(level=logging.INFO, format="|%(asctime)s|%(name)s|%(levelname)s| %(message)s")
+    pattern_database_creator = PatternDatabaseCreator(arguments.output, arguments.workers, arguments.resume,
+                                                      arguments.tables, arguments.symmetry_reduced, edge_groups,
+                                                      arguments.mod_3)
+    summary = pattern_database_creator.generate()
+
+    # the summary is written once every pattern database is generated (the logs go to standard error)
+    if arguments.summary == '-':
+        print(json.dumps(summary, indent=2))
+    else:
+        with open(arguments.summary, 'w') as file:
+            json.dump(summary, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+import numpy as np
+from rubiks_cube_state_recognition.cube_state.CubeSymmetries import (
+    SYMMETRIES, CORNER_SYMMETRY_POSITIONS, CORNER_SYMMETRY_CUBIES, CORNER_SYMMETRY_ORIENTATIONS,
+    EDGE_SYMMETRY_POSITIONS, EDGE_SYMMETRY_CUBIES, EDGE_SYMMETRY_ORIENTATIONS)
+from rubiks_cube_state_recognition.pattern_database_creator.IndexCalculator import IndexCalculator
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import PackedPatternDatabase
+
+SYMMETRY_REDUCED_SUFFIX = '_symmetry_reduced'  # added to the table name of a symmetry reduced pattern database
+BATCH_SIZE = 1 << 16  # the number of hash indexes reduced together
+
+
+class SymmetryReduction:
+    """
+    maps the hash indexes of a pattern database to the hash indexes of their symmetry classes. a symmetry conjugates a
+    cube state into one the same number of moves from the solved cube state, so only one depth per class is stored.
+    only the symmetries that move the hashed positions onto themselves can be used (all 48 for the corner cubies,
+    fewer for the edge cubies). a class's hash indexes are its smallest cubie positions permutation with every
+    orientations permutation
+    """
+    def __init__(self, index_calculator: IndexCalculator, positions: tuple, number_of_orientations: int):
+        # (a pattern database's index space, as in TABLE_INDEX_SPACES)
+        self.index_calculator = index_calculator
+        self.positions = positions  # the hashed positions
+        self.number_of_orientations = number_of_orientations
+        number_of_cubies = self.index_calculator.number_of_cubies
+        self.orientations_multiplier = self.index_calculator.number_of_orientations_ranks
+
+        if number_of_cubies == 8:
+            symmetry_positions, symmetry_cubies, symmetry_orientations = (
+                CORNER_SYMMETRY_POSITIONS, CORNER_SYMMETRY_CUBIES, CORNER_SYMMETRY_ORIENTATIONS)
+        else:
+            symmetry_positions, symmetry_cubies, symmetry_orientations = (
+                EDGE_SYMMETRY_POSITIONS, EDGE_SYMMETRY_CUBIES, EDGE_SYMMETRY_ORIENTATIONS)
+
+        # the positions whose cubies the hash index holds (the last cubie is implied when every other one is hashed)
+        self.known_positions = list(range(number_of_cubies)) if len(self.positions) == number_of_cubies - 1 \
+            else list(self.positions)
+        self.symmetries = [symmetry for symmetry in range(len(SYMMETRIES))
+                           if sorted(symmetry_positions[symmetry][position] for position in self.known_positions)
+                           == self.known_positions]
+
+        # element = the column each known position's column is moved to, the cubie each cubie is recoloured as and the
+        # moved orientations of each known position (indexed by [symmetry][column][cubie][orientation])
+        self.moved_columns = np.array([[self.known_positions.index(symmetry_positions[symmetry][position])
+                                        for position in self.known_positions] for symmetry in self.symmetries])
+        self.moved_cubies = np.array([symmetry_cubies[symmetry] for symmetry in self.symmetries])
+        self.moved_orientations = np.array([[symmetry_orientations[symmetry][position]
+                                             for position in self.known_positions] for symmetry in self.symmetries])
+
+        # element = (known position, orientation base of the column it is moved to, moved orientations) for each
+        # hashed position a symmetry moves a known position to (used to reduce one hash index at a time)
+        self.orientation_conjugations = [
+            [(position, self.index_calculator.orientation_bases[
+                self.index_calculator.orientation_base_powers[self.moved_columns[symmetry_index][column]]],
+              symmetry_orientations[symmetry][position])
+             for column, position in enumerate(self.known_positions)
+             if self.moved_columns[symmetry_index][column] < len(self.positions)]
+            for symmetry_index, symmetry in enumerate(self.symmetries)]
+
+        self.__calculate_position_classes()
+        self.size = len(self.representative_position_ranks) * self.orientations_multiplier  # of the reduced table
+
+    def __known_cubies(self, hash_indexes: np.ndarray) -> tuple:
+        # the cubies (and orientations) in the known positions of every hash index
+        cubies, orientations = self.index_calculator.calculate_permutations(hash_indexes, len(self.positions))
+        if len(self.known_positions) > len(self.positions):
+            # the last cubie is the one not in another position, with the orientation that makes the total a multiple
+            # of the number of orientations
+            number_of_cubies = self.index_calculator.number_of_cubies
+            last_cubies = number_of_cubies * (number_of_cubies - 1) // 2 - cubies.sum(axis=1)
+            last_orientations = -orientations.sum(axis=1) % self.number_of_orientations
+            cubies = np.column_stack((cubies, last_cubies))
+            orientations = np.column_stack((orientations, last_orientations))
+        return cubies, orientations
+
+    def __conjugate(self, cubies: np.ndarray, orientations: np.ndarray, symmetry_index: int) -> tuple:
+        # the cubies (and orientations) in the known positions once conjugated by the symmetry
+        moved_cubies = np.empty_like(cubies)
+        moved_orientations = np.empty_like(orientations)
+        moved_columns = self.moved_columns[symmetry_index]
+        moved_cubies[:, moved_columns] = self.moved_cubies[symmetry_index][cubies]
+        moved_orientations[:, moved_columns] = self.moved_orientations[symmetry_index][
+            np.arange(len(self.known_positions)), cubies, orientations]
+        return moved_cubies, moved_orientations
+
+    def __calculate_position_classes(self):
+        # finds the class (and the symmetry that conjugates it into the class's representative) of every cubie
+        # positions permutation, from the smallest positions permutation each can be conjugated into
+        number_of_position_ranks = self.index_calculator.lehmer_bases[0] * self.index_calculator.number_of_cubies
+        representative_ranks = np.full(number_of_position_ranks, -1, dtype=np.int64)
+        self.position_rank_symmetries = np.zeros(number_of_position_ranks, dtype=np.uint8)
+
+        for start in range(0, number_of_position_ranks, BATCH_SIZE):
+            position_ranks = np.arange(start, min(start + BATCH_SIZE, number_of_position_ranks))
+            hash_indexes = position_ranks * self.orientations_multiplier
+            cubies, orientations = self.__known_cubies(hash_indexes)
+
+            # position ranks that no cubies have (gaps in the index space) decode to another position rank's cubies
+            is_valid = self.index_calculator.calculate_hash_indexes(
+                cubies[:, :len(self.positions)], orientations[:, :len(self.positions)]) == hash_indexes
+            conjugated_ranks = np.empty((len(self.symmetries), len(position_ranks)), dtype=np.int64)
+            for symmetry_index in range(len(self.symmetries)):
+                moved_cubies, _ = self.__conjugate(cubies, orientations, symmetry_index)
+                conjugated_ranks[symmetry_index] = self.index_calculator.calculate_hash_indexes(
+                    moved_cubies[:, :len(self.positions)],
+                    np.zeros((len(position_ranks), len(self.positions)), dtype=np.int64)) // self.orientations_multiplier
+            symmetry_indexes = np.argmin(conjugated_ranks, axis=0)
+            representative_ranks[start:start + len(position_ranks)] = np.where(
+                is_valid, conjugated_ranks[symmetry_indexes, np.arange(len(position_ranks))], -1)
+            self.position_rank_symmetries[start:start + len(position_ranks)] = symmetry_indexes
+
+        self.representative_position_ranks = np.unique(representative_ranks[representative_ranks >= 0])
+        self.position_rank_classes = np.where(
+            representative_ranks >= 0, np.searchsorted(self.representative_position_ranks, representative_ranks),
+            -1).astype(np.int32)
+
+    def reduce_hash_indexes(self, hash_indexes: np.ndarray) -> np.ndarray:
+        # the reduced hash index of every (valid) hash index
+        position_ranks = hash_indexes // self.orientations_multiplier
+        symmetry_indexes = self.position_rank_symmetries[position_ranks]
+        cubies, orientations = self.__known_cubies(hash_indexes)
+
+        reduced_hash_indexes = self.position_rank_classes[position_ranks].astype(np.int64) * self.orientations_multiplier
+        for symmetry_index in np.unique(symmetry_indexes):
+            is_conjugated = symmetry_indexes == symmetry_index
+            moved_cubies, moved_orientations = self.__conjugate(cubies[is_conjugated], orientations[is_conjugated],
+                                                                symmetry_index)
+            # (the positions permutation is the representative's, so only the orientations rank is added)
+            reduced_hash_indexes[is_conjugated] += self.index_calculator.calculate_hash_indexes(
+                np.zeros_like(moved_cubies[:, :len(self.positions)]),
+                moved_orientations[:, :len(self.positions)])
+        return reduced_hash_indexes
+
+    def reduce_hash_index(self, hash_index: int, cubies: tuple, orientations: tuple) -> int:
+        # the reduced hash index of the cube state with the hash index and these cubies (and orientations) in every
+        # position (e.g. CubieCube.cp and CubieCube.co)
+        position_rank = hash_index // self.orientations_multiplier
+        orientations_rank = 0
+        for position, orientation_base, moved_orientations in \
+                self.orientation_conjugations[self.position_rank_symmetries[position_rank]]:
+            orientations_rank += orientation_base * moved_orientations[cubies[position]][orientations[position]]
+        return int(self.position_rank_classes[position_rank]) * self.orientations_multiplier + orientations_rank
+
+    def representative_hash_indexes(self, start: int, stop: int) -> np.ndarray:
+        # the (unreduced) hash index of the cube state stored at each reduced hash index from start to stop
+        reduced_hash_indexes = np.arange(start, stop)
+        classes, orientations_ranks = np.divmod(reduced_hash_indexes, self.orientations_multiplier)
+        return self.representative_position_ranks[classes] * self.orientations_multiplier + orientations_ranks
+
+    def reduce_depth_table(self, depth_table: np.ndarray,
+                           pattern_database_class: type = PackedPatternDatabase) -> PackedPatternDatabase:
+        # the symmetry reduced pattern database of a depth table (one byte per hash index)
+        reduced_depth_table = np.empty(self.size, dtype=np.uint8)
+        for start in range(0, self.size, BATCH_SIZE * 16):
+            stop = min(start + BATCH_SIZE * 16, self.size)
+            reduced_depth_table[start:stop] = depth_table[self.representative_hash_indexes(start, stop)]
+        return pattern_database_class.from_depth_bytes(reduced_depth_table, self.size)
@@ -0,0 +1,88 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+
+TABLE_FILE_MAGIC = b'RCSRTBL\n'  # the first bytes of every table file
+TABLE_FILE_VERSION = 1  # changed whenever the layout of the files (or of a table kind's entries) changes
+PREFIX_FORMAT = '<8sII'  # magic, version and the length of the header (little endian)
+DATA_ALIGNMENT = 64  # the header is padded so the table's entries start at a multiple of this many bytes
+
+
+class TableFile:
+    """
+    a precomputed table (pattern database, checkpoint, move table or pruning table) saved with a header that describes
+    it. the file is TABLE_FILE_MAGIC, the version and the header length, a JSON header (the table kind, cubies, index
+    scheme, entry width, number of entries, data length and CRC-32 checksum of the data) padded with spaces, and then
+    the raw entries, so a memory mapped table is used without copying it (e.g. with numpy.frombuffer)
+    """
+    def __init__(self, header: dict, data, mapping: mmap.mmap = None):
+        self.header = header  # the fields that describe the table
+        self.data = data  # the table's entries (bytes-like, a memoryview of the mapping if memory mapped)
+        self.mapping = mapping  # the read-only memory map of the file (None if it was read into memory)
+
+    def save(self, path: str):
+        # the file is written under a temporary name and then renamed, so it is never left half written (the name is
+        # unique to the process, so processes saving the same table at once do not write into each other's files)
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        header = dict(self.header, data_length=len(self.data), checksum=zlib.crc32(self.data))
+        encoded_header = json.dumps(header).encode()
+        prefix_size = struct.calcsize(PREFIX_FORMAT)
+        header_length = -(-(prefix_size + len(encoded_header)) // DATA_ALIGNMENT) * DATA_ALIGNMENT - prefix_size
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(temporary_path, 'wb') as file:
+            file.write(struct.pack(PREFIX_FORMAT, TABLE_FILE_MAGIC, TABLE_FILE_VERSION, header_length))
+            file.write(encoded_header.ljust(header_length))
+            file.write(self.data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+        self.header = header
+
+    @classmethod
+    def open(cls, path: str, expected_header: dict, memory_map: bool = False,
+             verify_checksum: bool = None) -> "TableFile":
+        """
+        reads (or memory maps) a table file, raising ValueError straight away if it is not a table file, is of another
+        version, is incomplete or has a header field that is not the expected one (e.g. a stale table of another
+        index scheme). the checksum is verified by default only when the file is read, as verifying a memory mapped
+        file reads every page of it
+        """
+        if verify_checksum is None:
+            verify_checksum = not memory_map
+        with open(path, 'rb') as file:
+            prefix = file.read(struct.calcsize(PREFIX_FORMAT))
+            if len(prefix) < struct.calcsize(PREFIX_FORMAT) or prefix[:len(TABLE_FILE_MAGIC)] != TABLE_FILE_MAGIC:
+                raise ValueError(f"'{path}' is not a table file (tables saved before versioning must be regenerated)")
+            _, version, header_length = struct.unpack(PREFIX_FORMAT, prefix)
+            if version != TABLE_FILE_VERSION:
+                raise ValueError(f"'{path}' is a version {version} table file instead of version {TABLE_FILE_VERSION}")
+            header = json.loads(file.read(header_length))
+            for field, value in expected_header.items():
+                if header.get(field) != value:
+                    raise ValueError(f"'{path}' has {field} {header.get(field)!r} instead of {value!r}")
+
+            data_offset = len(prefix) + header_length
+            if os.fstat(file.fileno()).st_size != data_offset + header['data_length']:
+                raise ValueError(f"'{path}' is incomplete (or has extra data)")
+            if memory_map:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                data = memoryview(mapping)[data_offset:]
+            else:
+                mapping = None
+                data = bytearray(file.read())
+
+        table_file = cls(header, data, mapping)
+        if verify_checksum and zlib.crc32(data) != header['checksum']:
+            table_file.close()
+            raise ValueError(f"'{path}' does not match its checksum (it is corrupt)")
+        return table_file
+
+    def close(self):
+        # unmaps a memory mapped table file (the view of the data is released first, as the map cannot be closed
+        # while it is exported)
+        if self.mapping is not None:
+            self.data.release()
+            self.mapping.close()
+            self.mapping = None
@@ -0,0 +1,144 @@
+import logging
+import time
+from rubiks_cube_state_recognition.solution_finder.SearchPhase import DEFAULT_TABLE_DIRECTORY, SearchPhase
+from rubiks_cube_state_recognition.solution_finder.ThistlethwaiteSolver import (E_SLICE_EDGES, M_SLICE_EDGES,
+                                                                               S_SLICE_EDGES, ThistlethwaiteSolver)
+from rubiks_cube_state_recognition.cube_state.CubieCube import (CubieCube, CORNER_ORIENTED_COLOURS,
+                                                                EDGE_ORIENTED_COLOURS)
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPES, COLOUR_TO_CODE
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from rubiks_cube_state_recognition.cube_state.CubeState import CubeState
+
+# the moves that keep the cube state in G1 = <U, D, F2, B2, L2, R2>
+G1_TURN_TYPES = ['U', "U'", 'U2', 'D', "D'", 'D2', 'F2', 'B2', 'L2', 'R2']
+
+# the most moves phase 2 is searched to (longer phase 2 searches are slow, and a longer phase 1 solution with a shorter
+# phase 2 solution is soon found instead)
+PHASE_2_MAX_DEPTH = 11
+
+# the edge positions of the U and D layers (the edge positions that are not in the E slice)
+UD_LAYER_EDGES = S_SLICE_EDGES + M_SLICE_EDGES
+
+UD_COLOURS = (COLOUR_TO_CODE['w'], COLOUR_TO_CODE['y'])
+FB_COLOURS = (COLOUR_TO_CODE['r'], COLOUR_TO_CODE['o'])
+
+# element = the tile (in the corner position's tile order) with the cubie's U/D colour, indexed by [cubie][orientation]
+CORNER_UD_TILES = [[next(tile for tile, colour in enumerate(colours) if colour in UD_COLOURS)
+                    for colours in oriented_colours] for oriented_colours in CORNER_ORIENTED_COLOURS]
+
+# element = the tile (in the edge position's tile order) with the cubie's U/D colour (or F/B colour if it has no U/D
+# colour), indexed by [cubie][orientation]
+EDGE_REFERENCE_TILES = [[next(tile for tile, colour in enumerate(colours) if colour in UD_COLOURS)
+                         if set(colours) & set(UD_COLOURS) else
+                         next(tile for tile, colour in enumerate(colours) if colour in FB_COLOURS)
+                         for colours in oriented_colours] for oriented_colours in EDGE_ORIENTED_COLOURS]
+
+
+def _corner_ud_orientations_key(cubie_cube: CubieCube) -> tuple:
+    # the tiles holding U/D colours, which only U, D and half turns keep on the U and D faces
+    return tuple(CORNER_UD_TILES[cubie][orientation] for cubie, orientation in zip(cubie_cube.cp, cubie_cube.co))
+
+
+def _edge_orientations_key(cubie_cube: CubieCube) -> tuple:
+    # the tiles holding U/D (or F/B) colours, which only F, F', B and B' move off the U/D (or F/B) tiles
+    return tuple(EDGE_REFERENCE_TILES[cubie][orientation] for cubie, orientation in zip(cubie_cube.ep, cubie_cube.eo))
+
+
+def _e_slice_positions_key(cubie_cube: CubieCube) -> tuple:
+    return tuple(cubie in E_SLICE_EDGES for cubie in cubie_cube.ep)
+
+
+def _corner_permutation_key(cubie_cube: CubieCube) -> tuple:
+    return cubie_cube.cp
+
+
+def _ud_layer_edge_permutation_key(cubie_cube: CubieCube) -> tuple:
+    return tuple(cubie_cube.ep[position] for position in UD_LAYER_EDGES)
+
+
+def _e_slice_permutation_key(cubie_cube: CubieCube) -> tuple:
+    return tuple(cubie_cube.ep[position] for position in E_SLICE_EDGES)
+
+
+class KociembaSolver:
+    """
+    two-phase solver: phase 1 moves the cube state into G1 = <U, D, F2, B2, L2, R2> and phase 2 solves it with G1
+    moves. longer phase 1 solutions are tried until the solution is at most target_length moves or time_limit
+    seconds have passed, keeping the shortest solution found. the time limit is checked inside both phases' searches,
+    and if no solution is found before it, the (longer) Thistlethwaite solution is used instead, which is found in a
+    few milliseconds. the phases' tables are saved in table_directory the first time they are built (None to build
+    them every time)
+    """
+    def __init__(self, target_length: int = 22, time_limit: float = 2, phase_2_max_depth: int = PHASE_2_MAX_DEPTH,
+                 table_directory: str = DEFAULT_TABLE_DIRECTORY):
+        self.target_length = target_length  # the solution length that is short enough to stop searching
+        self.time_limit = time_limit  # the time (seconds) after which the shortest solution found so far is used
+        self.phase_2_max_depth = phase_2_max_depth
+
+        # solves the cube state if no two-phase solution is found within the time limit
+        self.fallback_solver = ThistlethwaiteSolver(table_directory=table_directory)
+
+        self.phases = [
+            # G0 -> G1: orients the corner and edge cubies and moves the E slice edge cubies into the E slice
+            # (2187 x 2048 x 495 states, pruned by the corner orientations and edge orientations with the E slice)
+            SearchPhase('G0 -> G1', TURN_TYPES,
+                        [_corner_ud_orientations_key, _edge_orientations_key, _e_slice_positions_key],
+                        pruning_groups=[(0, 2), (1, 2)], table_name='kociemba_g0_to_g1',
+                        table_directory=table_directory),
+
+            # G1 -> solved: permutes the corner cubies, the U and D layer edge cubies and the E slice edge cubies
+            # (40320 x 40320 x 24 states, pruned by the corner and the U and D layer edge permutations with the E slice)
+            SearchPhase('G1 -> solved', G1_TURN_TYPES,
+                        [_corner_permutation_key, _ud_layer_edge_permutation_key, _e_slice_permutation_key],
+                        pruning_groups=[(0, 2), (1, 2)], table_name='kociemba_g1_to_solved',
+                        table_directory=table_directory)]
+
+        self.solution = None  # list of the turn moves required to solve the Rubik's cube
+
+    def load_tables(self):
+        # loads (or builds) the move and pruning tables of both phases and of the fallback solver (done once, on the
+        # first solve if not called before)
+        for phase in self.phases:
+            phase.load_tables()
+        self.fallback_solver.load_tables()
+
+    def solve(self, cube_state: "CubeState"):
+        self.load_tables()
+        phase_1, phase_2 = self.phases
+        cubie_cube = CubieCube.from_cube_state(cube_state)
+        deadline = time.perf_counter() + self.time_limit
+        moves = None  # the shortest solution found so far
+
+        # both phases' searches stop at the deadline (a phase 2 search stopped by it gives no solution)
+        for phase_1_moves in phase_1.generate_solutions(cubie_cube, deadline=deadline):
+            if time.perf_counter() > deadline or (moves is not None and (len(phase_1_moves) >= len(moves)
+                                                                         or len(moves) <= self.target_length)):
+                break
+
+            # a phase 1 solution ending with a G1 move is a shorter phase 1 solution followed by a phase 2 move
+            if phase_1_moves and phase_1_moves[-1] in phase_2.moves:
+                continue
+
+            g1_cubie_cube = cubie_cube
+            for move in phase_1_moves:
+                g1_cubie_cube = g1_cubie_cube.turn(move)
+
+            # phase 2 only needs to be solved if it beats the shortest solution found so far
+            max_depth = self.phase_2_max_depth
+            if moves is not None:
+                max_depth = min(max_depth, len(moves) - len(phase_1_moves) - 1)
+            phase_2_moves = phase_2.solve(g1_cubie_cube, last_move=phase_1_moves[-1] if phase_1_moves else None,
+                                          max_depth=max_depth, deadline=deadline)
+            if phase_2_moves is not None:
+                moves = phase_1_moves + phase_2_moves
+                logging.info(f"found a {len(moves)} move solution ({len(phase_1_moves)} + {len(phase_2_moves)})")
+
+        if moves is None:
+            logging.info(f"no solution found in {self.time_limit} seconds, so the Thistlethwaite solution is used")
+            self.solution = self.fallback_solver.solve(cube_state)
+            return self.solution
+
+        self.solution = [TURN_TYPES[move] for move in moves]
+        logging.info('solved')
+        return self.solution
@@ -0,0 +1,213 @@
+import logging
+import os
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import (
+    DEFAULT_DIRECTORY, UNKNOWN_DEPTH, PackedPatternDatabase, get_index_scheme, get_path, get_table_index_spaces)
+from rubiks_cube_state_recognition.pattern_database_creator.Mod3PatternDatabase import (MOD_3_SUFFIX,
+                                                                                       Mod3PatternDatabase)
+from rubiks_cube_state_recognition.pattern_database_creator.MoveTable import MoveTable
+from rubiks_cube_state_recognition.solution_finder.TranspositionTable import (KEY_MASK, DEFAULT_MEMORY_LIMIT,
+                                                                             TranspositionTable)
+from rubiks_cube_state_recognition.cube_state.CubieCube import MOVE_CUBES, CubieCube
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPES
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from rubiks_cube_state_recognition.cube_state.CubeState import CubeState
+
+
+class OptimalSolver:
+    """
+    finds the shortest solution with IDA*, using the pattern databases made by PatternDatabaseCreator as the heuristic
+    (the largest of the corner cubies, edge cubies 1 and edge cubies 2 depths, or of the edge cubies groups' depths).
+    moves are made before the cube state's moves (as in PatternDatabaseCreator), so each child's hash indexes are
+    looked up in the move tables from its parent's, and the path found is reversed. with pattern databases stored
+    modulo 3, the depths of each node are decoded from the depths of its parent (a pattern database's depth is only
+    within 1 of its parent's when moves are made this way), and the depths of the cube state being solved are found by
+    following decreasing depths to the solved cube state
+    """
+    def __init__(self, pattern_database_directory: str = DEFAULT_DIRECTORY,
+                 transposition_table_memory_limit: int = DEFAULT_MEMORY_LIMIT, memory_map: bool = True,
+                 symmetry_reduced: bool = False, edge_groups: list = None, mod_3: bool = False):
+        self.pattern_database_directory = pattern_database_directory
+        self.memory_map = memory_map  # whether the pattern databases are memory mapped instead of read into memory
+        self.symmetry_reduced = symmetry_reduced  # whether the symmetry reduced pattern databases are used
+        self.mod_3 = mod_3  # whether the pattern databases stored modulo 3 are used (which must be complete)
+        # the index space of each pattern database (the edge groups must be the ones the pattern databases were
+        # generated with)
+        self.table_index_spaces = get_table_index_spaces(edge_groups)
+
+        # the corner_cubies and edge cubies pattern databases
+        # (a hash index with no depth is counted as depth 0, which is still a lower bound)
+        self.pattern_databases = None
+        self.symmetry_reductions = None  # the symmetry reduction of each pattern database (if symmetry reduced)
+        self.move_tables = None  # the move table of each pattern database's hash indexes (saved with the databases)
+
+        # the states (with the face turned to reach them) already searched without finding a solution, in bytes
+        self.transposition_table = TranspositionTable(transposition_table_memory_limit)
+
+        self.path = None  # the moves of the search's current path
+        self.nodes_searched = None  # the number of nodes the last solve generated
+        self.solution = None  # list of the turn moves required to solve the Rubik's cube
+
+    def load_tables(self):
+        if self.pattern_databases is not None:  # the pattern databases only need to be loaded once
+            return
+
+        pattern_databases = []
+        symmetry_reductions = []
+        move_tables = []
+        for table_name, index_space in self.table_index_spaces.items():
+            move_tables.append(MoveTable.load_or_build(self.pattern_database_directory, table_name, index_space,
+                                                       self.memory_map))
+            size = index_space[0].number_of_hash_indexes
+            if self.symmetry_reduced:
+                # (imported only when used, as the symmetry tables of CubeSymmetries are calculated when it is imported)
+                from rubiks_cube_state_recognition.pattern_database_creator.SymmetryReduction import (
+                    SYMMETRY_REDUCED_SUFFIX, SymmetryReduction)
+                symmetry_reductions.append(SymmetryReduction(*index_space))
+                size = symmetry_reductions[-1].size
+                table_name += SYMMETRY_REDUCED_SUFFIX
+            if self.mod_3:
+                table_name += MOD_3_SUFFIX
+            path = get_path(self.pattern_database_directory, table_name)
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"pattern database '{path}' does not exist (made by PatternDatabaseCreator)")
+            pattern_database_class = Mod3PatternDatabase if self.mod_3 else PackedPatternDatabase
+            index_scheme = get_index_scheme(index_space, self.symmetry_reduced)
+            if self.memory_map:
+                pattern_databases.append(pattern_database_class.memory_map(path, size, index_scheme))
+            else:
+                pattern_databases.append(pattern_database_class.load(path, size, index_scheme))
+        self.pattern_databases = pattern_databases
+        self.symmetry_reductions = symmetry_reductions or None
+        self.move_tables = move_tables
+        logging.info(f"pattern databases {'memory mapped' if self.memory_map else 'loaded'}")
+
+    def __get_hash_indexes(self, cubie_cube: CubieCube) -> list:
+        # the hash index of the cube state in each pattern database's index space (ranked from its cubies, which the
+        # search only does for the cube state being solved)
+        hash_indexes = []
+        for index_calculator, positions, _ in self.table_index_spaces.values():
+            # the cubies (and orientations) in every position of the pattern database's cubies (corners/edges)
+            cubies, orientations = (cubie_cube.cp, cubie_cube.co) if index_calculator.number_of_cubies == 8 \
+                else (cubie_cube.ep, cubie_cube.eo)
+            hash_indexes.append(index_calculator.calculate_hash_index(
+                [cubies[position] for position in positions], [orientations[position] for position in positions]))
+        return hash_indexes
+
+    def __get_child_hash_indexes(self, hash_indexes: list, move: int) -> list:
+        # the hash indexes of the cube state reached by making the move before the moves of the hash indexes' one
+        return [move_table.get_child_hash_index(hash_index, move)
+                for move_table, hash_index in zip(self.move_tables, hash_indexes)]
+
+    def __get_table_index(self, table: int, hash_index: int, cubie_cube: CubieCube) -> int:
+        # the index of the cube state's depth in the pattern database (its symmetry class's, if symmetry reduced)
+        if self.symmetry_reductions is None:
+            return hash_index
+        symmetry_reduction = self.symmetry_reductions[table]
+        if symmetry_reduction.index_calculator.number_of_cubies == 8:
+            return symmetry_reduction.reduce_hash_index(hash_index, cubie_cube.cp, cubie_cube.co)
+        return symmetry_reduction.reduce_hash_index(hash_index, cubie_cube.ep, cubie_cube.eo)
+
+    def heuristic(self, cubie_cube: CubieCube, hash_indexes: list = None) -> int:
+        # lower bound of the number of moves needed to solve the cube state (with nibble packed pattern databases)
+        if hash_indexes is None:
+            hash_indexes = self.__get_hash_indexes(cubie_cube)
+        distance = 0
+        for table, (pattern_database, hash_index) in enumerate(zip(self.pattern_databases, hash_indexes)):
+            depth = pattern_database.get_depth(self.__get_table_index(table, hash_index, cubie_cube))
+            if depth != UNKNOWN_DEPTH and depth > distance:
+                distance = depth
+        return distance
+
+    def __get_child_depths(self, cubie_cube: CubieCube, hash_indexes: list, parent_depths: list) -> list:
+        # the depth of the cube state in each pattern database stored modulo 3, from the depths of its parent
+        return [pattern_database.get_depth(self.__get_table_index(table, hash_index, cubie_cube), parent_depth)
+                for table, (pattern_database, hash_index, parent_depth)
+                in enumerate(zip(self.pattern_databases, hash_indexes, parent_depths))]
+
+    def __get_exact_depths(self, cubie_cube: CubieCube) -> list:
+        # the depth of the cube state in each pattern database stored modulo 3: the number of turns to the solved
+        # cube state's hash index, each turning to a cube state whose depth is one less (which always exists)
+        solved_hash_indexes = self.__get_hash_indexes(CubieCube())
+        depths = []
+        for table, (pattern_database, move_table) in enumerate(zip(self.pattern_databases, self.move_tables)):
+            depth = 0
+            descendant_cubie_cube = cubie_cube
+            hash_index = self.__get_hash_indexes(descendant_cubie_cube)[table]
+            depth_mod_3 = pattern_database.get_depth_mod_3(self.__get_table_index(table, hash_index, cubie_cube))
+            while hash_index != solved_hash_indexes[table]:
+                smaller_depth_mod_3 = (depth_mod_3 - 1) % 3
+                for move in range(len(TURN_TYPES)):
+                    child_cubie_cube = MOVE_CUBES[move].multiply(descendant_cubie_cube)
+                    child_hash_index = move_table.get_child_hash_index(hash_index, move)
+                    if pattern_database.get_depth_mod_3(
+                            self.__get_table_index(table, child_hash_index, child_cubie_cube)) == smaller_depth_mod_3:
+                        break
+                else:
+                    raise ValueError(f'pattern database {table} is not complete (no turn reduces the depth)')
+                descendant_cubie_cube = child_cubie_cube
+                hash_index = child_hash_index
+                depth_mod_3 = smaller_depth_mod_3
+                depth += 1
+            depths.append(depth)
+        return depths
+
+    def __depth_first_search(self, cubie_cube: CubieCube, hash_indexes: list, remaining_depth: int, last_face: int,
+                             depths: list = None) -> bool:
+        # (hash_indexes = the cube state's hash index in each pattern database's index space, depths = its depth in
+        # each pattern database, if they are stored modulo 3)
+        if remaining_depth == 0:
+            return cubie_cube.is_solved()
+
+        # the last face is part of the key as it changes which moves are searched from the state
+        state_key = hash((cubie_cube, last_face)) & KEY_MASK
+        if self.transposition_table.was_searched(state_key, remaining_depth):
+            return False
+
+        for move in range(len(TURN_TYPES)):
+            face = move // 3
+            # a face is never turned twice in a row, and opposite faces are only turned in one order
+            if face == last_face or (face // 2 == last_face // 2 and face < last_face):
+                continue
+
+            child_cubie_cube = MOVE_CUBES[move].multiply(cubie_cube)
+            child_hash_indexes = self.__get_child_hash_indexes(hash_indexes, move)
+            self.nodes_searched += 1
+            if depths is None:
+                child_depths = None
+                heuristic = self.heuristic(child_cubie_cube, child_hash_indexes)
+            else:
+                child_depths = self.__get_child_depths(child_cubie_cube, child_hash_indexes, depths)
+                heuristic = max(child_depths)
+            if heuristic < remaining_depth:
+                self.path.append(move)
+                if self.__depth_first_search(child_cubie_cube, child_hash_indexes, remaining_depth - 1, face,
+                                             child_depths):
+                    return True
+                self.path.pop()
+
+        self.transposition_table.store(state_key, remaining_depth)
+        return False
+
+    def solve(self, cube_state: "CubeState"):
+        self.load_tables()
+        cubie_cube = CubieCube.from_cube_state(cube_state)
+        self.nodes_searched = 0
+        self.transposition_table.clear()
+
+        # iterative deepening, each iteration bounded by the heuristic's lower bound
+        hash_indexes = self.__get_hash_indexes(cubie_cube)
+        depths = self.__get_exact_depths(cubie_cube) if self.mod_3 else None
+        depth_bound = self.heuristic(cubie_cube, hash_indexes) if depths is None else max(depths)
+        while True:
+            logging.info(f"searching depth {depth_bound} ({self.nodes_searched} nodes searched so far)")
+            self.path = []
+            if self.__depth_first_search(cubie_cube, hash_indexes, depth_bound, -1, depths):
+                break
+            depth_bound += 1
+        self.path.reverse()  # (the moves were made before the cube state's moves)
+
+        self.solution = [TURN_TYPES[move] for move in self.path]
+        logging.info(f"solved in {len(self.solution)} moves ({self.nodes_searched} nodes searched, "
+                     f"{self.transposition_table.hits} transposition table hits)")
+        return self.solution
@@ -0,0 +1,362 @@
+import logging
+import os
+import time
+import numpy as np
+from rubiks_cube_state_recognition.pattern_database_creator.TableFile import TableFile
+from rubiks_cube_state_recognition.cube_state.CubieCube import CubieCube
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPE_TO_MOVE, INVERSE_MOVES
+
+UNKNOWN_DISTANCE = 255  # pruning table value of a coordinate that has not been reached yet
+DEFAULT_TABLE_DIRECTORY = 'solver_tables'  # the directory the phases' move and pruning tables are saved in
+MOVE_TABLE_DTYPE = np.dtype('<i4')  # the type of the move table entries in the table files (little endian)
+COORDINATE_KEY_DTYPE = np.dtype(np.uint8)  # the type of the coordinate keys' values in the table files
+
+
+def build_move_table(coordinate_key, moves: list) -> tuple:
+    """
+    numbers every value of a coordinate reachable from the solved cube state with the moves (solved = 0) and
+    tabulates the coordinate reached by each move. coordinate_key maps a CubieCube to a hashable key, which must only
+    depend on the part of the cube state the coordinate describes
+    """
+    solved_cube = CubieCube()
+    key_to_coordinate = {coordinate_key(solved_cube): 0}
+    representatives = [solved_cube]  # element = a cube state with that coordinate
+    move_table = []  # element = the coordinates reached by each move from that coordinate
+
+    # breadth-first search over the coordinate values (the representatives list is the queue)
+    for representative in representatives:
+        coordinates_after_moves = []
+        for move in moves:
+            child_cube = representative.turn(move)
+            child_key = coordinate_key(child_cube)
+            if child_key not in key_to_coordinate:
+                key_to_coordinate[child_key] = len(representatives)
+                representatives.append(child_cube)
+            coordinates_after_moves.append(key_to_coordinate[child_key])
+        move_table.append(coordinates_after_moves)
+
+    return key_to_coordinate, move_table
+
+
+def build_pruning_table(move_tables: list) -> bytearray:
+    """
+    exact distance (in moves) from every combined coordinate to the solved combined coordinate (all 0).
+    the combined coordinate of (c0, c1, ..., cn) is ((c0 * size1 + c1) * size2 + ...) + cn
+    """
+    move_arrays = [np.array(move_table, dtype=np.int64) for move_table in move_tables]
+    sizes = [len(move_table) for move_table in move_tables]
+    number_of_moves = move_arrays[0].shape[1]
+
+    distances = np.full(int(np.prod(sizes)), UNKNOWN_DISTANCE, dtype=np.uint8)
+    distances[0] = 0
+    frontier = np.array([0], dtype=np.int64)
+    depth = 0
+
+    # breadth-first search over the combined coordinates, one whole depth at a time
+    while frontier.size:
+        # splits the combined coordinates of the frontier into the separate coordinates
+        coordinates = []
+        remainder = frontier
+        for size in reversed(sizes[1:]):
+            remainder, coordinate = np.divmod(remainder, size)
+            coordinates.append(coordinate)
+        coordinates.append(remainder)
+        coordinates.reverse()
+
+        depth += 1
+        for move_position in range(number_of_moves):
+            child = np.zeros_like(frontier)
+            for move_array, coordinate, size in zip(move_arrays, coordinates, sizes):
+                child = child * size + move_array[coordinate, move_position]
+            distances[child[distances[child] == UNKNOWN_DISTANCE]] = depth
+
+        frontier = np.flatnonzero(distances == depth)
+
+    return bytearray(distances.tobytes())
+
+
+class SearchPhase:
+    """
+    one step of a multi-phase solver: moves a cube state into the target group (every coordinate solved) using only
+    the phase's moves, with an IDA* search guided by exact pruning tables. in bidirectional mode the pruning tables
+    are not built and a breadth-first search is run from both the cube state and the target instead
+    """
+    def __init__(self, name: str, turn_types: list, coordinate_keys: list, pruning_groups: list = None,
+                 bidirectional: bool = False, table_name: str = None, table_directory: str = DEFAULT_TABLE_DIRECTORY):
+        self.name = name  # the name of the phase (for logging)
+        self.moves = [TURN_TYPE_TO_MOVE[turn_type] for turn_type in turn_types]  # the moves allowed in the phase
+        self.faces = [move // 3 for move in self.moves]  # the face turned by each move
+
+        # element = the move position of the move that undoes the move at that position (the moves are closed under
+        # inverses, so searching backwards from the target uses the same move tables)
+        self.inverse_move_positions = [self.moves.index(INVERSE_MOVES[move]) for move in self.moves]
+        self.bidirectional = bidirectional
+        self.coordinate_keys = coordinate_keys  # functions that find the key of each coordinate of a CubieCube
+
+        # the coordinates (by position in coordinate_keys) combined in each pruning table (default: all in one table)
+        self.pruning_groups = pruning_groups or [tuple(range(len(coordinate_keys)))]
+
+        # the tables are saved in the directory as <table name>.bin the first time they are built, and loaded from
+        # there afterwards (if either is None, the tables are built every time)
+        self.table_name = table_name
+        self.table_directory = table_directory
+
+        self.key_to_coordinates = None  # element = maps the coordinate key to the coordinate
+        self.move_tables = None  # element = [coordinate][move position] -> coordinate after the move
+        self.pruning_tables = None  # element = [combined coordinate of the pruning group] -> distance to solved
+        self.pruning_lookups = None  # element = (pruning table, coordinate positions, multiplier of each coordinate)
+
+        self.path = None  # the move positions of the search's current path
+        self.deadline = None  # the time.perf_counter() time at which the search stops (None = no time limit)
+
+    def get_table_path(self):
+        # the path of the file the tables are saved in (None if they are not saved)
+        if self.table_name is None or self.table_directory is None:
+            return None
+        suffix = '_bidirectional' if self.bidirectional else ''  # (bidirectional phases have no pruning tables)
+        return os.path.join(self.table_directory, f'{self.table_name}{suffix}.bin')
+
+    def get_header(self) -> dict:
+        # the header fields a TableFile of the phase's tables must have (the coordinate sizes and key lengths that
+        # are also saved in the header are only known once the tables are built)
+        return {'kind': 'search_phase_tables', 'phase': self.name, 'moves': self.moves,
+                'coordinate_keys': [f'{coordinate_key.__module__}.{coordinate_key.__qualname__}'
+                                    for coordinate_key in self.coordinate_keys],
+                'pruning_groups': [] if self.bidirectional else [list(group) for group in self.pruning_groups]}
+
+    def load_tables(self):
+        # loads the tables from their file, or builds them (and saves them) if there is no file or it is stale
+        if self.move_tables is not None:  # the tables only need to be loaded once
+            return
+
+        path = self.get_table_path()
+        if path is not None and os.path.exists(path):
+            try:
+                self.__read_tables(path)
+                logging.info(f"{self.name} tables loaded from '{path}'")
+            except ValueError as error:
+                logging.warning(f'{error}, so the {self.name} tables are built again')
+
+        if self.move_tables is None:
+            self.__build_tables()
+            logging.info(f"{self.name} tables built (coordinate sizes: {[len(table) for table in self.move_tables]})")
+            if path is not None:
+                try:
+                    self.__save_tables(path)
+                    logging.info(f"{self.name} tables saved to '{path}'")
+                except OSError as error:  # (e.g. a read-only directory) the tables are still used
+                    logging.warning(f"{self.name} tables could not be saved to '{path}' ({error})")
+
+        self.pruning_lookups = []
+        for pruning_table, pruning_group in zip(self.pruning_tables, self.pruning_groups):
+            # the combined coordinate is the sum of each coordinate times the product of the later coordinates' sizes
+            multipliers = [1]
+            for index in reversed(pruning_group[1:]):
+                multipliers.insert(0, multipliers[0] * len(self.move_tables[index]))
+            self.pruning_lookups.append((pruning_table, pruning_group, multipliers))
+
+    def __build_tables(self):
+        key_to_coordinates = []
+        move_tables = []
+        for coordinate_key in self.coordinate_keys:
+            key_to_coordinate, move_table = build_move_table(coordinate_key, self.moves)
+            key_to_coordinates.append(key_to_coordinate)
+            move_tables.append(move_table)
+
+        self.pruning_tables = [build_pruning_table([move_tables[index] for index in pruning_group])
+                               for pruning_group in ([] if self.bidirectional else self.pruning_groups)]
+        self.key_to_coordinates = key_to_coordinates
+        self.move_tables = move_tables
+
+    def __save_tables(self, path: str):
+        # the file holds every move table, then every coordinate's keys (in coordinate order) and then every pruning
+        # table
+        coordinate_keys = [list(key_to_coordinate) for key_to_coordinate in self.key_to_coordinates]
+        header = dict(self.get_header(), coordinate_sizes=[len(move_table) for move_table in self.move_tables],
+                      key_lengths=[len(keys[0]) for keys in coordinate_keys])
+        data = bytearray()
+        for move_table in self.move_tables:
+            data += np.array(move_table, dtype=MOVE_TABLE_DTYPE).tobytes()
+        for keys in coordinate_keys:
+            data += np.array(keys, dtype=COORDINATE_KEY_DTYPE).tobytes()
+        for pruning_table in self.pruning_tables:
+            data += pruning_table
+        TableFile(header, data).save(path)
+
+    def __read_tables(self, path: str):
+        # a file of another phase, another version or with a wrong checksum is rejected with ValueError
+        table_file = TableFile.open(path, self.get_header())
+        coordinate_sizes = table_file.header['coordinate_sizes']
+        key_lengths = table_file.header['key_lengths']
+        group_sizes = [int(np.prod([coordinate_sizes[index] for index in pruning_group]))
+                       for pruning_group in ([] if self.bidirectional else self.pruning_groups)]
+        if (len(coordinate_sizes) != len(self.coordinate_keys) or len(table_file.data) !=
+                sum(size * (len(self.moves) * MOVE_TABLE_DTYPE.itemsize + key_length * COORDINATE_KEY_DTYPE.itemsize)
+                    for size, key_length in zip(coordinate_sizes, key_lengths)) + sum(group_sizes)):
+            raise ValueError(f"'{path}' does not hold the tables its header describes")
+
+        data = memoryview(table_file.data)
+        offset = 0
+        move_tables = []
+        for size in coordinate_sizes:
+            move_table = np.frombuffer(data, dtype=MOVE_TABLE_DTYPE, count=size * len(self.moves), offset=offset)
+            move_tables.append(move_table.reshape(size, len(self.moves)).tolist())
+            offset += move_table.nbytes
+        key_to_coordinates = []
+        for size, key_length in zip(coordinate_sizes, key_lengths):
+            keys = np.frombuffer(data, dtype=COORDINATE_KEY_DTYPE, count=size * key_length, offset=offset)
+            key_to_coordinates.append({tuple(key): coordinate
+                                       for coordinate, key in enumerate(keys.reshape(size, key_length).tolist())})
+            offset += keys.nbytes
+        pruning_tables = []
+        for group_size in group_sizes:
+            pruning_tables.append(bytearray(data[offset:offset + group_size]))
+            offset += group_size
+
+        self.key_to_coordinates = key_to_coordinates
+        self.move_tables = move_tables
+        self.pruning_tables = pruning_tables
+
+    def get_coordinates(self, cubie_cube: CubieCube) -> tuple:
+        return tuple(key_to_coordinate[coordinate_key(cubie_cube)]
+                     for key_to_coordinate, coordinate_key in zip(self.key_to_coordinates, self.coordinate_keys))
+
+    def distance(self, coordinates: tuple) -> int:
+        # lower bound of the number of moves needed to solve the coordinates (the largest pruning table value)
+        distance = 0
+        for pruning_table, pruning_group, multipliers in self.pruning_lookups:
+            if len(pruning_group) == 2:  # most pruning groups pair two coordinates (calculated without a loop)
+                combined_coordinate = coordinates[pruning_group[0]] * multipliers[0] + coordinates[pruning_group[1]]
+            else:
+                combined_coordinate = sum([coordinates[index] * multiplier
+                                           for index, multiplier in zip(pruning_group, multipliers)])
+            group_distance = pruning_table[combined_coordinate]
+            if group_distance > distance:
+                distance = group_distance
+        return distance
+
+    def __depth_first_search(self, coordinates: tuple, remaining_depth: int, last_face: int,
+                             is_phase_start: bool = False):
+        # yields the search's path every time it solves the coordinates in exactly the remaining depth
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            return
+        if remaining_depth == 0:
+            if not any(coordinates):  # every coordinate is solved (0)
+                yield self.path
+            return
+
+        for move_position, face in enumerate(self.faces):
+            # a face is never turned twice in a row, and opposite faces are only turned in one order (except after
+            # the previous phase's last move, which cannot be reordered)
+            if face == last_face or (face // 2 == last_face // 2 and face < last_face and not is_phase_start):
+                continue
+
+            child_coordinates = tuple([move_table[coordinate][move_position]
+                                       for move_table, coordinate in zip(self.move_tables, coordinates)])
+            if self.distance(child_coordinates) < remaining_depth:
+                self.path.append(move_position)
+                yield from self.__depth_first_search(child_coordinates, remaining_depth - 1, face)
+                self.path.pop()
+
+    def __expand_layer(self, frontier: list, parents: dict, last_face: int = -1) -> list:
+        # returns the coordinates first reached from the frontier with one move (parents maps each of them to its
+        # parent coordinates and the move position from the parent)
+        next_frontier = []
+        for coordinates in frontier:
+            for move_position, face in enumerate(self.faces):
+                if face == last_face:
+                    continue
+
+                child_coordinates = tuple(move_table[coordinate][move_position]
+                                          for move_table, coordinate in zip(self.move_tables, coordinates))
+                if child_coordinates not in parents:
+                    parents[child_coordinates] = (coordinates, move_position)
+                    next_frontier.append(child_coordinates)
+        return next_frontier
+
+    @staticmethod
+    def __forward_path(coordinates: tuple, forward_parents: dict) -> list:
+        # the move positions from the start coordinates to the coordinates
+        path = []
+        while forward_parents[coordinates] is not None:
+            coordinates, move_position = forward_parents[coordinates]
+            path.append(move_position)
+        path.reverse()
+        return path
+
+    def __backward_path(self, coordinates: tuple, backward_parents: dict) -> list:
+        # the move positions from the coordinates to the solved coordinates (each backward move undone)
+        path = []
+        while backward_parents[coordinates] is not None:
+            coordinates, move_position = backward_parents[coordinates]
+            path.append(self.inverse_move_positions[move_position])
+        return path
+
+    def __bidirectional_search(self, coordinates: tuple, last_face: int) -> list:
+        solved_coordinates = (0,) * len(coordinates)
+        if coordinates == solved_coordinates:
+            return []
+
+        forward_parents = {coordinates: None}
+        backward_parents = {solved_coordinates: None}
+        forward_frontier = [coordinates]
+        backward_frontier = [solved_coordinates]
+
+        # expands the smaller frontier by a whole depth at a time until the two searches meet
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                # the first move must not turn the face turned just before the phase
+                forward_frontier = self.__expand_layer(forward_frontier, forward_parents,
+                                                       last_face if len(forward_parents) == 1 else -1)
+                meetings = [meeting for meeting in forward_frontier if meeting in backward_parents]
+            else:
+                backward_frontier = self.__expand_layer(backward_frontier, backward_parents)
+                meetings = [meeting for meeting in backward_frontier if meeting in forward_parents]
+
+            paths = [self.__forward_path(meeting, forward_parents) + self.__backward_path(meeting, backward_parents)
+                     for meeting in meetings]
+            paths = [path for path in paths if self.faces[path[0]] != last_face]
+            if paths:
+                return min(paths, key=len)
+
+        raise ValueError(f"{self.name}: the cube state cannot be solved with the phase's moves")
+
+    def generate_solutions(self, cubie_cube: CubieCube, last_move: int = None, max_depth: int = None,
+                           deadline: float = None):
+        """
+        yields every list of moves (move numbers) that moves the cube state into the phase's target group, shortest
+        first, up to max_depth moves. last_move is the move made just before the phase, so the phase does not start by
+        turning the same face again. the search stops once time.perf_counter() passes deadline (which can also be set
+        on self.deadline while the solutions are being generated)
+        """
+        self.load_tables()
+        self.deadline = deadline
+        coordinates = self.get_coordinates(cubie_cube)
+        last_face = -1 if last_move is None else last_move // 3
+
+        # iterative deepening, bounded by the pruning tables' lower bound
+        depth_bound = self.distance(coordinates)
+        while max_depth is None or depth_bound <= max_depth:
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                return
+            self.path = []
+            for path in self.__depth_first_search(coordinates, depth_bound, last_face, is_phase_start=True):
+                yield [self.moves[move_position] for move_position in path]
+            depth_bound += 1
+
+    def solve(self, cubie_cube: CubieCube, last_move: int = None, max_depth: int = None,
+              deadline: float = None) -> list:
+        """
+        returns the shortest list of moves (move numbers) that moves the cube state into the phase's target group, or
+        None if it needs more than max_depth moves or is not found before deadline (not used by the bidirectional
+        search)
+        """
+        if self.bidirectional:
+            self.load_tables()
+            last_face = -1 if last_move is None else last_move // 3
+            path = self.__bidirectional_search(self.get_coordinates(cubie_cube), last_face)
+            if max_depth is not None and len(path) > max_depth:
+                return None
+            return [self.moves[move_position] for move_position in path]
+
+        return next(self.generate_solutions(cubie_cube, last_move, max_depth, deadline), None)
@@ -0,0 +1,53 @@
+import numpy as np
+
+KEY_MASK = (1 << 64) - 1  # state keys are 64-bit
+BYTES_PER_SLOT = 9  # 8 byte key + 1 byte depth
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024  # 64 MiB
+
+
+class TranspositionTable:
+    """
+    fixed-size hash table of the largest remaining depth each state key has already been searched to without finding
+    a solution. a state reached again with no more remaining depth than that can be skipped.
+    when two keys share a slot, the key searched to the larger remaining depth is kept (it saves the most work)
+    """
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+        # the largest power of 2 number of slots that fits in the memory limit (so the slot is the key's low bits)
+        number_of_slots = 1 << max((memory_limit // BYTES_PER_SLOT).bit_length() - 1, 0)
+        self.slot_mask = number_of_slots - 1
+        self.keys = np.zeros(number_of_slots, dtype=np.uint64)  # element = the state key stored in the slot
+        self.depths = np.zeros(number_of_slots, dtype=np.uint8)  # element = remaining depth searched (0 = empty)
+
+        # statistics (for logging)
+        self.hits = 0  # the number of states skipped
+        self.replacements = 0  # the number of stored keys replaced by another key
+
+    def __len__(self):
+        return len(self.keys)
+
+    def was_searched(self, key: int, remaining_depth: int) -> bool:
+        slot = key & self.slot_mask
+        if self.depths[slot] >= remaining_depth and self.keys[slot] == key:
+            self.hits += 1
+            return True
+        return False
+
+    def store(self, key: int, remaining_depth: int):
+        slot = key & self.slot_mask
+        stored_depth = self.depths[slot]
+
+        # depth-preferred replacement: a different key is only replaced by one searched at least as deep
+        if stored_depth == 0 or self.keys[slot] == key:
+            if remaining_depth > stored_depth:
+                self.keys[slot] = key
+                self.depths[slot] = remaining_depth
+        elif remaining_depth >= stored_depth:
+            self.keys[slot] = key
+            self.depths[slot] = remaining_depth
+            self.replacements += 1
+
+    def clear(self):
+        self.keys.fill(0)
+        self.depths.fill(0)
+        self.hits = 0
+        self.replacements = 0
@@ -0,0 +1,64 @@
+import io
+import json
+import pytest
+from rubiks_cube_state_recognition import batch_solve
+from rubiks_cube_state_recognition.cube_state.FaceletCube import FaceletCube
+
+SOLVED_STRING = FaceletCube().to_string()
+
+
+def move_facelets(facelet_string: str, facelets: list) -> str:
+    # moves the colour of each facelet to the next facelet in the list (the last one's to the first)
+    colours = list(facelet_string)
+    for facelet, colour in zip(facelets[1:] + facelets[:1], [facelet_string[facelet] for facelet in facelets]):
+        colours[facelet] = colour
+    return ''.join(colours)
+
+
+def test_solve_file_writes_a_result_per_line_in_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # the solver's tables are saved in the working directory
+    scrambled_string = FaceletCube().turn_face('R').turn_face("U'").turn_face('F2').to_string()
+    lines = [scrambled_string,
+             '',  # empty lines are skipped
+             'not a cube state',
+             move_facelets(SOLVED_STRING, [29, 2]),  # 2 stickers of a corner swapped (no cubie has those colours)
+             move_facelets(SOLVED_STRING, [29, 2, 36]),  # a twisted corner cubie
+             SOLVED_STRING]
+    output_file = io.StringIO()
+    summary = batch_solve.solve_file(io.StringIO('\n'.join(lines) + '\n'), output_file, 'thistlethwaite', workers=1)
+    results = [json.loads(line) for line in output_file.getvalue().splitlines()]
+
+    assert [result['line'] for result in results] == [1, 3, 4, 5, 6]
+    assert summary['states'] == 5 and summary['errors'] == 3
+
+    facelet_cube = FaceletCube.from_string(scrambled_string)
+    for turn_type in results[0]['solution'].split():
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    assert facelet_cube.is_solved() and results[0]['moves'] == len(results[0]['solution'].split())
+    assert 'not 54 facelet colours' in results[1]['error']
+    assert results[2]['error'] == 'the cube state has an invalid cubie'
+    assert results[3]['error'] == 'the cube state cannot be reached by turning the faces'
+    assert results[4]['moves'] == 0
+
+
+def test_solver_errors_are_written_as_error_records(monkeypatch):
+    class FailingSolver:
+        def solve(self, cube_state):
+            raise RuntimeError('search failed')
+
+    monkeypatch.setattr(batch_solve, '_worker_solver', FailingSolver())
+    results = batch_solve._solve_chunk([(1, SOLVED_STRING), (2, 'not a cube state')])
+    assert results[0]['error'] == 'the solver failed (RuntimeError: search failed)'
+    assert 'not 54 facelet colours' in results[1]['error']
+
+
+@pytest.mark.parametrize('workers', ['0', '-2', 'two'])
+def test_the_number_of_workers_must_be_positive(workers, capsys):
+    with pytest.raises(SystemExit):
+        batch_solve.main(['states.txt', '--workers', workers])
+    assert 'argument -w/--workers' in capsys.readouterr().err
+
+    if workers != 'two':
+        with pytest.raises(ValueError):
+            batch_solve.solve_file(io.StringIO(SOLVED_STRING + '\n'), io.StringIO(), 'thistlethwaite',
+                                   workers=int(workers))
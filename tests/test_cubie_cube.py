@@ -0,0 +1,49 @@
+import pytest
+from rubiks_cube_state_recognition import batch_solve
+from rubiks_cube_state_recognition.cube_state.CubiesState import CornerCubiesState, EdgeCubiesState
+from rubiks_cube_state_recognition.cube_state.CubieCube import CORNER_FACELETS, EDGE_FACELETS, CubieCube
+from rubiks_cube_state_recognition.cube_state.FaceletCube import FaceletCube
+
+
+def swap_facelets(facelet_cube: FaceletCube, facelet_1: int, facelet_2: int) -> FaceletCube:
+    # the cube state with 2 stickers swapped (a cubie that cannot be made from any real cubie, for a corner)
+    facelets = bytearray(facelet_cube.facelets)
+    facelets[facelet_1], facelets[facelet_2] = facelets[facelet_2], facelets[facelet_1]
+    return FaceletCube(bytes(facelets))
+
+
+def scrambled_facelet_cube() -> FaceletCube:
+    facelet_cube = FaceletCube()
+    for turn_type in ['R', 'U', "F'", 'L2', 'D', "B'", 'R2', 'U2']:
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    return facelet_cube
+
+
+def test_from_facelet_cube_round_trip():
+    facelet_cube = scrambled_facelet_cube()
+    assert CubieCube.from_facelet_cube(facelet_cube).to_facelet_cube() == facelet_cube
+
+
+def test_invalid_corner_cubie_raises_key_error():
+    facelet_cube = swap_facelets(scrambled_facelet_cube(), *CORNER_FACELETS[0][:2])
+    with pytest.raises(KeyError):
+        CubieCube.from_facelet_cube(facelet_cube)
+    with pytest.raises(KeyError):
+        CornerCubiesState(facelet_cube.to_cube_state()).get_cubies()
+
+
+def test_invalid_edge_cubie_raises_key_error():
+    # an edge with the same colour twice
+    facelets = bytearray(FaceletCube().facelets)
+    facelets[EDGE_FACELETS[0][1]] = facelets[EDGE_FACELETS[0][0]]
+    facelet_cube = FaceletCube(bytes(facelets))
+    with pytest.raises(KeyError):
+        CubieCube.from_facelet_cube(facelet_cube)
+    with pytest.raises(KeyError):
+        EdgeCubiesState(facelet_cube.to_cube_state()).get_cubies()
+
+
+def test_batch_solve_reports_invalid_cubie():
+    facelet_string = swap_facelets(scrambled_facelet_cube(), *CORNER_FACELETS[0][:2]).to_string()
+    [result] = batch_solve._solve_chunk([(1, facelet_string)])
+    assert result['error'] == 'the cube state has an invalid cubie'
@@ -0,0 +1,43 @@
+import random
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPES, FaceletCube
+
+
+def scrambled_facelet_cube(seed: int = 0, length: int = 25) -> FaceletCube:
+    random.seed(seed)
+    facelet_cube = FaceletCube()
+    for turn_type in [random.choice(TURN_TYPES) for _ in range(length)]:
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    return facelet_cube
+
+
+def test_turn_permutations_match_cube_state_turns():
+    facelet_cube = scrambled_facelet_cube()
+    for turn_type in TURN_TYPES:
+        cube_state = facelet_cube.to_cube_state()
+        cube_state.turn_face(turn_type)
+        assert facelet_cube.turn_face(turn_type) == FaceletCube.from_cube_state(cube_state)
+
+
+def test_turns_repeat_back_to_the_cube_state():
+    facelet_cube = scrambled_facelet_cube()
+    for turn_type in TURN_TYPES:
+        order = 2 if turn_type.endswith('2') else 4  # the number of turns that bring the face back
+        turned_facelet_cube = facelet_cube.turn_face(turn_type)
+        assert turned_facelet_cube != facelet_cube
+        for _ in range(order - 1):
+            turned_facelet_cube = turned_facelet_cube.turn_face(turn_type)
+        assert turned_facelet_cube == facelet_cube
+
+
+def test_scramble_undone_by_its_inverse():
+    random.seed(1)
+    scramble = [random.choice(TURN_TYPES) for _ in range(25)]
+    facelet_cube = FaceletCube()
+    for turn_type in scramble:
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    assert not facelet_cube.is_solved()
+    for turn_type in reversed(scramble):
+        inverse_turn_type = turn_type if turn_type.endswith('2') else (
+            turn_type[0] if turn_type.endswith("'") else turn_type + "'")
+        facelet_cube = facelet_cube.turn_face(inverse_turn_type)
+    assert facelet_cube.is_solved()
@@ -0,0 +1,61 @@
+import itertools
+import random
+import numpy as np
+from rubiks_cube_state_recognition.pattern_database_creator.IndexCalculator import create_index_calculator
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import (
+    CORNER_CUBIES_INDEX_CALCULATOR, EDGE_CUBIES_INDEX_CALCULATOR)
+
+
+def reference_hash_index(index_calculator, cubie_positions_permutation, cubie_orientations_permutation) -> int:
+    # the ranking before the bitmask: each lehmer digit counts the smaller cubies in earlier positions directly
+    position_rank = sum(lehmer_base * (cubie - sum(earlier < cubie for earlier in cubie_positions_permutation[:index]))
+                        for index, (lehmer_base, cubie) in enumerate(zip(index_calculator.lehmer_bases,
+                                                                         cubie_positions_permutation)))
+    orientations_rank = sum(index_calculator.orientation_bases[base_power] * orientation
+                            for base_power, orientation in zip(index_calculator.orientation_base_powers,
+                                                               cubie_orientations_permutation))
+    return position_rank * index_calculator.number_of_orientations_ranks + orientations_rank
+
+
+def test_rank_unrank_is_a_bijection():
+    index_calculator = create_index_calculator(number_of_cubies=6, number_of_positions=4, number_of_orientations=3)
+    permutations = set()
+    for hash_index in range(index_calculator.number_of_hash_indexes):
+        cubie_positions_permutation, cubie_orientations_permutation = index_calculator.unrank(hash_index)
+        assert index_calculator.calculate_hash_index(cubie_positions_permutation,
+                                                     cubie_orientations_permutation) == hash_index
+        permutations.add((tuple(cubie_positions_permutation), tuple(cubie_orientations_permutation)))
+    assert len(permutations) == index_calculator.number_of_hash_indexes
+
+    # every permutation of 4 of the 6 cubies (with every orientation) has a hash index
+    assert permutations == {(cubies, orientations) for cubies in itertools.permutations(range(6), 4)
+                            for orientations in itertools.product(range(3), repeat=4)}
+
+
+def test_pattern_database_index_calculators_match_the_reference_ranking():
+    random.seed(0)
+    for index_calculator, number_of_orientations in ((CORNER_CUBIES_INDEX_CALCULATOR, 3),
+                                                     (EDGE_CUBIES_INDEX_CALCULATOR, 2)):
+        for _ in range(200):
+            cubie_positions_permutation = random.sample(range(index_calculator.number_of_cubies), 7)
+            cubie_orientations_permutation = [random.randrange(number_of_orientations) for _ in range(7)]
+            hash_index = index_calculator.calculate_hash_index(cubie_positions_permutation,
+                                                               cubie_orientations_permutation)
+            assert hash_index == reference_hash_index(index_calculator, cubie_positions_permutation,
+                                                      cubie_orientations_permutation)
+            assert 0 <= hash_index < index_calculator.number_of_hash_indexes
+            assert index_calculator.unrank(hash_index) == (cubie_positions_permutation,
+                                                           cubie_orientations_permutation)
+
+
+def test_vectorised_ranking_matches_scalar_ranking():
+    rng = np.random.default_rng(0)
+    for index_calculator in (CORNER_CUBIES_INDEX_CALCULATOR, EDGE_CUBIES_INDEX_CALCULATOR,
+                             create_index_calculator(12, 6, 2)):
+        hash_indexes = rng.integers(0, index_calculator.number_of_hash_indexes, size=500)
+        cubies, orientations = index_calculator.calculate_permutations(hash_indexes)
+        for hash_index, cubie_positions_permutation, cubie_orientations_permutation in zip(hash_indexes, cubies,
+                                                                                           orientations):
+            assert index_calculator.unrank(int(hash_index)) == (cubie_positions_permutation.tolist(),
+                                                                cubie_orientations_permutation.tolist())
+        assert np.array_equal(index_calculator.calculate_hash_indexes(cubies, orientations), hash_indexes)
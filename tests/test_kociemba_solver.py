@@ -0,0 +1,56 @@
+import random
+import time
+import pytest
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPES, FaceletCube
+from rubiks_cube_state_recognition.solution_finder.KociembaSolver import KociembaSolver
+
+
+@pytest.fixture(scope='module')
+def table_directory(tmp_path_factory):
+    return str(tmp_path_factory.mktemp('solver_tables'))
+
+
+@pytest.fixture(scope='module')
+def solver(table_directory):
+    solver = KociembaSolver(table_directory=table_directory)
+    solver.load_tables()
+    return solver
+
+
+def scramble(seed: int) -> FaceletCube:
+    random.seed(seed)
+    facelet_cube = FaceletCube()
+    for turn_type in [random.choice(TURN_TYPES) for _ in range(30)]:
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    return facelet_cube
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_solves_random_scrambles(solver, seed):
+    facelet_cube = scramble(seed)
+    solution = solver.solve(facelet_cube.to_cube_state())
+    assert len(solution) <= 30
+    for turn_type in solution:
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    assert facelet_cube.is_solved()
+
+
+def test_solves_the_solved_cube_with_no_moves(solver):
+    assert solver.solve(FaceletCube().to_cube_state()) == []
+
+
+@pytest.mark.parametrize('time_limit', [0, 0.05])
+def test_time_limit_is_honoured(solver, table_directory, time_limit):
+    # the tables are loaded from the files the solver fixture saved. a target length of 0 is never reached, so
+    # every solve runs until the time limit, and with no time to find a two-phase solution the Thistlethwaite
+    # solution is used
+    limited_solver = KociembaSolver(target_length=0, time_limit=time_limit, table_directory=table_directory)
+    limited_solver.load_tables()
+    for seed in range(5):
+        facelet_cube = scramble(seed)
+        start_time = time.perf_counter()
+        solution = limited_solver.solve(facelet_cube.to_cube_state())
+        assert time.perf_counter() - start_time < time_limit + 0.1
+        for turn_type in solution:
+            facelet_cube = facelet_cube.turn_face(turn_type)
+        assert facelet_cube.is_solved()
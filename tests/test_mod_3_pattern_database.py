@@ -0,0 +1,31 @@
+import numpy as np
+from rubiks_cube_state_recognition.pattern_database_creator.Mod3PatternDatabase import (UNKNOWN_DEPTH_MOD_3,
+                                                                                       Mod3PatternDatabase)
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import UNKNOWN_DEPTH
+
+
+def test_get_depth_decodes_from_the_parent_depth():
+    pattern_database = Mod3PatternDatabase(10)
+    for index, depth in enumerate([0, 1, 2, 3, 4, 5, 11, 12, 13]):
+        pattern_database.set_depth(index, depth)
+        for parent_depth in (depth - 1, depth, depth + 1):  # a turn changes the depth by at most 1
+            if parent_depth >= 0:
+                assert pattern_database.get_depth(index, parent_depth) == depth
+    assert pattern_database.get_depth(9, 5) == UNKNOWN_DEPTH
+
+
+def test_set_depth_only_changes_its_own_entry():
+    pattern_database = Mod3PatternDatabase(8)
+    assert pattern_database.did_add_record(5, 7)
+    assert not pattern_database.did_add_record(5, 8)  # the first (smallest) depth is kept
+    assert [pattern_database.get_depth_mod_3(index) for index in range(8)] == [UNKNOWN_DEPTH_MOD_3] * 5 + [
+        7 % 3] + [UNKNOWN_DEPTH_MOD_3] * 2
+
+
+def test_depth_bytes_round_trip():
+    depth_bytes = np.array([0, 1, 2, 3, 4, 14, UNKNOWN_DEPTH, 255, 9, 10, 11], dtype=np.uint8)
+    pattern_database = Mod3PatternDatabase.from_depth_bytes(depth_bytes.tobytes(), len(depth_bytes))
+    assert len(pattern_database.depths) == Mod3PatternDatabase.get_number_of_bytes(len(depth_bytes))
+    expected = np.where(depth_bytes < UNKNOWN_DEPTH, depth_bytes % 3, UNKNOWN_DEPTH_MOD_3)
+    assert np.array_equal(pattern_database.to_depth_bytes(), expected)
+    assert [pattern_database.get_depth_mod_3(index) for index in range(len(depth_bytes))] == expected.tolist()
@@ -0,0 +1,55 @@
+import random
+import pytest
+from rubiks_cube_state_recognition.cube_state.CubieCube import MOVE_CUBES, CubieCube
+from rubiks_cube_state_recognition.pattern_database_creator.MoveTable import (MOVE_TABLE_SUFFIX, NUMBER_OF_MOVES,
+                                                                              MoveTable)
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import (get_path,
+                                                                                         get_table_index_spaces)
+
+# the default corner cubies index space, and two small edge cubies ones
+TABLE_INDEX_SPACES = get_table_index_spaces([(0, 1, 2, 3), (5, 8, 11)])
+
+
+def hash_index(index_space: tuple, cubie_cube: CubieCube) -> int:
+    index_calculator, positions, _ = index_space
+    cubies, orientations = (cubie_cube.cp, cubie_cube.co) if index_calculator.number_of_cubies == 8 \
+        else (cubie_cube.ep, cubie_cube.eo)
+    return index_calculator.calculate_hash_index([cubies[position] for position in positions],
+                                                 [orientations[position] for position in positions])
+
+
+@pytest.mark.parametrize('table_name', TABLE_INDEX_SPACES)
+def test_child_hash_indexes_match_cubie_cube_multiplication(table_name):
+    index_space = TABLE_INDEX_SPACES[table_name]
+    move_table = MoveTable(index_space)
+
+    random.seed(0)
+    for _ in range(100):
+        cubie_cube = CubieCube()
+        for _ in range(random.randint(0, 20)):
+            cubie_cube = cubie_cube.turn(random.randrange(NUMBER_OF_MOVES))
+        for move in range(NUMBER_OF_MOVES):
+            # the move is made before the cube state's moves, as in the pattern database creator
+            assert (move_table.get_child_hash_index(hash_index(index_space, cubie_cube), move)
+                    == hash_index(index_space, MOVE_CUBES[move].multiply(cubie_cube)))
+
+
+def test_load_or_build_saves_the_move_table_once(tmp_path):
+    table_name = list(TABLE_INDEX_SPACES)[1]
+    index_space = TABLE_INDEX_SPACES[table_name]
+    built_move_table = MoveTable.load_or_build(str(tmp_path), table_name, index_space)
+    assert built_move_table.table_file is None
+
+    loaded_move_table = MoveTable.load_or_build(str(tmp_path), table_name, index_space)
+    assert loaded_move_table.table_file is not None
+    assert loaded_move_table.child_hash_indexes.tolist() == built_move_table.child_hash_indexes.tolist()
+    loaded_move_table.close()
+
+    # a move table of another index space is rejected, so it is built again
+    other_table_name = list(TABLE_INDEX_SPACES)[2]
+    with open(get_path(str(tmp_path), table_name + MOVE_TABLE_SUFFIX), 'rb') as file:
+        move_table_bytes = file.read()
+    with open(get_path(str(tmp_path), other_table_name + MOVE_TABLE_SUFFIX), 'wb') as file:
+        file.write(move_table_bytes)
+    assert MoveTable.load_or_build(str(tmp_path), other_table_name,
+                                   TABLE_INDEX_SPACES[other_table_name]).table_file is None
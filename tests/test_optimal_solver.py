@@ -0,0 +1,114 @@
+import contextlib
+import random
+import pytest
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPES, FaceletCube
+from rubiks_cube_state_recognition.pattern_database_creator import PackedPatternDatabase as packed_pattern_database
+from rubiks_cube_state_recognition.pattern_database_creator.IndexCalculator import create_index_calculator
+from rubiks_cube_state_recognition.pattern_database_creator.MoveTable import MoveTable
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import PackedPatternDatabase
+from rubiks_cube_state_recognition.pattern_database_creator.PatternDatabaseCreator import PatternDatabaseCreator
+from rubiks_cube_state_recognition.solution_finder.OptimalSolver import OptimalSolver
+
+MAX_SEARCH_DEPTH = 4  # the depth searched by brute force, from the solved cube state and from the scrambled one
+
+# small pattern databases (generated in seconds): a group of 4 corner cubie positions and 3 groups of 4 edge cubie
+# positions
+CORNER_CUBIES_INDEX_SPACE = (create_index_calculator(8, 4, 3), range(0, 4), 3)
+EDGE_GROUPS = [range(0, 4), range(4, 8), range(8, 12)]
+PATTERN_DATABASE_OPTIONS = [{}, {'mod_3': True}, {'symmetry_reduced': True}]
+
+
+def brute_force_distances(facelet_cube: FaceletCube, max_depth: int) -> dict:
+    # the number of moves between the cube state and every cube state up to max_depth moves from it (breadth first
+    # search)
+    distances = {facelet_cube: 0}
+    frontier = [facelet_cube]
+    for depth in range(1, max_depth + 1):
+        next_frontier = []
+        for facelet_cube in frontier:
+            for move in range(len(TURN_TYPES)):
+                child = facelet_cube.turn(move)
+                if child not in distances:
+                    distances[child] = depth
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return distances
+
+
+def scramble(seed: int, length: int) -> FaceletCube:
+    # random moves that do not turn a face twice in a row, and only turn opposite faces in one order (so they cannot
+    # be shortened by merging neighbouring moves)
+    random.seed(seed)
+    facelet_cube = FaceletCube()
+    last_face = -1
+    for _ in range(length):
+        move = random.choice([move for move in range(len(TURN_TYPES)) if move // 3 != last_face and
+                              not (move // 6 == last_face // 2 and move // 3 < last_face)])
+        facelet_cube = facelet_cube.turn(move)
+        last_face = move // 3
+    return facelet_cube
+
+
+@contextlib.contextmanager
+def small_corner_cubies_index_space():
+    # the corner cubies pattern databases (made or used meanwhile) are of the CORNER_CUBIES_INDEX_SPACE group
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setitem(packed_pattern_database.TABLE_INDEX_SPACES, 'corner_cubies', CORNER_CUBIES_INDEX_SPACE)
+        yield
+
+
+def assert_solves(solver: OptimalSolver, facelet_cube: FaceletCube, optimal_length: int):
+    solution = solver.solve(facelet_cube.to_cube_state())
+    assert len(solution) == optimal_length
+    for turn_type in solution:
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    assert facelet_cube.is_solved()
+
+
+@pytest.fixture(scope='module')
+def distances():
+    return brute_force_distances(FaceletCube(), MAX_SEARCH_DEPTH)
+
+
+@pytest.fixture(scope='module')
+def solver():
+    # pattern databases with no hash index reached (counted as depth 0, which is still a lower bound), so the search is
+    # checked without having to generate the pattern databases
+    with small_corner_cubies_index_space():
+        solver = OptimalSolver(edge_groups=EDGE_GROUPS)
+    index_spaces = solver.table_index_spaces.values()
+    solver.pattern_databases = [PackedPatternDatabase(index_space[0].number_of_hash_indexes)
+                                for index_space in index_spaces]
+    solver.move_tables = [MoveTable(index_space) for index_space in index_spaces]
+    return solver
+
+
+@pytest.fixture(scope='module')
+def small_pattern_database_solvers(tmp_path_factory):
+    # an optimal solver for each of the PATTERN_DATABASE_OPTIONS, using the small pattern databases
+    directory = str(tmp_path_factory.mktemp('pattern_databases'))
+    with small_corner_cubies_index_space():
+        solvers = []
+        for options in PATTERN_DATABASE_OPTIONS:
+            PatternDatabaseCreator(directory, workers=1, edge_groups=EDGE_GROUPS, **options).generate()
+            solvers.append(OptimalSolver(directory, edge_groups=EDGE_GROUPS, **options))
+            solvers[-1].load_tables()
+        yield solvers
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_solutions_are_optimal(solver, distances, seed):
+    random.seed(seed)
+    facelet_cube = scramble(seed, random.randint(1, 3))
+    assert_solves(solver, facelet_cube, distances[facelet_cube])
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_solutions_with_pattern_databases_are_optimal(small_pattern_database_solvers, distances, seed):
+    facelet_cube = scramble(seed, 2 * MAX_SEARCH_DEPTH)
+    # meets in the middle, so cube states up to 2 x MAX_SEARCH_DEPTH moves from solved have their exact distance
+    optimal_length = min(depth + distances[middle_facelet_cube] for middle_facelet_cube, depth
+                         in brute_force_distances(facelet_cube, MAX_SEARCH_DEPTH).items()
+                         if middle_facelet_cube in distances)
+    for solver in small_pattern_database_solvers:
+        assert_solves(solver, facelet_cube, optimal_length)
@@ -0,0 +1,112 @@
+import random
+import pytest
+from rubiks_cube_state_recognition.cube_state.CubieCube import CubieCube
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPES
+from rubiks_cube_state_recognition.pattern_database_creator.PackedPatternDatabase import (
+    PackedPatternDatabase, get_index_scheme, get_path, get_table_index_spaces)
+from rubiks_cube_state_recognition.pattern_database_creator.PatternDatabaseCreator import PatternDatabaseCreator
+from rubiks_cube_state_recognition.pattern_database_creator.SymmetryReduction import (SYMMETRY_REDUCED_SUFFIX,
+                                                                                      SymmetryReduction)
+
+# small groups of edge cubie positions, whose pattern databases are generated in well under a second
+EDGE_GROUPS = [(0, 1, 2), (0, 1, 2, 3)]  # 3 edge cubies, and the 4 of the blue face
+TABLE_NAMES = list(get_table_index_spaces(EDGE_GROUPS))[1:]  # the edge cubies pattern databases only
+
+
+def generate(directory, **options) -> dict:
+    return PatternDatabaseCreator(str(directory), workers=1, table_names=TABLE_NAMES, edge_groups=EDGE_GROUPS,
+                                  **options).generate()
+
+
+def read_table(directory, table_name: str) -> bytes:
+    with open(get_path(str(directory), table_name), 'rb') as file:
+        return file.read()
+
+
+def brute_force_depth_counts(positions: tuple) -> list:
+    # the number of placements (positions and orientations) of the edge cubies solved in the positions at each number
+    # of moves from solved, by a breadth first search over cube states (one cube state kept per placement)
+    def placement(cubie_cube: CubieCube) -> tuple:
+        return tuple((cubie_cube.ep.index(cubie), cubie_cube.eo[cubie_cube.ep.index(cubie)]) for cubie in positions)
+
+    placements = {placement(CubieCube())}
+    frontier = [CubieCube()]
+    depth_counts = [1]
+    while frontier:
+        next_frontier = []
+        for cubie_cube in frontier:
+            for move in range(len(TURN_TYPES)):
+                child = cubie_cube.turn(move)
+                if placement(child) not in placements:
+                    placements.add(placement(child))
+                    next_frontier.append(child)
+        frontier = next_frontier
+        depth_counts.append(len(frontier))
+    return depth_counts[:-1]
+
+
+def test_depth_counts_match_a_brute_force_search(tmp_path):
+    summary = generate(tmp_path)
+    assert summary[TABLE_NAMES[0]]['depth_counts'] == brute_force_depth_counts(EDGE_GROUPS[0])
+    for table_name in TABLE_NAMES:
+        assert summary[table_name]['fill_ratio'] == 1  # every placement of the edge cubies can be reached
+
+
+def test_parallel_generation_gives_the_same_tables(tmp_path):
+    generate(tmp_path / 'serial')
+    PatternDatabaseCreator(str(tmp_path / 'parallel'), workers=2, table_names=TABLE_NAMES,
+                           edge_groups=EDGE_GROUPS).generate()
+    for table_name in TABLE_NAMES:
+        assert read_table(tmp_path / 'parallel', table_name) == read_table(tmp_path / 'serial', table_name)
+
+
+def test_resuming_from_a_checkpoint_gives_the_same_tables(tmp_path, monkeypatch):
+    generate(tmp_path / 'uninterrupted')
+
+    # interrupts the generation once the depth 3 checkpoint is saved
+    save_checkpoint = PatternDatabaseCreator._PatternDatabaseCreator__save_checkpoint
+
+    def interrupted_save_checkpoint(creator, table_name, depth_table, depth_counts):
+        save_checkpoint(creator, table_name, depth_table, depth_counts)
+        if len(depth_counts) == 4:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(PatternDatabaseCreator, '_PatternDatabaseCreator__save_checkpoint',
+                        interrupted_save_checkpoint)
+    with pytest.raises(KeyboardInterrupt):
+        generate(tmp_path / 'resumed')
+    monkeypatch.undo()
+
+    summary = generate(tmp_path / 'resumed', resume=True)
+    uninterrupted_summary = generate(tmp_path / 'uninterrupted')
+    for table_name in TABLE_NAMES:
+        assert read_table(tmp_path / 'resumed', table_name) == read_table(tmp_path / 'uninterrupted', table_name)
+        assert summary[table_name]['depth_counts'] == uninterrupted_summary[table_name]['depth_counts']
+
+
+def test_symmetry_reduced_lookups_equal_the_full_lookups(tmp_path):
+    generate(tmp_path)
+    generate(tmp_path, symmetry_reduced=True)
+    table_index_spaces = get_table_index_spaces(EDGE_GROUPS)
+
+    random.seed(0)
+    for table_name in TABLE_NAMES:
+        index_calculator, positions, number_of_orientations = table_index_spaces[table_name]
+        symmetry_reduction = SymmetryReduction(index_calculator, positions, number_of_orientations)
+        full_pattern_database = PackedPatternDatabase.load(
+            get_path(str(tmp_path), table_name), index_calculator.number_of_hash_indexes,
+            get_index_scheme(table_index_spaces[table_name]))
+        reduced_pattern_database = PackedPatternDatabase.load(
+            get_path(str(tmp_path), table_name + SYMMETRY_REDUCED_SUFFIX), symmetry_reduction.size,
+            get_index_scheme(table_index_spaces[table_name], symmetry_reduced=True))
+        assert symmetry_reduction.size < index_calculator.number_of_hash_indexes
+
+        for _ in range(200):
+            cubie_cube = CubieCube()
+            for _ in range(random.randint(0, 12)):
+                cubie_cube = cubie_cube.turn(random.randrange(len(TURN_TYPES)))
+            hash_index = index_calculator.calculate_hash_index([cubie_cube.ep[position] for position in positions],
+                                                               [cubie_cube.eo[position] for position in positions])
+            reduced_hash_index = symmetry_reduction.reduce_hash_index(hash_index, cubie_cube.ep, cubie_cube.eo)
+            assert (reduced_pattern_database.get_depth(reduced_hash_index)
+                    == full_pattern_database.get_depth(hash_index))
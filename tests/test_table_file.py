@@ -0,0 +1,71 @@
+import struct
+import pytest
+from rubiks_cube_state_recognition.pattern_database_creator.TableFile import (DATA_ALIGNMENT, PREFIX_FORMAT,
+                                                                              TABLE_FILE_MAGIC, TableFile)
+
+HEADER = {'kind': 'pattern_database', 'cubies': 'corner', 'entry_bits': 4, 'size': 6}
+DATA = bytes(range(3)) * 1000
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / 'table.bin')
+    TableFile(HEADER, DATA).save(path)
+    return path
+
+
+def data_offset(path: str) -> int:
+    with open(path, 'rb') as file:
+        _, _, header_length = struct.unpack(PREFIX_FORMAT, file.read(struct.calcsize(PREFIX_FORMAT)))
+    return struct.calcsize(PREFIX_FORMAT) + header_length
+
+
+def test_save_and_open(path):
+    assert data_offset(path) % DATA_ALIGNMENT == 0
+    table_file = TableFile.open(path, HEADER)
+    assert bytes(table_file.data) == DATA
+    assert table_file.header['data_length'] == len(DATA)
+
+    table_file = TableFile.open(path, HEADER, memory_map=True)
+    assert bytes(table_file.data) == DATA
+    table_file.close()
+
+
+def test_rejects_a_file_without_the_header(tmp_path):
+    path = str(tmp_path / 'old_table.bin')
+    with open(path, 'wb') as file:
+        file.write(DATA)
+    with pytest.raises(ValueError, match='not a table file'):
+        TableFile.open(path, HEADER)
+
+
+def test_rejects_another_version(path):
+    with open(path, 'r+b') as file:
+        file.seek(len(TABLE_FILE_MAGIC))
+        file.write(struct.pack('<I', 0))
+    with pytest.raises(ValueError, match='version 0'):
+        TableFile.open(path, HEADER)
+
+
+def test_rejects_an_unexpected_header_field(path):
+    with pytest.raises(ValueError, match='entry_bits 4 instead of 2'):
+        TableFile.open(path, dict(HEADER, entry_bits=2))
+
+
+def test_rejects_an_incomplete_file(path):
+    with open(path, 'r+b') as file:
+        file.truncate(data_offset(path) + len(DATA) - 1)
+    with pytest.raises(ValueError, match='incomplete'):
+        TableFile.open(path, HEADER)
+
+
+def test_rejects_corrupt_data(path):
+    with open(path, 'r+b') as file:
+        file.seek(data_offset(path) + 10)
+        file.write(b'\xff')
+    with pytest.raises(ValueError, match='checksum'):
+        TableFile.open(path, HEADER)
+    # the checksum is only verified for a memory mapped file when asked for
+    TableFile.open(path, HEADER, memory_map=True).close()
+    with pytest.raises(ValueError, match='checksum'):
+        TableFile.open(path, HEADER, memory_map=True, verify_checksum=True)
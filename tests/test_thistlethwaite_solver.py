@@ -0,0 +1,114 @@
+import os
+import random
+import pytest
+from rubiks_cube_state_recognition.cube_state.CubieCube import CubieCube
+from rubiks_cube_state_recognition.cube_state.FaceletCube import TURN_TYPES, TURN_TYPE_TO_MOVE, FaceletCube
+from rubiks_cube_state_recognition.solution_finder.SearchPhase import SearchPhase
+from rubiks_cube_state_recognition.solution_finder.ThistlethwaiteSolver import G3_TURN_TYPES, ThistlethwaiteSolver
+
+
+@pytest.fixture(scope='module')
+def table_directory(tmp_path_factory):
+    return str(tmp_path_factory.mktemp('solver_tables'))
+
+
+@pytest.fixture(scope='module')
+def solver(table_directory):
+    solver = ThistlethwaiteSolver(table_directory=table_directory)
+    solver.load_tables()
+    return solver
+
+
+def scramble(turn_types: list, length: int, seed: int) -> FaceletCube:
+    random.seed(seed)
+    facelet_cube = FaceletCube()
+    for turn_type in [random.choice(turn_types) for _ in range(length)]:
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    return facelet_cube
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_solves_random_scrambles(solver, seed):
+    facelet_cube = scramble(TURN_TYPES, 30, seed)
+    for turn_type in solver.solve(facelet_cube.to_cube_state()):
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    assert facelet_cube.is_solved()
+
+
+def test_solves_the_solved_cube_with_no_moves(solver):
+    assert solver.solve(FaceletCube().to_cube_state()) == []
+
+
+def test_phase_solutions_are_the_shortest(solver):
+    last_phase = solver.phases[-1]
+    for seed in range(10):
+        random.seed(seed)
+        moves = [TURN_TYPE_TO_MOVE[random.choice(G3_TURN_TYPES)] for _ in range(4)]
+        cubie_cube = CubieCube()
+        for move in moves:
+            cubie_cube = cubie_cube.turn(move)
+        assert len(last_phase.solve(cubie_cube)) <= len(moves)
+
+
+def test_phase_can_start_with_the_face_opposite_the_last_move(solver):
+    # the previous phase's last move cannot be reordered, so only its own face is skipped at the start of a phase
+    cubie_cube = CubieCube().turn(TURN_TYPE_TO_MOVE['U2'])
+    assert solver.phases[-1].solve(cubie_cube, last_move=TURN_TYPE_TO_MOVE['D2']) == [TURN_TYPE_TO_MOVE['U2']]
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_bidirectional_phases_are_as_short_as_ida_star(solver, table_directory, seed):
+    bidirectional_solver = ThistlethwaiteSolver(bidirectional=True, table_directory=table_directory)
+    cubie_cube = CubieCube.from_cube_state(scramble(TURN_TYPES, 30, seed).to_cube_state())
+    last_move = None
+    for phase, bidirectional_phase in zip(solver.phases, bidirectional_solver.phases):
+        phase_moves = phase.solve(cubie_cube, last_move=last_move)
+        assert len(bidirectional_phase.solve(cubie_cube, last_move=last_move)) == len(phase_moves)
+        for move in phase_moves:
+            cubie_cube = cubie_cube.turn(move)
+        last_move = phase_moves[-1] if phase_moves else last_move
+
+    facelet_cube = scramble(TURN_TYPES, 30, seed)
+    for turn_type in bidirectional_solver.solve(facelet_cube.to_cube_state()):
+        facelet_cube = facelet_cube.turn_face(turn_type)
+    assert facelet_cube.is_solved()
+
+
+def test_loaded_tables_equal_the_built_tables(solver, table_directory):
+    loaded_solver = ThistlethwaiteSolver(table_directory=table_directory)
+    loaded_solver.load_tables()
+    for phase, loaded_phase in zip(solver.phases, loaded_solver.phases):
+        assert os.path.exists(phase.get_table_path())
+        assert loaded_phase.move_tables == phase.move_tables
+        assert loaded_phase.pruning_tables == phase.pruning_tables
+        assert [list(key_to_coordinate.items()) for key_to_coordinate in loaded_phase.key_to_coordinates] == \
+            [list(key_to_coordinate.items()) for key_to_coordinate in phase.key_to_coordinates]
+
+    facelet_cube = scramble(TURN_TYPES, 30, 0)
+    assert loaded_solver.solve(facelet_cube.to_cube_state()) == solver.solve(facelet_cube.to_cube_state())
+
+
+def test_stale_and_corrupt_tables_are_built_again(solver, tmp_path):
+    phase = solver.phases[-1]
+    with open(phase.get_table_path(), 'rb') as file:
+        table_bytes = file.read()
+
+    # the tables of another phase (the header names other moves and coordinates)
+    other_phase = SearchPhase('other', G3_TURN_TYPES[:-1], phase.coordinate_keys, table_name='other',
+                              table_directory=str(tmp_path))
+    with open(other_phase.get_table_path(), 'wb') as file:
+        file.write(table_bytes)
+    other_phase.load_tables()
+    assert len(other_phase.move_tables[0][0]) == len(G3_TURN_TYPES) - 1
+
+    # the same phase's tables with a changed byte (found by the checksum)
+    corrupt_phase = SearchPhase(phase.name, G3_TURN_TYPES, phase.coordinate_keys, table_name='corrupt',
+                                table_directory=str(tmp_path))
+    with open(corrupt_phase.get_table_path(), 'wb') as file:
+        file.write(table_bytes[:-1] + bytes([table_bytes[-1] ^ 1]))
+    corrupt_phase.load_tables()
+    assert corrupt_phase.pruning_tables == phase.pruning_tables
+
+    # the rebuilt tables replace the stale file
+    with open(corrupt_phase.get_table_path(), 'rb') as file:
+        assert file.read() == table_bytes
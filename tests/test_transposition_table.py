@@ -0,0 +1,49 @@
+from rubiks_cube_state_recognition.solution_finder.TranspositionTable import BYTES_PER_SLOT, TranspositionTable
+
+
+def test_number_of_slots_fits_the_memory_limit():
+    for memory_limit in (BYTES_PER_SLOT, 1000, 64 * 1024, 10 ** 6):
+        transposition_table = TranspositionTable(memory_limit)
+        number_of_slots = len(transposition_table)
+        assert number_of_slots & (number_of_slots - 1) == 0  # a power of 2
+        assert number_of_slots * BYTES_PER_SLOT <= memory_limit < 2 * number_of_slots * BYTES_PER_SLOT
+    assert len(TranspositionTable(0)) == 1
+
+
+def test_was_searched_to_at_least_the_remaining_depth():
+    transposition_table = TranspositionTable(1000)
+    assert not transposition_table.was_searched(5, 1)
+    transposition_table.store(5, 3)
+    assert transposition_table.was_searched(5, 3)
+    assert transposition_table.was_searched(5, 2)
+    assert not transposition_table.was_searched(5, 4)
+    assert transposition_table.hits == 2
+
+    # a shallower search of the same key does not lower its depth
+    transposition_table.store(5, 1)
+    assert transposition_table.was_searched(5, 3)
+
+
+def test_depth_preferred_replacement():
+    transposition_table = TranspositionTable(1000)
+    colliding_key = 5 + len(transposition_table)  # the same slot as key 5
+    transposition_table.store(5, 3)
+
+    transposition_table.store(colliding_key, 2)  # searched less deeply, so key 5 is kept
+    assert transposition_table.was_searched(5, 3)
+    assert not transposition_table.was_searched(colliding_key, 2)
+    assert transposition_table.replacements == 0
+
+    transposition_table.store(colliding_key, 3)  # searched at least as deeply, so it replaces key 5
+    assert transposition_table.was_searched(colliding_key, 3)
+    assert not transposition_table.was_searched(5, 1)
+    assert transposition_table.replacements == 1
+
+
+def test_clear():
+    transposition_table = TranspositionTable(1000)
+    transposition_table.store(5, 3)
+    transposition_table.was_searched(5, 3)
+    transposition_table.clear()
+    assert not transposition_table.was_searched(5, 1)
+    assert transposition_table.hits == transposition_table.replacements == 0